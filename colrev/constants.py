@@ -20,6 +20,7 @@ class Filepaths:
     REGISTRY_FILE = LOCAL_ENVIRONMENT_DIR.joinpath(Path("registry.json"))
 
     PREP_REQUESTS_CACHE_FILE = LOCAL_ENVIRONMENT_DIR / Path("prep_requests_cache")
+    PREP_CACHE_FILE = LOCAL_ENVIRONMENT_DIR / Path("prep_cache.db")
 
 
 class FileSets:
@@ -188,6 +189,7 @@ class LocalIndexFields:
     ID = "id"
     CITATION_KEY = "citation_key"
     BIBTEX = "bibtex"
+    RECORD_JSON = "record_json"
     TEI = "tei"
     DBLP_KEY = "dblp_key"
     TOC_KEY = "toc_key"
@@ -2,10 +2,14 @@
 """Functionality for data/records.bib and git repository."""
 from __future__ import annotations
 
+import hashlib
+import json
 import os
-import tempfile
+import pickle  # nosec
+import re
 import time
 import typing
+from importlib.metadata import version
 from pathlib import Path
 from random import randint
 
@@ -21,6 +25,7 @@ import colrev.process.operation
 import colrev.record.record
 import colrev.record.record_id_setter
 import colrev.record.record_prep
+import colrev.writer.bib
 from colrev.constants import ExitCodes
 from colrev.constants import Fields
 from colrev.constants import FileSets
@@ -29,6 +34,10 @@ from colrev.writer.write_utils import to_string
 
 # pylint: disable=too-many-public-methods
 
+_RECORD_HEADER_RE = re.compile(rb"^@[^{\n]*\{([^\n]*),", re.M)
+_STATUS_RE = re.compile(rb"\n\s*colrev_status\s*=\s*\{([^}]*)\}")
+_ORIGIN_RE = re.compile(rb"\n\s*colrev_origin\s*=\s*\{([^}]*)\}")
+
 
 class Dataset:
     """The CoLRev dataset (records and their history in git)"""
@@ -37,6 +46,11 @@ class Dataset:
 
     def __init__(self, *, review_manager: colrev.review_manager.ReviewManager) -> None:
         self.review_manager = review_manager
+        # (blob sha of the records file, pickled records)
+        self._records_cache: typing.Tuple[str, bytes] = ("", b"")
+        # (blob sha of the records file, records index)
+        self._records_index: typing.Tuple[str, dict] = ("", {})
+        self._records_index_saved = True
 
         try:
             # In most cases, the repo should exist
@@ -81,23 +95,12 @@ class Dataset:
         """
 
         current_origin_states_dict = {}
-        if records_string != "":
-            with tempfile.NamedTemporaryFile(
-                mode="wb", delete=False, suffix=".bib"
-            ) as temp_file:
-                temp_file.write(records_string.encode("utf-8"))
-                temp_file_path = Path(temp_file.name)
-            bib_loader = colrev.loader.bib.BIBLoader(
-                filename=temp_file_path,
-                logger=self.review_manager.logger,
-                unique_id_field="ID",
-            )
-        else:
-            bib_loader = colrev.loader.bib.BIBLoader(
-                filename=self.review_manager.paths.records,
-                logger=self.review_manager.logger,
-                unique_id_field="ID",
-            )
+        bib_loader = colrev.loader.bib.BIBLoader(
+            filename=self.review_manager.paths.records,
+            logger=self.review_manager.logger,
+            unique_id_field="ID",
+            source=records_string if records_string != "" else None,
+        )
         for record_header_item in bib_loader.get_record_header_items().values():
             for origin in record_header_item[Fields.ORIGIN]:
                 current_origin_states_dict[origin] = record_header_item[Fields.STATUS]
@@ -123,7 +126,9 @@ class Dataset:
         )
         return committed_origin_state_dict
 
-    def load_records_from_history(self, commit_sha: str = "") -> typing.Iterator[dict]:
+    def load_records_from_history(
+        self, commit_sha: str = "", *, header_only: bool = False
+    ) -> typing.Iterator[dict]:
         """
         Iterates through Git history, yielding records file contents as dictionaries.
 
@@ -134,6 +139,8 @@ class Dataset:
         Parameters:
             commit_sha (str, optional): Start iteration from this commit SHA.
             Defaults to beginning of Git history if not provided.
+            header_only (bool, optional): Parse the record header items only
+            (see load_records_dict()).
 
         Yields:
             dict: Records file contents at a specific Git history point, as a dictionary.
@@ -156,11 +163,19 @@ class Dataset:
                 current_commit.tree / self.review_manager.paths.RECORDS_FILE_GIT
             ).data_stream.read()
 
-            records_dict = colrev.loader.load_utils.loads(
-                load_string=filecontents.decode("utf-8", "replace"),
-                implementation="bib",
-                logger=self.review_manager.logger,
-            )
+            if header_only:
+                records_dict = colrev.loader.bib.BIBLoader(
+                    filename=self.review_manager.paths.records,
+                    logger=self.review_manager.logger,
+                    unique_id_field="ID",
+                    source=filecontents.decode("utf-8", "replace"),
+                ).get_record_header_items()
+            else:
+                records_dict = colrev.loader.load_utils.loads(
+                    load_string=filecontents.decode("utf-8", "replace"),
+                    implementation="bib",
+                    logger=self.review_manager.logger,
+                )
             if records_dict:
                 yield records_dict
 
@@ -196,100 +211,373 @@ class Dataset:
             return bib_loader.get_record_header_items()
 
         if self.review_manager.paths.records.is_file():
+            records_blob_sha = self._get_blob_sha(
+                self.review_manager.paths.records.read_bytes()
+            )
+            cached_records = self._load_records_cache(records_blob_sha)
+            if cached_records is not None:
+                # Note : unpickling returns a new copy of the records
+                return pickle.loads(cached_records)  # nosec
 
             records_dict = colrev.loader.load_utils.load(
                 filename=self.review_manager.paths.records,
                 logger=self.review_manager.logger,
                 unique_id_field="ID",
             )
+            self._save_records_cache(records_blob_sha, records_dict)
 
         else:
             records_dict = {}
 
         return records_dict
 
+    @staticmethod
+    def _get_blob_sha(content: bytes) -> str:
+        """Get the git blob sha of the records file (the key of the records cache)"""
+        blob_sha = hashlib.sha1(  # nosec
+            b"blob %d\0" % len(content), usedforsecurity=False
+        )
+        blob_sha.update(content)
+        return blob_sha.hexdigest()
+
+    def _load_records_cache(self, records_blob_sha: str) -> typing.Optional[bytes]:
+        """Get the pickled records if the cache corresponds to the records file"""
+        if self._records_cache[0] == records_blob_sha:
+            return self._records_cache[1]
+
+        cache_file = self.review_manager.paths.records_cache
+        if not cache_file.is_file():
+            return None
+        try:
+            with open(cache_file, "rb") as file:
+                cache_key = pickle.load(file)  # nosec
+                if cache_key != {
+                    "blob_sha": records_blob_sha,
+                    "colrev_version": version("colrev"),
+                }:
+                    return None
+                cached_records = file.read()
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+        self._records_cache = (records_blob_sha, cached_records)
+        return cached_records
+
+    def _save_records_cache(self, records_blob_sha: str, records: dict) -> None:
+        """Save the records to the cache (.colrev/records_cache.pickle)"""
+        cached_records = pickle.dumps(records, protocol=pickle.HIGHEST_PROTOCOL)
+        self._records_cache = (records_blob_sha, cached_records)
+
+        cache_file = self.review_manager.paths.records_cache
+        try:
+            cache_file.parent.mkdir(exist_ok=True)
+            temp_cache_file = cache_file.with_suffix(".tmp")
+            with open(temp_cache_file, "wb") as file:
+                pickle.dump(
+                    {"blob_sha": records_blob_sha, "colrev_version": version("colrev")},
+                    file,
+                )
+                file.write(cached_records)
+            os.replace(temp_cache_file, cache_file)
+        except OSError:  # pragma: no cover
+            self.review_manager.logger.debug("Could not save the records cache")
+
     def save_records_dict_to_file(self, records: dict) -> None:
         """Save the records dict"""
         # Note : this classmethod function can be called by CoLRev scripts
         # operating outside a CoLRev repo (e.g., sync)
 
-        bibtex_str = to_string(records_dict=records, implementation="bib")
-
         with open(self.review_manager.paths.records, "w", encoding="utf-8") as out:
-            out.write(bibtex_str + "\n")
+            colrev.writer.bib.write_records(records_dict=records, file=out)
+            out.write("\n")
 
+        # Note : the records index is rebuilt when it is read
+        self._records_index = ("", {})
         self._add_record_changes()
 
-    def _save_record_list_by_id(self, records: dict) -> None:
+    @staticmethod
+    def _get_record_string(record_id: str, record_dict: dict) -> str:
+        # Note : like in save_records_dict_to_file(), records are separated by an empty line
+        return (
+            to_string(records_dict={record_id: record_dict}, implementation="bib")
+            + "\n"
+        )
 
-        parsed = to_string(records_dict=records, implementation="bib")
-        record_list = [
-            {
-                Fields.ID: item[item.find("{") + 1 : item.find(",")],
-                "record": "@" + item + "\n",
-            }
-            for item in parsed.split("\n@")
+    @staticmethod
+    def _get_record_spans(content: bytes) -> typing.List[typing.Tuple[str, int, int]]:
+        """Get the (ID, start, end) byte offsets of the records in the records file
+
+        Each record extends to the start of the next record."""
+        record_starts = [
+            (match.group(1).decode("utf-8").strip(), match.start())
+            for match in _RECORD_HEADER_RE.finditer(content)
+        ]
+        record_ends = [start for _, start in record_starts[1:]] + [len(content)]
+        return [
+            (record_id, start, end)
+            for (record_id, start), end in zip(record_starts, record_ends)
+        ]
+
+    @classmethod
+    def _split_records_file(cls, content: bytes) -> typing.Tuple[str, list]:
+        """Split the records file into the prefix and a list of (ID, record string)"""
+        content = content.replace(b"\r\n", b"\n")
+        record_spans = cls._get_record_spans(content)
+        prefix_end = record_spans[0][1] if record_spans else len(content)
+        record_chunks = [
+            (record_id, content[start:end].decode("utf-8"))
+            for record_id, start, end in record_spans
         ]
-        # Correct the first item
-        record_list[0]["record"] = "@" + record_list[0]["record"][2:]
+        return content[:prefix_end].decode("utf-8"), record_chunks
+
+    def _write_records_file(
+        self, prefix: str, record_chunks: list, *, previous_blob_sha: str
+    ) -> None:
+        """Write the records file and update the records index
+
+        The record_chunks are (ID, record string, changed) tuples.
+        Only the changed records are scanned for the indexed fields."""
+
+        previous_index = self._load_records_index(previous_blob_sha) or {}
+        records_index = {}
+        # Note : like a file opened in text mode, use the os line separator
+        content_parts = [prefix.replace("\n", os.linesep).encode("utf-8")]
+        offset = len(content_parts[0])
+        for record_id, record_string, changed in record_chunks:
+            record_bytes = record_string.replace("\n", os.linesep).encode("utf-8")
+            if changed or record_id not in previous_index:
+                index_item = self._get_index_fields(record_bytes)
+            else:
+                index_item = {
+                    Fields.STATUS: previous_index[record_id][Fields.STATUS],
+                    Fields.ORIGIN: previous_index[record_id][Fields.ORIGIN],
+                }
+            index_item.update(offset=offset, length=len(record_bytes))
+            records_index[record_id] = index_item
+            content_parts.append(record_bytes)
+            offset += len(record_bytes)
+
+        content = b"".join(content_parts)
+        with open(self.review_manager.paths.records, "wb") as out:
+            out.write(content)
+        self._records_index = (self._get_blob_sha(content), records_index)
+        self._records_index_saved = False
+
+    def _save_changed_records(self, records: dict) -> bool:
+        """Save the records dict by serializing only the records that changed
+        since the records file was loaded (based on the records cache).
+
+        Returns False if the records file has to be rewritten completely."""
+
+        if not records or not self.review_manager.paths.records.is_file():
+            return False
+        content = self.review_manager.paths.records.read_bytes()
+        blob_sha = self._get_blob_sha(content)
+        if blob_sha != self._records_cache[0]:
+            return False
 
-        current_id_str = "NOTSET"
+        prefix, record_chunks = self._split_records_file(content)
+        loaded_records = pickle.loads(self._records_cache[1])  # nosec
+        if prefix or [record_id for record_id, _ in record_chunks] != sorted(
+            loaded_records
+        ):
+            return False
+        record_strings = dict(record_chunks)
+
+        updated_chunks = []
+        for record_id in sorted(records):
+            if records[record_id] == loaded_records.get(record_id, None):
+                updated_chunks.append((record_id, record_strings[record_id], False))
+            else:
+                updated_chunks.append(
+                    (
+                        record_id,
+                        self._get_record_string(record_id, records[record_id]),
+                        True,
+                    )
+                )
+        self._write_records_file("", updated_chunks, previous_blob_sha=blob_sha)
+        return True
+
+    def _save_record_list_by_id(self, records: dict) -> None:
+
+        prefix, blob_sha = "", ""
+        record_chunks: typing.List[typing.Tuple[str, str]] = []
         if self.review_manager.paths.records.is_file():
-            with open(self.review_manager.paths.records, "r+b") as file:
-                seekpos = file.tell()
-                line = file.readline()
-                while line:
-                    if b"@" in line[:3]:
-                        current_id = line[line.find(b"{") + 1 : line.rfind(b",")]
-                        current_id_str = current_id.decode("utf-8")
-                    if current_id_str in [x[Fields.ID] for x in record_list]:
-                        replacement = [
-                            x["record"]
-                            for x in record_list
-                            if x[Fields.ID] == current_id_str
-                        ][0]
-                        record_list = [
-                            x for x in record_list if x[Fields.ID] != current_id_str
-                        ]
-                        line = file.readline()
-                        while (
-                            b"@" not in line[:3] and line
-                        ):  # replace: drop the current record
-                            line = file.readline()
-                        remaining = line + file.read()
-                        file.seek(seekpos)
-                        file.write(replacement.encode("utf-8"))
-                        seekpos = file.tell()
-                        file.flush()
-                        os.fsync(file)
-                        file.write(remaining)
-                        file.truncate()  # if the replacement is shorter...
-                        file.seek(seekpos)
-
-                    seekpos = file.tell()
-                    line = file.readline()
-
-        if len(record_list) > 0:
-            with open(
-                self.review_manager.paths.records, "a", encoding="utf8"
-            ) as m_refs:
-                for item in record_list:
-                    m_refs.write(item["record"])
+            content = self.review_manager.paths.records.read_bytes()
+            blob_sha = self._get_blob_sha(content)
+            prefix, record_chunks = self._split_records_file(content)
 
+        record_strings = {
+            record_id: self._get_record_string(record_id, records[record_id])
+            for record_id in sorted(records)
+        }
+        updated_chunks = [
+            (
+                (record_id, record_strings.pop(record_id), True)
+                if record_id in record_strings
+                else (record_id, record_string, False)
+            )
+            for record_id, record_string in record_chunks
+        ]
+        # Records that are not in the records file are appended
+        updated_chunks += [
+            (record_id, record_string, True)
+            for record_id, record_string in record_strings.items()
+        ]
+        self._write_records_file(prefix, updated_chunks, previous_blob_sha=blob_sha)
         self._add_record_changes()
 
     def save_records_dict(self, records: dict, *, partial: bool = False) -> None:
-        """Save the records dict in RECORDS_FILE"""
+        """Save the records dict in RECORDS_FILE
+
+        Only the records that changed since the last load are serialized.
+        With partial=True, the records replace (or are appended to) the
+        records in the RECORDS_FILE."""
 
         if partial:
             self._save_record_list_by_id(records)
             return
+        if self._save_changed_records(records):
+            self._add_record_changes()
+            return
         self.save_records_dict_to_file(records)
 
+    @staticmethod
+    def _get_index_fields(record_bytes: bytes) -> dict:
+        """Get the status and origin of a record (for the records index)"""
+        status_match = _STATUS_RE.search(record_bytes)
+        origin_match = _ORIGIN_RE.search(record_bytes)
+        return {
+            Fields.STATUS: (
+                status_match.group(1).decode("utf-8") if status_match else ""
+            ),
+            Fields.ORIGIN: (
+                [
+                    origin.strip()
+                    for origin in origin_match.group(1).decode("utf-8").split(";")
+                    if origin.strip()
+                ]
+                if origin_match
+                else []
+            ),
+        }
+
+    @classmethod
+    def _build_records_index(cls, content: bytes) -> dict:
+        records_index = {}
+        for record_id, start, end in cls._get_record_spans(content):
+            records_index[record_id] = {
+                "offset": start,
+                "length": end - start,
+                **cls._get_index_fields(content[start:end]),
+            }
+        return records_index
+
+    def _save_records_index(self) -> None:
+        """Save the index of the records file (.colrev/records_index.json)"""
+        blob_sha, records_index = self._records_index
+        index_file = self.review_manager.paths.records_index
+        try:
+            index_file.parent.mkdir(exist_ok=True)
+            with open(index_file, "w", encoding="utf-8") as file:
+                json.dump({"blob_sha": blob_sha, "records": records_index}, file)
+        except OSError:  # pragma: no cover
+            self.review_manager.logger.debug("Could not save the records index")
+        self._records_index_saved = True
+
+    def _load_records_index(self, blob_sha: str) -> typing.Optional[dict]:
+        """Get the records index if it corresponds to the records file"""
+        if not blob_sha:
+            return None
+        if self._records_index[0] == blob_sha:
+            return self._records_index[1]
+        index_file = self.review_manager.paths.records_index
+        if not index_file.is_file():
+            return None
+        try:
+            with open(index_file, encoding="utf-8") as file:
+                records_index = json.load(file)
+            if records_index["blob_sha"] != blob_sha:
+                return None
+        except (ValueError, KeyError):
+            return None
+        self._records_index = (blob_sha, records_index["records"])
+        self._records_index_saved = True
+        return records_index["records"]
+
+    def _get_records_index(self, content: bytes) -> dict:
+        """Get the records index (ID: offset, length, status, and origin)
+        of the records file content"""
+
+        blob_sha = self._get_blob_sha(content)
+        records_index = self._load_records_index(blob_sha)
+        if records_index is None:
+            records_index = self._build_records_index(content)
+            self._records_index = (blob_sha, records_index)
+        # Note : the index is updated when records are saved
+        # and written to the file when it is read
+        if not self._records_index_saved:
+            self._save_records_index()
+        return records_index
+
+    def _load_indexed_records(self, content: bytes, index_items: list) -> dict:
+        """Load the records at the offsets of the index items"""
+        if not index_items:
+            return {}
+        return colrev.loader.load_utils.loads(
+            load_string="".join(
+                content[item["offset"] : item["offset"] + item["length"]].decode(
+                    "utf-8"
+                )
+                for item in index_items
+            ),
+            implementation="bib",
+            logger=self.review_manager.logger,
+            unique_id_field="ID",
+        )
+
+    def read_record(self, *, record_id: str) -> dict:
+        """Read a single record (without loading the other records)"""
+
+        if self.review_manager.notified_next_operation is None:
+            raise colrev_exceptions.ReviewManagerNotNotifiedError()
+        if not self.review_manager.paths.records.is_file():
+            raise colrev_exceptions.RecordNotInRepoException(record_id)
+
+        content = self.review_manager.paths.records.read_bytes()
+        records_index = self._get_records_index(content)
+        if record_id not in records_index:
+            raise colrev_exceptions.RecordNotInRepoException(record_id)
+        return self._load_indexed_records(content, [records_index[record_id]])[
+            record_id
+        ]
+
     def read_next_record(self, *, conditions: list) -> typing.Iterator[dict]:
         """Read records (Iterator) based on condition"""
 
         # Note : matches conditions connected with 'OR'
+        if self.review_manager.paths.records.is_file() and all(
+            list(condition) in [[Fields.ID], [Fields.STATUS]]
+            for condition in conditions
+        ):
+            content = self.review_manager.paths.records.read_bytes()
+            # Parse only the selected records (unless all records are cached)
+            if self._load_records_cache(self._get_blob_sha(content)) is None:
+                records_index = self._get_records_index(content)
+                selected = {
+                    (key, str(value))
+                    for condition in conditions
+                    for key, value in condition.items()
+                }
+                selected_items = [
+                    index_item
+                    for record_id, index_item in sorted(records_index.items())
+                    if (Fields.ID, record_id) in selected
+                    or (Fields.STATUS, index_item[Fields.STATUS]) in selected
+                ]
+                yield from self._load_indexed_records(content, selected_items).values()
+                return
+
         records = self.load_records_dict()
 
         records_list = []
@@ -328,7 +616,8 @@ class Dataset:
             if record_dict[Fields.STATUS] == RecordState.pdf_prepared:
                 record.reset_pdf_provenance_notes()
 
-        self.save_records_dict(records)
+        # Note : rewrite all records to format them
+        self.save_records_dict_to_file(records)
         changed = self.review_manager.paths.RECORDS_FILE in [
             r.a_path for r in self._git_repo.index.diff(None)
         ]
@@ -346,14 +635,17 @@ class Dataset:
     def propagated_id(self, *, record_id: str) -> bool:
         """Check whether an ID is propagated (i.e., its record's status is beyond md_processed)"""
 
-        for record in self.load_records_dict(header_only=True).values():
-            if record[Fields.ID] == record_id:
-                if record[Fields.STATUS] in RecordState.get_post_x_states(
-                    state=RecordState.md_processed
-                ):
-                    return True
-
-        return False
+        if not self.review_manager.paths.records.is_file():
+            return False
+        records_index = self._get_records_index(
+            self.review_manager.paths.records.read_bytes()
+        )
+        if record_id not in records_index:
+            return False
+        return records_index[record_id][Fields.STATUS] in [
+            str(state)
+            for state in RecordState.get_post_x_states(state=RecordState.md_processed)
+        ]
 
     def set_ids(self, selected_ids: typing.Optional[list] = None) -> dict:
         """Set the IDs of records according to predefined formats or
@@ -0,0 +1,253 @@
+#! /usr/bin/env python
+"""Process-wide HTTP session (connection pooling, rate limits and caching)."""
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+import typing
+from datetime import timedelta
+from pathlib import Path
+from urllib.parse import urlparse
+
+import requests
+import requests_cache
+from requests.adapters import HTTPAdapter
+
+from colrev.constants import Filepaths
+
+# Requests per second (for requests that are not served from the cache)
+RATE_LIMITS = {
+    "api.crossref.org": 10.0,
+    "dblp.org": 1.0,
+    "eutils.ncbi.nlm.nih.gov": 3.0,
+    "pubmed.ncbi.nlm.nih.gov": 3.0,
+    "www.ebi.ac.uk": 10.0,
+    "api.semanticscholar.org": 1.0,
+    "openlibrary.org": 5.0,
+    "dx.doi.org": 10.0,
+    "www.doi.org": 10.0,
+}
+
+
+class _TokenBucket:
+    """Thread-safe token bucket (reserves a slot and waits until it is due)"""
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, *, rate: float, capacity: float = 1.0) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Wait for a token and return the time waited (in seconds)"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._last) * self.rate
+            )
+            self._last = now
+            self._tokens -= 1
+            wait = 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class _Metrics:
+    """Thread-safe counters for cache hits and per-host latency"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset the metrics"""
+        with self._lock:
+            self.cache_hits = 0
+            self.cache_misses = 0
+            self.hosts: typing.Dict[str, dict] = {}
+
+    def add_response(self, *, from_cache: bool) -> None:
+        """Count a response (served from the cache or from the network)"""
+        with self._lock:
+            if from_cache:
+                self.cache_hits += 1
+            else:
+                self.cache_misses += 1
+
+    def add_request(self, *, host: str, latency: float, waited: float) -> None:
+        """Add the latency of a network request"""
+        with self._lock:
+            host_metrics = self.hosts.setdefault(
+                host,
+                {
+                    "requests": 0,
+                    "total_latency": 0.0,
+                    "max_latency": 0.0,
+                    "waited": 0.0,
+                },
+            )
+            host_metrics["requests"] += 1
+            host_metrics["total_latency"] += latency
+            host_metrics["max_latency"] = max(host_metrics["max_latency"], latency)
+            host_metrics["waited"] += waited
+
+    def get(self) -> dict:
+        """Get a summary of the metrics"""
+        with self._lock:
+            total = self.cache_hits + self.cache_misses
+            return {
+                "cache_hits": self.cache_hits,
+                "cache_misses": self.cache_misses,
+                "hit_rate": self.cache_hits / total if total else 0.0,
+                "hosts": {
+                    host: {
+                        "requests": values["requests"],
+                        "mean_latency": values["total_latency"] / values["requests"],
+                        "max_latency": values["max_latency"],
+                        "rate_limit_wait": values["waited"],
+                    }
+                    for host, values in self.hosts.items()
+                },
+            }
+
+
+class _RateLimitedAdapter(HTTPAdapter):
+    """Adapter applying the per-host rate limits to requests sent over the network
+    (requests_cache only calls the adapter for responses that are not cached)"""
+
+    def __init__(
+        self, *, session_manager: HTTPSessionManager, **kwargs: typing.Any
+    ) -> None:
+        self._session_manager = session_manager
+        super().__init__(**kwargs)
+
+    def send(  # type: ignore # pylint: disable=arguments-differ
+        self, request: requests.PreparedRequest, **kwargs: typing.Any
+    ) -> requests.Response:
+        host = urlparse(request.url).hostname or ""
+        waited = self._session_manager.wait_for_host(host)
+        start = time.perf_counter()
+        try:
+            return super().send(request, **kwargs)
+        finally:
+            self._session_manager.metrics.add_request(
+                host=host, latency=time.perf_counter() - start, waited=waited
+            )
+
+
+class _SharedCachedSession(requests_cache.CachedSession):
+    """Cached session counting cache hits and misses"""
+
+    # pylint: disable=abstract-method
+
+    def __init__(
+        self, *, session_manager: HTTPSessionManager, **kwargs: typing.Any
+    ) -> None:
+        self._session_manager = session_manager
+        super().__init__(**kwargs)
+
+    def request(  # type: ignore # pylint: disable=arguments-differ
+        self, method: str, url: str, *args: typing.Any, **kwargs: typing.Any
+    ) -> requests.Response:
+        response = super().request(method, url, *args, **kwargs)
+        self._session_manager.metrics.add_response(
+            from_cache=getattr(response, "from_cache", False)
+        )
+        return response
+
+
+class HTTPSessionManager:
+    """Manages one cached HTTP session per process
+
+    The session keeps connections alive (pooled per host), applies per-host
+    rate limits to requests that are not served from the cache,
+    and shares a single sqlite cache handle across threads."""
+
+    # pylint: disable=too-many-instance-attributes
+
+    _instance: typing.Optional[HTTPSessionManager] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(
+        self,
+        *,
+        cache_path: Path = Filepaths.PREP_REQUESTS_CACHE_FILE,
+        rate_limits: typing.Optional[typing.Dict[str, float]] = None,
+        pool_maxsize: int = 20,
+        expire_after: timedelta = timedelta(days=30),
+    ) -> None:
+        self.cache_path = cache_path
+        self.rate_limits = RATE_LIMITS if rate_limits is None else rate_limits
+        self.pool_maxsize = pool_maxsize
+        self.expire_after = expire_after
+        self.metrics = _Metrics()
+        self._buckets: typing.Dict[str, _TokenBucket] = {}
+        self._lock = threading.Lock()
+        self._session: typing.Optional[_SharedCachedSession] = None
+
+    @classmethod
+    def get_instance(cls) -> HTTPSessionManager:
+        """Get the session manager of the process"""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def get_session(self) -> requests_cache.CachedSession:
+        """Get the shared cached session"""
+        with self._lock:
+            if self._session is None:
+                self._session = self._create_session()
+            return self._session
+
+    def _create_session(self) -> _SharedCachedSession:
+        session = _SharedCachedSession(
+            session_manager=self,
+            cache_name=str(self.cache_path),
+            backend="sqlite",
+            expire_after=self.expire_after,
+            # Wait for locks of concurrent writers (instead of failing immediately)
+            timeout=30,
+            check_same_thread=False,
+        )
+        adapter = _RateLimitedAdapter(
+            session_manager=self,
+            pool_connections=len(self.rate_limits) + 1,
+            pool_maxsize=self.pool_maxsize,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        try:
+            # Readers do not block the writer (persistent setting of the sqlite file)
+            with session.cache.responses.connection(commit=True) as con:  # type: ignore
+                con.execute("PRAGMA journal_mode=WAL")
+        except (AttributeError, sqlite3.OperationalError):  # pragma: no cover
+            pass
+        return session
+
+    def wait_for_host(self, host: str) -> float:
+        """Wait until the rate limit allows a request to the host
+        (returns the time waited in seconds)"""
+        if host not in self.rate_limits:
+            return 0.0
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = _TokenBucket(rate=self.rate_limits[host])
+            bucket = self._buckets[host]
+        return bucket.acquire()
+
+    def get_metrics(self) -> dict:
+        """Get the cache hit rate and the latency per host"""
+        return self.metrics.get()
+
+    def close(self) -> None:
+        """Close the session (a new one is created when it is requested)"""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
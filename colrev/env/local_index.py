@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import sqlite3
+import threading
 import typing
 from copy import deepcopy
 from multiprocessing import Lock
@@ -22,6 +23,7 @@ import colrev.ops.check
 import colrev.record.record
 from colrev.constants import ENTRYTYPES
 from colrev.constants import Fields
+from colrev.constants import Filepaths
 from colrev.env.local_index_prep import prepare_record_for_return
 
 
@@ -38,17 +40,56 @@ class LocalIndex:
         self.environment_manager = colrev.env.environment_manager.EnvironmentManager()
         self._index_tei = index_tei
         self.thread_lock = Lock()
+        # Read-only connections (per thread and sqlite file)
+        self._thread_local = threading.local()
+        self._prepared_sqlite_files: typing.Set[str] = set()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get the (read-only) connection to the sqlite database for the current thread"""
+        sqlite_file = str(Filepaths.LOCAL_INDEX_SQLITE_FILE)
+        if not hasattr(self._thread_local, "connections"):
+            self._thread_local.connections = {}
+        connections = self._thread_local.connections
+        if sqlite_file not in connections:
+            with self.thread_lock:
+                if sqlite_file not in self._prepared_sqlite_files:
+                    # Creates the file (if necessary) and migrates prior versions
+                    sqlite_index_record = (
+                        colrev.env.local_index_sqlite.SQLiteIndexRecord()
+                    )
+                    sqlite_index_record.connection.close()
+                    self._prepared_sqlite_files.add(sqlite_file)
+            connections[sqlite_file] = colrev.env.local_index_sqlite.connect(
+                read_only=True
+            )
+        return connections[sqlite_file]
+
+    def _get_sqlite_index_record(
+        self,
+    ) -> colrev.env.local_index_sqlite.SQLiteIndexRecord:
+        return colrev.env.local_index_sqlite.SQLiteIndexRecord(
+            connection=self._get_connection()
+        )
+
+    def _get_sqlite_index_toc(self) -> colrev.env.local_index_sqlite.SQLiteIndexTOC:
+        return colrev.env.local_index_sqlite.SQLiteIndexTOC(
+            connection=self._get_connection()
+        )
 
     def get_journal_rankings(self, journal: str) -> list:
         """Get the journal rankings from the sqlite database"""
-        sqlite_index_ranking = colrev.env.local_index_sqlite.SQLiteIndexRankings()
+        sqlite_index_ranking = colrev.env.local_index_sqlite.SQLiteIndexRankings(
+            connection=self._get_connection()
+        )
         return sqlite_index_ranking.select(journal=journal)
 
     def _retrieve_based_on_colrev_id(
-        self, cids_to_retrieve: list
+        self,
+        cids_to_retrieve: list,
+        *,
+        sqlite_index_record: colrev.env.local_index_sqlite.SQLiteIndexRecord,
     ) -> colrev.record.record.Record:
 
-        sqlite_index_record = colrev.env.local_index_sqlite.SQLiteIndexRecord()
         for cid_to_retrieve in cids_to_retrieve:
             try:
                 retrieved_record = sqlite_index_record.get(
@@ -58,8 +99,6 @@ class LocalIndex:
 
             except colrev_exceptions.RecordNotInIndexException:
                 continue  # continue with the next cid_to_retrieve
-            finally:
-                sqlite_index_record.connection.close()
 
         raise colrev_exceptions.RecordNotInIndexException()
 
@@ -92,12 +131,17 @@ class LocalIndex:
         return colrev.record.record.Record(ret[record_id])
 
     def _retrieve_from_record_index(
-        self, record_dict: dict
+        self,
+        record_dict: dict,
+        *,
+        sqlite_index_record: colrev.env.local_index_sqlite.SQLiteIndexRecord,
     ) -> colrev.record.record.Record:
 
         record = colrev.record.record.Record(record_dict)
         cids_to_retrieve = [record.get_colrev_id()]
-        retrieved_record = self._retrieve_based_on_colrev_id(cids_to_retrieve)
+        retrieved_record = self._retrieve_based_on_colrev_id(
+            cids_to_retrieve, sqlite_index_record=sqlite_index_record
+        )
         if retrieved_record.data[Fields.ENTRYTYPE] != record.data[Fields.ENTRYTYPE]:
             if record_dict.get(Fields.CURATION_ID, "NA").startswith(
                 "https://github.com/"
@@ -109,19 +153,15 @@ class LocalIndex:
     def search(self, query: str) -> list[colrev.record.record.Record]:
         """Run a search for records"""
 
+        records_to_return = []
         try:
-            self.thread_lock.acquire(timeout=60)
-            sqlite_index_record = colrev.env.local_index_sqlite.SQLiteIndexRecord()
-            records_to_return = []
+            sqlite_index_record = self._get_sqlite_index_record()
             for record_dict in sqlite_index_record.search(query=query):
                 record = prepare_record_for_return(record_dict, include_file=False)
                 records_to_return.append(record)
 
         except sqlite3.OperationalError as exc:  # pragma: no cover
             print(exc)
-        finally:
-            sqlite_index_record.connection.close()
-            self.thread_lock.release()
 
         return records_to_return
 
@@ -129,7 +169,7 @@ class LocalIndex:
         """Determine the year of a paper based on its table-of-content (journal-volume-number)"""
 
         try:
-            sqlite_index_toc = colrev.env.local_index_sqlite.SQLiteIndexTOC()
+            sqlite_index_toc = self._get_sqlite_index_toc()
             toc_key = colrev.record.record.Record(record_dict).get_toc_key()
             toc_items = []
             if self._toc_exists(toc_key):
@@ -139,7 +179,7 @@ class LocalIndex:
                 raise colrev_exceptions.TOCNotAvailableException()
 
             toc_records_colrev_id = toc_items[0]
-            sqlite_index_record = colrev.env.local_index_sqlite.SQLiteIndexRecord()
+            sqlite_index_record = self._get_sqlite_index_record()
             record_dict = sqlite_index_record.get(
                 key=Fields.COLREV_ID, value=toc_records_colrev_id
             )
@@ -153,32 +193,25 @@ class LocalIndex:
             colrev_exceptions.RecordNotInIndexException,
         ) as exc:
             raise colrev_exceptions.TOCNotAvailableException() from exc
-        finally:
-            sqlite_index_toc.connection.close()
 
     def _toc_exists(self, toc_item: str) -> bool:
         try:
-            self.thread_lock.acquire(timeout=60)
-            sqlite_index_toc = colrev.env.local_index_sqlite.SQLiteIndexTOC()
+            sqlite_index_toc = self._get_sqlite_index_toc()
             return sqlite_index_toc.exists(toc_item)
         except sqlite3.OperationalError:  # pragma: no cover
             pass  # return False
         except AttributeError:  # pragma: no cover
             # ie. no sqlite database available
             pass  # return False
-        finally:
-            sqlite_index_toc.connection.close()
-            self.thread_lock.release()
         return False
 
     def _get_toc_items(self, toc_key: str, *, search_across_tocs: bool) -> list:
-        sqlite_index_toc = colrev.env.local_index_sqlite.SQLiteIndexTOC()
+        sqlite_index_toc = self._get_sqlite_index_toc()
         toc_items = []
         if self._toc_exists(toc_key):
             toc_items = sqlite_index_toc.get_toc_items(toc_key=toc_key)
         else:
             if not search_across_tocs:
-                sqlite_index_toc.connection.close()
                 raise colrev_exceptions.RecordNotInIndexException()
 
         if not toc_items and search_across_tocs:
@@ -189,7 +222,6 @@ class LocalIndex:
                 toc_items = sqlite_index_toc.get_toc_items(
                     partial_toc_key=partial_toc_key
                 )
-                sqlite_index_toc.connection.close()
             except (
                 colrev_exceptions.NotTOCIdentifiableException,
                 KeyError,
@@ -217,20 +249,25 @@ class LocalIndex:
             raise colrev_exceptions.RecordNotInIndexException() from exc
 
         toc_items = self._get_toc_items(toc_key, search_across_tocs=search_across_tocs)
-        # SQLiteIndexRecord() must be after _get_toc_items(), which also uses the sqlite file
-        sqlite_index_record = colrev.env.local_index_sqlite.SQLiteIndexRecord()
+        sqlite_index_record = self._get_sqlite_index_record()
         try:
-            for toc_records_colrev_id in toc_items:
-                record_dict = sqlite_index_record.get(
+            toc_record_dicts = [
+                sqlite_index_record.get(
                     key=Fields.COLREV_ID, value=toc_records_colrev_id
                 )
-
-                if not colrev.record.record_similarity.matches(
-                    record, colrev.record.record.Record(record_dict)
-                ):
-                    continue
-
-                return prepare_record_for_return(record_dict, include_file=include_file)
+                for toc_records_colrev_id in toc_items
+            ]
+            toc_matches = colrev.record.record_similarity.match_pairs(
+                [
+                    (record, colrev.record.record.Record(record_dict))
+                    for record_dict in toc_record_dicts
+                ]
+            )
+            for record_dict, toc_match in zip(toc_record_dicts, toc_matches):
+                if toc_match:
+                    return prepare_record_for_return(
+                        record_dict, include_file=include_file
+                    )
             raise colrev_exceptions.RecordNotInTOCException(
                 record_id=record.data[Fields.ID], toc_key=toc_key
             )
@@ -241,8 +278,6 @@ class LocalIndex:
         ):
             pass
 
-        sqlite_index_record.connection.close()
-
         raise colrev_exceptions.RecordNotInIndexException()
 
     def retrieve_based_on_colrev_pdf_id(
@@ -252,15 +287,10 @@ class LocalIndex:
         Convenience function to retrieve the indexed record_dict metadata
         based on a colrev_pdf_id
         """
-        try:
-            sqlite_index_record = colrev.env.local_index_sqlite.SQLiteIndexRecord()
-            record_dict = sqlite_index_record.get(
-                key=Fields.PDF_ID, value=colrev_pdf_id
-            )
-            record_to_import = prepare_record_for_return(record_dict, include_file=True)
-            record_to_import.data.pop(Fields.FILE, None)
-        finally:
-            sqlite_index_record.connection.close()
+        sqlite_index_record = self._get_sqlite_index_record()
+        record_dict = sqlite_index_record.get(key=Fields.PDF_ID, value=colrev_pdf_id)
+        record_to_import = prepare_record_for_return(record_dict, include_file=True)
+        record_to_import.data.pop(Fields.FILE, None)
         return record_to_import
 
     def retrieve(
@@ -275,12 +305,78 @@ class LocalIndex:
         based on another record_dict
         """
 
+        return self._retrieve(
+            record_dict,
+            sqlite_index_record=self._get_sqlite_index_record(),
+            include_file=include_file,
+            include_colrev_ids=include_colrev_ids,
+        )
+
+    def retrieve_many(
+        self,
+        record_dicts: list,
+        *,
+        include_file: bool = False,
+        include_colrev_ids: bool = False,
+    ) -> typing.List[typing.Optional[colrev.record.record.Record]]:
+        """
+        Retrieve the indexed metadata for a list of record_dicts
+        (like retrieve(), but with batched queries).
+        Records that are not in the index are returned as None.
+        """
+
+        sqlite_index_record = self._get_sqlite_index_record()
+        global_keys = colrev.env.local_index_sqlite.SQLiteIndexRecord.GLOBAL_KEYS
+        values: typing.Dict[str, list] = {key: [] for key in global_keys}
+        for record_dict in record_dicts:
+            for key in global_keys:
+                if key in record_dict:
+                    values[key].append(record_dict[key])
+            try:
+                values[Fields.COLREV_ID].append(
+                    colrev.record.record.Record(record_dict).get_colrev_id()
+                )
+            except colrev_exceptions.NotEnoughDataToIdentifyException:
+                pass
+        for key, key_values in values.items():
+            sqlite_index_record.prefetch(key=key, values=key_values)
+
+        retrieved_records: typing.List[typing.Optional[colrev.record.record.Record]]
+        retrieved_records = []
+        for record_dict in record_dicts:
+            try:
+                retrieved_records.append(
+                    self._retrieve(
+                        record_dict,
+                        sqlite_index_record=sqlite_index_record,
+                        include_file=include_file,
+                        include_colrev_ids=include_colrev_ids,
+                    )
+                )
+            except (
+                colrev_exceptions.RecordNotInIndexException,
+                colrev_exceptions.NotEnoughDataToIdentifyException,
+            ):
+                retrieved_records.append(None)
+        return retrieved_records
+
+    def _retrieve(
+        self,
+        record_dict: dict,
+        *,
+        sqlite_index_record: colrev.env.local_index_sqlite.SQLiteIndexRecord,
+        include_file: bool,
+        include_colrev_ids: bool,
+    ) -> colrev.record.record.Record:
+
         # To avoid modifications to the original record
         record_dict = deepcopy(record_dict)
 
         # 1. Try the record index
         try:
-            retrieved_record = self._retrieve_from_record_index(record_dict)
+            retrieved_record = self._retrieve_from_record_index(
+                record_dict, sqlite_index_record=sqlite_index_record
+            )
             retrieved_record_dict = retrieved_record.data
         except (
             colrev_exceptions.RecordNotInIndexException,
@@ -308,15 +404,7 @@ class LocalIndex:
                     or Fields.ID == key
                 ):
                     continue
-                try:
-                    sqlite_index_record = (
-                        colrev.env.local_index_sqlite.SQLiteIndexRecord()
-                    )
-                    retrieved_record_dict = sqlite_index_record.get(
-                        key=key, value=value
-                    )
-                finally:
-                    sqlite_index_record.connection.close()
+                retrieved_record_dict = sqlite_index_record.get(key=key, value=value)
 
                 if key in retrieved_record_dict:
                     if retrieved_record_dict[key] == value:
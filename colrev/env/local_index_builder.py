@@ -4,25 +4,25 @@ from __future__ import annotations
 
 import collections
 import io
+import multiprocessing as mp
 import os
+import sqlite3
 import typing
 from copy import deepcopy
-from datetime import timedelta
 from multiprocessing import Lock
 from pathlib import Path
 from threading import Timer
 
 import pandas as pd
-import requests_cache
 from tqdm import tqdm
 
 import colrev.env.environment_manager
+import colrev.env.http_session_manager
 import colrev.env.local_index_sqlite
 import colrev.env.resources
 import colrev.env.tei_parser
 import colrev.env.utils
 import colrev.exceptions as colrev_exceptions
-import colrev.loader.load_utils
 import colrev.ops.check
 import colrev.record.record
 import colrev.review_manager
@@ -33,7 +33,26 @@ from colrev.constants import Filepaths
 from colrev.constants import LocalIndexFields
 from colrev.constants import RecordState
 from colrev.env.local_index_prep import prepare_record_for_indexing
-from colrev.writer.write_utils import to_string
+
+# Pragmas for building the index (in a separate file that is swapped in when completed)
+# Note : the file is discarded when the build fails (journaling/syncing is not needed)
+BULK_BUILD_PRAGMAS = [
+    "PRAGMA journal_mode=OFF",
+    "PRAGMA synchronous=OFF",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-262144",  # 256 MB
+]
+
+
+def _load_and_prepare_project(args: tuple) -> typing.Optional[dict]:
+    """Load and prepare the records of a project (in a separate process)"""
+    repo_source_path, verbose_mode = args
+    local_index_builder = LocalIndexBuilder(verbose_mode=verbose_mode)
+    # pylint: disable=protected-access
+    project = local_index_builder._load_colrev_project(repo_source_path)
+    if project is None:
+        return None
+    return local_index_builder._prepare_records(**project)
 
 
 class LocalIndexBuilder:
@@ -49,6 +68,15 @@ class LocalIndexBuilder:
         self.environment_manager = colrev.env.environment_manager.EnvironmentManager()
         self._index_tei = index_tei
         self.thread_lock = Lock()
+        # Shared connection (bulk build), otherwise, each step connects to the index
+        self._connection: typing.Optional[sqlite3.Connection] = None
+
+    def _get_sqlite_index_record(
+        self,
+    ) -> colrev.env.local_index_sqlite.SQLiteIndexRecord:
+        return colrev.env.local_index_sqlite.SQLiteIndexRecord(
+            connection=self._connection
+        )
 
     def reinitialize_sqlite_db(self) -> None:
         """Reinitialize the SQLITE database ()"""
@@ -118,7 +146,11 @@ class LocalIndexBuilder:
             }
             for el in recs_to_index
         ]
-        sqlite_index_record = colrev.env.local_index_sqlite.SQLiteIndexRecord()
+        sqlite_index_record = self._get_sqlite_index_record()
+        indexed_ids = sqlite_index_record.get_existing_ids(
+            [item.get(LocalIndexFields.ID, "") for item in list_to_add]
+        )
+        items_to_insert, items_to_amend = [], []
         for item in list_to_add:
             for (
                 records_index_required_key
@@ -129,25 +161,28 @@ class LocalIndexBuilder:
                 print("NO ID IN RECORD")
                 continue
 
-            if not sqlite_index_record.exists(local_index_id=item[LocalIndexFields.ID]):
-                sqlite_index_record.insert(item)
-            else:
-                if not curated_fields:
-                    continue
-                try:
-                    stored_record = sqlite_index_record.get(
-                        key=Fields.COLREV_ID,
-                        value=item[Fields.COLREV_ID],
-                    )
+            if item[LocalIndexFields.ID] not in indexed_ids:
+                items_to_insert.append(item)
+                indexed_ids.add(item[LocalIndexFields.ID])
+            elif curated_fields:
+                items_to_amend.append(item)
 
-                    self._amend_record(
-                        sqlite_index_record=sqlite_index_record,
-                        stored_record_dict=stored_record,
-                        item_to_add=item,
-                        curated_fields=curated_fields,
-                    )
-                except colrev_exceptions.RecordNotInIndexException:  # pragma: no cover
-                    pass
+        sqlite_index_record.insert_many(items_to_insert)
+        for item in items_to_amend:
+            try:
+                stored_record = sqlite_index_record.get(
+                    key=Fields.COLREV_ID,
+                    value=item[Fields.COLREV_ID],
+                )
+
+                self._amend_record(
+                    sqlite_index_record=sqlite_index_record,
+                    stored_record_dict=stored_record,
+                    item_to_add=item,
+                    curated_fields=curated_fields,
+                )
+            except colrev_exceptions.RecordNotInIndexException:  # pragma: no cover
+                pass
 
         sqlite_index_record.commit()
 
@@ -161,12 +196,11 @@ class LocalIndexBuilder:
     ) -> None:
         """Adds layered fields to amend existing records"""
 
-        item_record_dict = colrev.loader.load_utils.loads(
-            load_string=item_to_add[LocalIndexFields.BIBTEX],
-            implementation="bib",
-            unique_id_field="ID",
+        item_record = colrev.record.record.Record(
+            colrev.env.local_index_sqlite.record_from_json(
+                item_to_add[LocalIndexFields.RECORD_JSON]
+            )
         )
-        item_record = colrev.record.record.Record(list(item_record_dict.values())[0])
         stored_record = colrev.record.record.Record(stored_record_dict)
 
         for curated_field in curated_fields:
@@ -182,13 +216,9 @@ class LocalIndexBuilder:
                 source=item_record.get_field_provenance_source(curated_field),
             )
 
-        bibtex = to_string(
-            records_dict={stored_record.data[Fields.ID]: stored_record.data},
-            implementation="bib",
-        )
-
         sqlite_index_record.update(
-            local_index_id=item_to_add[LocalIndexFields.ID], bibtex=bibtex
+            local_index_id=item_to_add[LocalIndexFields.ID],
+            record_dict=stored_record.data,
         )
 
     # pylint: disable=too-many-arguments
@@ -203,6 +233,28 @@ class LocalIndexBuilder:
     ) -> None:
         """Index a CoLRev project"""
 
+        self._index_prepared_records(
+            **self._prepare_records(
+                records=records,
+                repo_source_path=repo_source_path,
+                curation_url=curation_url,
+                curated_masterdata=curated_masterdata,
+                curated_fields=curated_fields,
+            )
+        )
+
+    # pylint: disable=too-many-arguments
+    def _prepare_records(
+        self,
+        *,
+        records: dict,
+        repo_source_path: Path,
+        curation_url: str,
+        curated_masterdata: bool,
+        curated_fields: list,
+    ) -> dict:
+        """Prepare records for indexing (does not access the index)"""
+
         recs_to_index = []
         toc_to_index: typing.Dict[str, str] = {}
         for record_dict in tqdm(records.values()):
@@ -221,14 +273,13 @@ class LocalIndexBuilder:
                         curation_url
                     )
 
-                # Set absolute file paths and set bibtex field (for simpler retrieval)
+                # Set absolute file paths and set record_json field (for simpler retrieval)
                 if Fields.FILE in record_dict:
                     record_dict.update(
                         file=repo_source_path / Path(record_dict[Fields.FILE])
                     )
-                record_dict[LocalIndexFields.BIBTEX] = to_string(
-                    records_dict={record_dict[Fields.ID]: record_dict},
-                    implementation="bib",
+                record_dict[LocalIndexFields.RECORD_JSON] = (
+                    colrev.env.local_index_sqlite.record_to_json(record_dict)
                 )
                 record_dict = prepare_record_for_indexing(record_dict)
                 recs_to_index.append(record_dict)
@@ -247,6 +298,21 @@ class LocalIndexBuilder:
                     copy_for_toc_index=copy_for_toc_index,
                     curated_masterdata=curated_masterdata,
                 )
+        return {
+            "recs_to_index": recs_to_index,
+            "toc_to_index": toc_to_index,
+            "curated_masterdata": curated_masterdata,
+            "curated_fields": curated_fields,
+        }
+
+    def _index_prepared_records(
+        self,
+        *,
+        recs_to_index: list,
+        toc_to_index: dict,
+        curated_masterdata: bool,
+        curated_fields: list,
+    ) -> None:
         # Select fields and insert into index (sqlite)
 
         self._index_tei_document(recs_to_index)
@@ -256,7 +322,9 @@ class LocalIndexBuilder:
         )
 
         if curated_masterdata:
-            sqlite_index_toc = colrev.env.local_index_sqlite.SQLiteIndexTOC()
+            sqlite_index_toc = colrev.env.local_index_sqlite.SQLiteIndexTOC(
+                connection=self._connection
+            )
             sqlite_index_toc.add(toc_to_index)
 
     def _load_masterdata_curations(self) -> dict:  # pragma: no cover
@@ -277,10 +345,18 @@ class LocalIndexBuilder:
 
     def index_colrev_project(self, repo_source_path: Path) -> None:  # pragma: no cover
         """Index a CoLRev project"""
+        project = self._load_colrev_project(repo_source_path)
+        if project is not None:
+            self.index_records(**project)
+
+    def _load_colrev_project(
+        self, repo_source_path: Path
+    ) -> typing.Optional[dict]:  # pragma: no cover
+        """Load the records of a CoLRev project (and the parameters for indexing)"""
         try:
             if not Path(repo_source_path).is_dir():
                 print(f"Warning {repo_source_path} not a directory")
-                return
+                return None
 
             print(f"Index records from {repo_source_path}")
             os.chdir(repo_source_path)
@@ -297,7 +373,7 @@ class LocalIndexBuilder:
 
             records_file = check_operation.review_manager.paths.records
             if not records_file.is_file():
-                return
+                return None
             records = check_operation.review_manager.dataset.load_records_dict()
 
             curation_endpoints = [
@@ -322,26 +398,25 @@ class LocalIndexBuilder:
                 check_operation.review_manager.settings.is_curated_masterdata_repo()
             )
 
-            self.index_records(
-                records=records,
-                repo_source_path=repo_source_path,
-                curated_fields=curated_fields,
-                curation_url=curation_url,
-                curated_masterdata=curated_masterdata,
-            )
+            return {
+                "records": records,
+                "repo_source_path": repo_source_path,
+                "curated_fields": curated_fields,
+                "curation_url": curation_url,
+                "curated_masterdata": curated_masterdata,
+            }
 
         # TypeErrors are thrown when a repo is in interactive rebase mode
         except (colrev_exceptions.CoLRevException, TypeError) as exc:
             print(exc)
+        return None
 
     def index(self) -> None:  # pragma: no cover
-        """Index all registered CoLRev projects"""
+        """Index all registered CoLRev projects (bulk build)"""
 
         # Note : this task takes long and does not need to run often
-        session = requests_cache.CachedSession(
-            str(Filepaths.PREP_REQUESTS_CACHE_FILE),
-            backend="sqlite",
-            expire_after=timedelta(days=30),
+        session = (
+            colrev.env.http_session_manager.HTTPSessionManager.get_instance().get_session()
         )
         # Note : lambda is necessary to prevent immediate function call
         # pylint: disable=unnecessary-lambda
@@ -350,8 +425,6 @@ class LocalIndexBuilder:
         if self._outlets_duplicated():
             return
 
-        self.reinitialize_sqlite_db()
-
         repo_source_paths = [
             x["repo_source_path"] for x in self.environment_manager.local_repos()
         ]
@@ -368,8 +441,63 @@ class LocalIndexBuilder:
                 x["repo_source_path"] for x in self.environment_manager.local_repos()
             ]
 
-        for repo_source_path in repo_source_paths:
-            self.index_colrev_project(repo_source_path)
+        self._bulk_index(repo_source_paths)
+
+    def _bulk_index(self, repo_source_paths: list) -> None:
+        """Build the index in a separate file and swap it in when completed
+
+        Projects are loaded and prepared in parallel (processes) and
+        inserted (in order) through a single connection."""
+
+        build_file = Filepaths.LOCAL_INDEX_SQLITE_FILE.with_suffix(".build.db")
+        build_file.unlink(missing_ok=True)
+        self._connection = colrev.env.local_index_sqlite.connect(sqlite_file=build_file)
+        try:
+            sqlite_index_record = colrev.env.local_index_sqlite.SQLiteIndexRecord(
+                reinitialize=True, connection=self._connection
+            )
+            colrev.env.local_index_sqlite.SQLiteIndexTOC(
+                reinitialize=True, connection=self._connection
+            )
+            # Indices are created after inserting the records (faster)
+            sqlite_index_record.drop_indices()
+            for pragma in BULK_BUILD_PRAGMAS:
+                self._connection.execute(pragma)
+
+            with mp.Pool(max(1, mp.cpu_count() // 2)) as pool:
+                for prepared_project in pool.imap(
+                    _load_and_prepare_project,
+                    [(path, self.verbose_mode) for path in repo_source_paths],
+                ):
+                    if prepared_project is not None:
+                        self._index_prepared_records(**prepared_project)
+
+            print("Create indices")
+            sqlite_index_record.create_indices()
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.close()
+        except BaseException:
+            self._connection.close()
+            build_file.unlink(missing_ok=True)
+            raise
+        finally:
+            self._connection = None
+
+        self._swap_sqlite_db(build_file)
+
+    def _swap_sqlite_db(self, build_file: Path) -> None:
+        sqlite_file = Filepaths.LOCAL_INDEX_SQLITE_FILE
+        if sqlite_file.is_file():
+            # Checkpoint and remove the -wal file of the prior index
+            # (it must not be applied to the new index)
+            connection = colrev.env.local_index_sqlite.connect()
+            try:
+                connection.execute("PRAGMA journal_mode=DELETE")
+            except sqlite3.OperationalError as exc:
+                print(exc)
+            finally:
+                connection.close()
+        os.replace(build_file, sqlite_file)
 
     def _index_tei_document(self, recs_to_index: list) -> None:
         if not self._index_tei:
@@ -2,16 +2,20 @@
 """LocalIndex: sqlite."""
 from __future__ import annotations
 
+import json
 import sqlite3
 import typing
+from pathlib import Path
 
 import pandas as pd
 
 import colrev.exceptions as colrev_exceptions
+import colrev.loader.load_utils
 import colrev.record.record
 from colrev.constants import Fields
 from colrev.constants import Filepaths
 from colrev.constants import LocalIndexFields
+from colrev.constants import RecordState
 
 # Note : records are indexed by id = hash(colrev_id)
 # to ensure that the indexing-ids do not exceed limits
@@ -42,6 +46,44 @@ from colrev.constants import LocalIndexFields
 #     return new_hex.decode("utf-8")
 
 
+def record_to_json(record_dict: dict) -> str:
+    """Serialize a record for the record_json column of the index"""
+    # default=str: RecordState (colrev_status) and Path (file) values
+    return json.dumps(record_dict, default=str)
+
+
+def record_from_json(record_json: str) -> dict:
+    """Deserialize a record from the record_json column of the index"""
+    record_dict = json.loads(record_json)
+    if Fields.STATUS in record_dict:
+        record_dict[Fields.STATUS] = RecordState[record_dict[Fields.STATUS]]
+    return record_dict
+
+
+def _dict_factory(cursor: sqlite3.Cursor, row: tuple) -> dict:
+    ret_dict = {}
+    for idx, col in enumerate(cursor.description):
+        ret_dict[col[0]] = row[idx]
+    return ret_dict
+
+
+def connect(
+    *, read_only: bool = False, sqlite_file: typing.Optional[Path] = None
+) -> sqlite3.Connection:
+    """Connect to the SQLITE database (read-only connections for retrieval)"""
+    if sqlite_file is None:
+        sqlite_file = Filepaths.LOCAL_INDEX_SQLITE_FILE
+    if read_only:
+        # Note : unlike sqlite3.connect(path), mode=ro does not create a file
+        connection = sqlite3.connect(
+            f"{sqlite_file.resolve().as_uri()}?mode=ro", uri=True, timeout=90
+        )
+    else:
+        connection = sqlite3.connect(str(sqlite_file), timeout=90)
+    connection.row_factory = _dict_factory
+    return connection
+
+
 # pylint: disable=too-few-public-methods
 class SQLiteIndex:
     """The SQLiteIndex class implements indexing and retrieval of records locally"""
@@ -50,23 +92,21 @@ class SQLiteIndex:
     CREATE_TABLE_QUERY: str
 
     def __init__(
-        self, *, index_name: str, index_keys: list, reinitialize: bool
+        self,
+        *,
+        index_name: str,
+        index_keys: list,
+        reinitialize: bool,
+        connection: typing.Optional[sqlite3.Connection] = None,
     ) -> None:
         self.index_name = index_name
         self.index_keys = index_keys
-        self.connection = sqlite3.connect(
-            str(Filepaths.LOCAL_INDEX_SQLITE_FILE), timeout=90
-        )
-        self.connection.row_factory = self._dict_factory
+        # Note : connections that are passed (e.g., by the LocalIndex) are shared
+        # and should not be closed
+        self.connection = connection if connection is not None else connect()
         if reinitialize:
             self._reinitialize_db()
 
-    def _dict_factory(self, cursor: sqlite3.Cursor, row: dict) -> dict:
-        ret_dict = {}
-        for idx, col in enumerate(cursor.description):
-            ret_dict[col[0]] = row[idx]
-        return ret_dict
-
     def _get_cursor(self) -> sqlite3.Cursor:
         return self.connection.cursor()
 
@@ -85,15 +125,7 @@ class SQLiteIndex:
             self.connection.commit()
 
     def _get_record_from_row(self, row: dict) -> dict:
-
-        records_dict = colrev.loader.load_utils.loads(
-            load_string=row[LocalIndexFields.BIBTEX],
-            implementation="bib",
-            unique_id_field="ID",
-        )
-
-        retrieved_record = list(records_dict.values())[0]
-        return retrieved_record
+        return record_from_json(row[LocalIndexFields.RECORD_JSON])
 
 
 class SQLiteIndexRecord(SQLiteIndex):
@@ -113,7 +145,7 @@ class SQLiteIndexRecord(SQLiteIndex):
         Fields.DOI,
         LocalIndexFields.DBLP_KEY,  # Note : no dots in key names
         Fields.PDF_ID,
-        LocalIndexFields.BIBTEX,
+        LocalIndexFields.RECORD_JSON,
     ]
 
     GLOBAL_KEYS = [
@@ -134,24 +166,132 @@ class SQLiteIndexRecord(SQLiteIndex):
         LocalIndexFields.ID: f"SELECT * FROM {INDEX_NAME} WHERE {LocalIndexFields.ID}=?",
         Fields.COLREV_ID: f"SELECT * FROM {INDEX_NAME} WHERE {Fields.COLREV_ID}=?",
         Fields.DOI: f"SELECT * FROM {INDEX_NAME} where {Fields.DOI}=?",
-        Fields.DBLP_KEY: f"SELECT * FROM {INDEX_NAME} WHERE {Fields.DBLP_KEY}=?",
+        Fields.DBLP_KEY: f"SELECT * FROM {INDEX_NAME} WHERE {LocalIndexFields.DBLP_KEY}=?",
         Fields.PDF_ID: f"SELECT * FROM {INDEX_NAME} WHERE {Fields.PDF_ID}=?",
         Fields.URL: f"SELECT * FROM {INDEX_NAME} WHERE {Fields.URL}=?",
     }
 
+    # Columns of the keys (in get() and prefetch())
+    KEY_COLUMNS = {
+        LocalIndexFields.ID: LocalIndexFields.ID,
+        Fields.COLREV_ID: Fields.COLREV_ID,
+        Fields.DOI: Fields.DOI,
+        Fields.DBLP_KEY: LocalIndexFields.DBLP_KEY,
+        Fields.PDF_ID: Fields.PDF_ID,
+        Fields.URL: Fields.URL,
+    }
+
     INSERT_QUERY = f"INSERT INTO {INDEX_NAME} VALUES(:{', :'.join(KEYS)})"
 
     UPDATE_RECORD_QUERY = f"""
             UPDATE {INDEX_NAME} SET
-            {LocalIndexFields.BIBTEX}=?
+            {LocalIndexFields.RECORD_JSON}=?
             WHERE {LocalIndexFields.ID}=?"""
 
-    def __init__(self, *, reinitialize: bool = False) -> None:
+    # Columns with an index (the id is the primary key)
+    INDEXED_KEYS = [
+        Fields.COLREV_ID,
+        Fields.DOI,
+        LocalIndexFields.DBLP_KEY,
+        Fields.PDF_ID,
+        Fields.URL,
+    ]
+
+    # Version 1: records are stored in the record_json column (instead of bibtex)
+    # Version 2: INDEXED_KEYS are indexed, journal_mode=WAL
+    SCHEMA_VERSION = 2
+
+    def __init__(
+        self,
+        *,
+        reinitialize: bool = False,
+        connection: typing.Optional[sqlite3.Connection] = None,
+    ) -> None:
         super().__init__(
             index_name=self.INDEX_NAME,
             index_keys=self.KEYS,
             reinitialize=reinitialize,
+            connection=connection,
         )
+        # Rows selected by prefetch() (None: value not in the index)
+        self._prefetched_rows: typing.Dict[str, typing.Dict[str, typing.Any]] = {}
+        if reinitialize:
+            self.create_indices()
+            self._set_schema_version()
+            self._enable_wal()
+        elif connection is None and self._get_schema_version() < self.SCHEMA_VERSION:
+            # Note : shared (read-only) connections are not migrated
+            self._migrate()
+
+    def _get_schema_version(self) -> int:
+        cur = self._get_cursor()
+        cur.execute("PRAGMA user_version")
+        return cur.fetchone()["user_version"]
+
+    def _set_schema_version(self) -> None:
+        cur = self._get_cursor()
+        cur.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+
+    def create_indices(self) -> None:
+        """Create the indices of the INDEXED_KEYS"""
+        cur = self._get_cursor()
+        for key in self.INDEXED_KEYS:
+            cur.execute(
+                f"CREATE INDEX IF NOT EXISTS {self.INDEX_NAME}_{key} "
+                f"ON {self.INDEX_NAME} ({key})"
+            )
+        self.commit()
+
+    def drop_indices(self) -> None:
+        """Drop the indices of the INDEXED_KEYS (before bulk inserts)"""
+        cur = self._get_cursor()
+        for key in self.INDEXED_KEYS:
+            cur.execute(f"DROP INDEX IF EXISTS {self.INDEX_NAME}_{key}")
+        self.commit()
+
+    def _enable_wal(self) -> None:
+        # Readers do not block (and are not blocked by) the writer (persistent setting)
+        cur = self._get_cursor()
+        cur.execute("PRAGMA journal_mode=WAL")
+
+    def _migrate(self) -> None:
+        """Migrate indices of prior schema versions"""
+        cur = self._get_cursor()
+        cur.execute(f"PRAGMA table_info({self.INDEX_NAME})")
+        columns = [row["name"] for row in cur.fetchall()]
+        if not columns:
+            # No record index (yet)
+            return
+
+        if LocalIndexFields.BIBTEX in columns:
+            self._migrate_bibtex_column()
+        print("Migrate local index (create indices)")
+        self.create_indices()
+        self._set_schema_version()
+        self._enable_wal()
+
+    def _migrate_bibtex_column(self) -> None:
+        """Migrate indices that store records as bibtex strings (schema version 0)"""
+        print("Migrate local index (parse bibtex > record_json)")
+        cur = self._get_cursor()
+        old_index_name = f"{self.INDEX_NAME}_bibtex"
+        cur.execute("BEGIN")
+        cur.execute(f"ALTER TABLE {self.INDEX_NAME} RENAME TO {old_index_name}")
+        cur.execute(self.CREATE_TABLE_QUERY)
+        for row in cur.execute(f"SELECT * FROM {old_index_name}").fetchall():
+            records_dict = colrev.loader.load_utils.loads(
+                load_string=row.pop(LocalIndexFields.BIBTEX),
+                implementation="bib",
+                unique_id_field="ID",
+            )
+            if not records_dict:  # pragma: no cover
+                continue
+            row[LocalIndexFields.RECORD_JSON] = record_to_json(
+                list(records_dict.values())[0]
+            )
+            cur.execute(self.INSERT_QUERY, row)
+        cur.execute(f"DROP TABLE {old_index_name}")
+        self.commit()
 
     def exists(
         self,
@@ -169,6 +309,21 @@ class SQLiteIndexRecord(SQLiteIndex):
             return False
         return True
 
+    def get_existing_ids(self, local_index_ids: list) -> typing.Set[str]:
+        """Get the local_index_ids that exist in the index"""
+        cur = self._get_cursor()
+        existing_ids: typing.Set[str] = set()
+        # Note : the number of parameters per query is limited
+        for i in range(0, len(local_index_ids), 500):
+            batch = local_index_ids[i : i + 500]
+            cur.execute(
+                f"SELECT {LocalIndexFields.ID} FROM {self.INDEX_NAME} "
+                f"WHERE {LocalIndexFields.ID} IN ({','.join('?' * len(batch))})",
+                batch,
+            )
+            existing_ids.update(row[LocalIndexFields.ID] for row in cur.fetchall())
+        return existing_ids
+
     def insert(self, item: dict) -> None:
         """Insert a record into the index"""
         # May raise sqlite3.IntegrityError
@@ -176,6 +331,40 @@ class SQLiteIndexRecord(SQLiteIndex):
         cur.execute(self.INSERT_QUERY, item)
         self.commit()
 
+    def insert_many(self, items: list) -> None:
+        """Insert records into the index (without committing)"""
+        # May raise sqlite3.IntegrityError
+        cur = self._get_cursor()
+        cur.executemany(self.INSERT_QUERY, items)
+
+    def prefetch(self, *, key: str, values: list) -> None:
+        """Select the rows for the values in batches (get() does not query them again)"""
+        column = self.KEY_COLUMNS[key]
+        prefetched_rows = self._prefetched_rows.setdefault(key, {})
+        values = list(
+            dict.fromkeys(
+                v for v in values if isinstance(v, str) and v not in prefetched_rows
+            )
+        )
+        cur = self._get_cursor()
+        # Note : the number of parameters per query is limited
+        for i in range(0, len(values), 500):
+            batch = values[i : i + 500]
+            try:
+                cur.execute(
+                    f"SELECT * FROM {self.INDEX_NAME} "
+                    f"WHERE {column} IN ({','.join('?' * len(batch))})",
+                    batch,
+                )
+                rows = cur.fetchall()
+            except sqlite3.OperationalError:  # pragma: no cover
+                return
+            # Like get(), keep the first row of each value
+            for row in rows:
+                prefetched_rows.setdefault(row[column], row)
+            for value in batch:
+                prefetched_rows.setdefault(value, None)
+
     def get(
         self,
         *,
@@ -184,9 +373,12 @@ class SQLiteIndexRecord(SQLiteIndex):
     ) -> dict:
         """Get a record from the index"""
         try:
-            cur = self._get_cursor()
-            cur.execute(self.SELECT_KEY_QUERIES[key], (value,))
-            selected_row = cur.fetchone()
+            if value in self._prefetched_rows.get(key, {}):
+                selected_row = self._prefetched_rows[key][value]
+            else:
+                cur = self._get_cursor()
+                cur.execute(self.SELECT_KEY_QUERIES[key], (value,))
+                selected_row = cur.fetchone()
             if not selected_row:
                 raise colrev_exceptions.RecordNotInIndexException()
 
@@ -213,7 +405,7 @@ class SQLiteIndexRecord(SQLiteIndex):
 
                 # print(
                 #     [
-                #         {k: v for k, v in x.items() if k != LocalIndexFields.BIBTEX}
+                #         {k: v for k, v in x.items() if k != LocalIndexFields.RECORD_JSON}
                 #         for x in stored_record
                 #     ]
                 # )
@@ -230,10 +422,12 @@ class SQLiteIndexRecord(SQLiteIndex):
                 raise NotImplementedError
         return retrieved_record
 
-    def update(self, local_index_id: str, bibtex: str) -> None:
+    def update(self, local_index_id: str, record_dict: dict) -> None:
         """Update a record in the index"""
         cur = self._get_cursor()
-        cur.execute(self.UPDATE_RECORD_QUERY, (bibtex, local_index_id))
+        cur.execute(
+            self.UPDATE_RECORD_QUERY, (record_to_json(record_dict), local_index_id)
+        )
 
     def search(self, query: str) -> list:
         """Search for records in the index"""
@@ -259,11 +453,17 @@ class SQLiteIndexRankings(SQLiteIndex):
     CREATE_TABLE_QUERY = f"CREATE TABLE {INDEX_NAME} (id TEXT PRIMARY KEY)"
     SELECT_QUERY = f"SELECT * FROM {INDEX_NAME} WHERE journal_name = ?"
 
-    def __init__(self, *, reinitialize: bool = False) -> None:
+    def __init__(
+        self,
+        *,
+        reinitialize: bool = False,
+        connection: typing.Optional[sqlite3.Connection] = None,
+    ) -> None:
         super().__init__(
             index_name=self.INDEX_NAME,
             index_keys=self.KEYS,
             reinitialize=reinitialize,
+            connection=connection,
         )
 
     def insert_df(self, data_frame: pd.DataFrame) -> None:
@@ -298,15 +498,39 @@ class SQLiteIndexTOC(SQLiteIndex):
         LocalIndexFields.TOC_KEY: f"SELECT * FROM {INDEX_NAME} WHERE {LocalIndexFields.TOC_KEY}=?",
     }
 
+    # Range query (instead of LIKE) to use the (case-insensitive) toc_key index
+    SELECT_PARTIAL_KEY_QUERY = (
+        f"SELECT * FROM {INDEX_NAME} WHERE "
+        f"{LocalIndexFields.TOC_KEY} >= ? COLLATE NOCASE "
+        f"AND {LocalIndexFields.TOC_KEY} < ? COLLATE NOCASE"
+    )
+
+    CREATE_NOCASE_INDEX_QUERY = (
+        f"CREATE INDEX IF NOT EXISTS {INDEX_NAME}_{LocalIndexFields.TOC_KEY}_nocase "
+        f"ON {INDEX_NAME} ({LocalIndexFields.TOC_KEY} COLLATE NOCASE)"
+    )
+
     INSERT_MANY_QUERY = f"INSERT INTO {INDEX_NAME} VALUES(?, ?)"
 
-    def __init__(self, *, reinitialize: bool = False) -> None:
+    def __init__(
+        self,
+        *,
+        reinitialize: bool = False,
+        connection: typing.Optional[sqlite3.Connection] = None,
+    ) -> None:
         super().__init__(
             index_name=self.INDEX_NAME,
             index_keys=self.KEYS,
             reinitialize=reinitialize,
+            connection=connection,
         )
 
+    def _reinitialize_db(self) -> None:
+        super()._reinitialize_db()
+        cur = self._get_cursor()
+        cur.execute(self.CREATE_NOCASE_INDEX_QUERY)
+        self.commit()
+
     def exists(self, toc_item: str) -> bool:
         """Check if TOC item exists in the index"""
         cur = self._get_cursor()
@@ -322,19 +546,20 @@ class SQLiteIndexTOC(SQLiteIndex):
     def get_toc_items(self, toc_key: str = "", partial_toc_key: str = "") -> list:
         """Get TOC items from the index"""
         if partial_toc_key != "":
-            query = f"{self.SELECT_ALL_QUERY} {LocalIndexFields.TOC_KEY} LIKE ?"
-            argument = partial_toc_key + "%"
+            # Note : like the LIKE query, partial keys are case-insensitive
+            query = self.SELECT_PARTIAL_KEY_QUERY
+            arguments: tuple = (partial_toc_key, partial_toc_key + "\U0010ffff")
         elif toc_key != "":
             query = (
                 f"SELECT * FROM {self.INDEX_NAME} WHERE {LocalIndexFields.TOC_KEY}=?"
             )
-            argument = toc_key
+            arguments = (toc_key,)
         else:
             raise NotImplementedError
 
         try:
             cur = self._get_cursor()
-            cur.execute(query, (argument,))
+            cur.execute(query, arguments)
             results = cur.fetchall()
 
         except sqlite3.OperationalError as exc:  # pragma: no cover
@@ -0,0 +1,185 @@
+#! /usr/bin/env python
+"""Cache for the results of prep endpoints."""
+from __future__ import annotations
+
+import hashlib
+import importlib.metadata
+import json
+import sqlite3
+import threading
+import time
+import typing
+from datetime import timedelta
+from pathlib import Path
+
+import colrev.record.record
+from colrev.constants import Fields
+from colrev.constants import Filepaths
+from colrev.constants import RecordState
+
+# Note : only endpoints that opt in (cacheable = True) are cached.
+# Endpoints that link records to API feeds (prep_link_md) must not opt in:
+# a cache hit only replays the record changes (not the feed write),
+# and the cache is shared by all projects.
+# The cache stores the changes of a record (delta)
+# for the input record, the endpoint (identifier, settings, version).
+# Unchanged records are not cached
+# (e.g., errors may be caught by the endpoints and the record returned unchanged)
+
+
+def _get_package_version(endpoint: typing.Any) -> str:
+    package_name = type(endpoint).__module__.split(".")[0]
+    try:
+        return importlib.metadata.version(package_name)
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+class PrepCache:
+    """Cache for the record changes of prep endpoints (stored in the local environment)"""
+
+    max_age = timedelta(days=30)
+    # Maximum size of the deltas (in bytes)
+    max_size = 200 * 1024 * 1024
+    _commit_interval = 100
+
+    def __init__(self, *, cache_file: typing.Optional[Path] = None) -> None:
+        if cache_file is None:
+            cache_file = Filepaths.PREP_CACHE_FILE
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            str(cache_file), timeout=90, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS prep_cache "
+            "(key TEXT PRIMARY KEY, delta TEXT, size INTEGER, created REAL)"
+        )
+        self._connection.commit()
+        self._uncommitted = 0
+        self._versions: typing.Dict[type, str] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def is_cacheable(cls, endpoint: typing.Any) -> bool:
+        """Whether the endpoint opted in to the cache"""
+        return getattr(endpoint, "cacheable", False)
+
+    def get_key(
+        self,
+        *,
+        endpoint: typing.Any,
+        endpoint_settings: dict,
+        record: colrev.record.record.Record,
+    ) -> str:
+        """Get the key (endpoint, settings, version, and input record)"""
+        if type(endpoint) not in self._versions:
+            self._versions[type(endpoint)] = _get_package_version(endpoint)
+        key_str = json.dumps(
+            [endpoint_settings, self._versions[type(endpoint)], record.data],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(key_str.encode("utf-8")).hexdigest()
+
+    def get_delta(self, key: str) -> typing.Optional[dict]:
+        """Get the delta (None if it is not cached or expired)"""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT delta, created FROM prep_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or row[1] < time.time() - self.max_age.total_seconds():
+                self.misses += 1
+                return None
+            self.hits += 1
+        delta = json.loads(row[0])
+        if Fields.STATUS in delta["changed"]:
+            delta["changed"][Fields.STATUS] = RecordState[
+                delta["changed"][Fields.STATUS]
+            ]
+        return delta
+
+    def add_delta(
+        self,
+        key: str,
+        *,
+        prior: colrev.record.record.Record,
+        record: colrev.record.record.Record,
+    ) -> None:
+        """Add the changes from the prior to the record"""
+        delta = self.get_record_delta(prior=prior, record=record)
+        if not delta["changed"] and not delta["removed"]:
+            return
+        if Fields.STATUS in delta["changed"]:
+            delta["changed"][Fields.STATUS] = delta["changed"][Fields.STATUS].name
+        try:
+            delta_str = json.dumps(delta)
+        except TypeError:
+            # Values that cannot be restored from json (e.g., Paths) are not cached
+            return
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO prep_cache VALUES (?, ?, ?, ?)",
+                (key, delta_str, len(delta_str), time.time()),
+            )
+            self._uncommitted += 1
+            if self._uncommitted >= self._commit_interval:
+                self._connection.commit()
+                self._uncommitted = 0
+
+    @classmethod
+    def get_record_delta(
+        cls,
+        *,
+        prior: colrev.record.record.Record,
+        record: colrev.record.record.Record,
+    ) -> dict:
+        """Get the fields changed and removed by an endpoint"""
+        return {
+            "changed": {
+                key: value
+                for key, value in record.data.items()
+                if key not in prior.data or prior.data[key] != value
+            },
+            "removed": [key for key in prior.data if key not in record.data],
+        }
+
+    @classmethod
+    def apply_delta(cls, *, record: colrev.record.record.Record, delta: dict) -> None:
+        """Apply the delta to the record"""
+        record.data.update(delta["changed"])
+        for key in delta["removed"]:
+            record.data.pop(key, None)
+
+    def evict(self) -> None:
+        """Remove expired entries and the oldest entries exceeding the max_size"""
+        with self._lock:
+            self._connection.execute(
+                "DELETE FROM prep_cache WHERE created < ?",
+                (time.time() - self.max_age.total_seconds(),),
+            )
+            total_size = self._connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM prep_cache"
+            ).fetchone()[0]
+            if total_size > self.max_size:
+                cursor = self._connection.execute(
+                    "SELECT key, size FROM prep_cache ORDER BY created"
+                )
+                keys_to_remove = []
+                for key, size in cursor:
+                    if total_size <= self.max_size:
+                        break
+                    keys_to_remove.append((key,))
+                    total_size -= size
+                self._connection.executemany(
+                    "DELETE FROM prep_cache WHERE key = ?", keys_to_remove
+                )
+            self._connection.commit()
+            self._uncommitted = 0
+
+    def close(self) -> None:
+        """Evict entries and close the cache"""
+        self.evict()
+        self._connection.close()
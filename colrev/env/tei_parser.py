@@ -14,6 +14,7 @@ import colrev.env.grobid_service
 import colrev.exceptions as colrev_exceptions
 import colrev.process.operation
 import colrev.record.record
+import colrev.record.record_similarity
 from colrev.constants import ENTRYTYPES
 from colrev.constants import Fields
 from colrev.constants import RecordState
@@ -508,15 +509,14 @@ class TEIParser:
                             entrytype = ENTRYTYPES.BOOK
         return entrytype
 
-    def _get_tei_id_count(self, *, tei_id: str) -> int:
-        count = 0
-
+    def _get_intext_citations(self) -> typing.Dict[str, typing.List[Element]]:
+        """Get the in-text citation (ref) nodes per target (single pass)"""
+        intext_citations: typing.Dict[str, typing.List[Element]] = {}
         for reference in self.root.iter(self.ns["tei"] + "ref"):
-            if "target" in reference.keys():
-                if reference.get("target") == f"#{tei_id}":
-                    count += 1
-
-        return count
+            target = reference.get("target")
+            if target is not None:
+                intext_citations.setdefault(target, []).append(reference)
+        return intext_citations
 
     def _get_dict_from_reference(self, reference: Element) -> dict:
         entrytype = self._get_entrytype(reference)
@@ -564,6 +564,9 @@ class TEIParser:
 
         #  https://epidoc.stoa.org/gl/latest/ref-title.html
 
+        if add_intext_citation_count:
+            intext_citations = self._get_intext_citations()
+
         bibliographies = self.root.iter(self.ns["tei"] + "listBibl")
         tei_bib_db = []
         for bibliography in bibliographies:
@@ -571,7 +574,9 @@ class TEIParser:
                 ref_rec = self._get_dict_from_reference(reference)
 
                 if add_intext_citation_count:
-                    nr_citations = self._get_tei_id_count(tei_id=ref_rec[Fields.ID])
+                    nr_citations = len(
+                        intext_citations.get(f"#{ref_rec[Fields.ID]}", [])
+                    )
                     ref_rec[Fields.NR_INTEXT_CITATIONS] = nr_citations  # type: ignore
 
                 tei_bib_db.append(ref_rec)
@@ -601,40 +606,36 @@ class TEIParser:
     def mark_references(self, *, records: dict):  # type: ignore
         """Mark references with the additional record ID"""
 
-        tei_records = self.get_references()
-        for record_dict in tei_records:
-            if Fields.TITLE not in record_dict:
-                continue
+        tei_records = [r for r in self.get_references() if Fields.TITLE in r]
+        included_records = [
+            colrev.record.record.Record(record_dict)
+            for record_dict in records.values()
+            if record_dict[Fields.STATUS]
+            in [RecordState.rev_included, RecordState.rev_synthesized]
+        ]
+        most_similar_records = colrev.record.record_similarity.get_most_similar_records(
+            [colrev.record.record.Record(r) for r in tei_records],
+            included_records,
+            min_similarity=0.9,
+        )
 
-            max_sim = 0.9
-            max_sim_record = {}
-            for local_record_dict in records.values():
-                if local_record_dict[Fields.STATUS] not in [
-                    RecordState.rev_included,
-                    RecordState.rev_synthesized,
-                ]:
-                    continue
-                rec_sim = colrev.record.record.Record.get_record_similarity(
-                    colrev.record.record.Record(record_dict),
-                    colrev.record.record.Record(local_record_dict),
-                )
-                if rec_sim > max_sim:
-                    max_sim_record = local_record_dict
-                    max_sim = rec_sim
-            if len(max_sim_record) == 0:
+        bibliography: typing.Dict[str, typing.List[Element]] = {}
+        bibliography_node = self.root.find(f".//{self.ns['tei']}listBibl")
+        if bibliography_node is not None:
+            for ref in bibliography_node:
+                bibliography.setdefault(ref.get(f'{self.ns["w3"]}id'), []).append(ref)
+        intext_citations = self._get_intext_citations()
+        for record_dict, most_similar_record in zip(tei_records, most_similar_records):
+            if most_similar_record is None:
                 continue
 
             # Record found: mark in tei
-            bibliography = self.root.find(f".//{self.ns['tei']}listBibl")
             # mark reference in bibliography
-            for ref in bibliography:
-                if ref.get(f'{self.ns["w3"]}id') == record_dict[Fields.TEI_ID]:
-                    ref.set(Fields.ID, max_sim_record[Fields.ID])
+            for ref in bibliography.get(record_dict[Fields.TEI_ID], []):
+                ref.set(Fields.ID, most_similar_record.data[Fields.ID])
             # mark reference in in-text citations
-            for reference in self.root.iter(f'{self.ns["tei"]}ref'):
-                if "target" in reference.keys():
-                    if reference.get("target") == f"#{record_dict['tei_id']}":
-                        reference.set(Fields.ID, max_sim_record[Fields.ID])
+            for reference in intext_citations.get(f"#{record_dict['tei_id']}", []):
+                reference.set(Fields.ID, most_similar_record.data[Fields.ID])
 
             # if settings file available: dedupe_io match agains records
 
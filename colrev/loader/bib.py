@@ -8,10 +8,12 @@ import logging
 import os
 import re
 import string
+import tempfile
 import typing
 from pathlib import Path
 
 import pybtex.errors
+from pybtex.bibtex.utils import split_name_list
 from pybtex.database import Person
 from pybtex.database.input import bibtex
 
@@ -26,6 +28,51 @@ from colrev.constants import RecordState
 # pylint: disable=too-few-public-methods
 # pylint: disable=too-many-arguments
 
+# Patterns of the records.bib format (as written by colrev.writer.bib)
+_ENTRY_HEADER_RE = re.compile(r"^@([a-zA-Z]+)\{([^\s,;{}\"#%()=]+),\s*$")
+_FIELD_START_RE = re.compile(r"^\s*([^\s=,{}\"#%@]+)\s*=\s*\{")
+_WHITESPACE_RE = re.compile(r"\s+")
+_BIB_ENTRY_RE = re.compile(r"@.*{.*,")
+# Names in "Last, First" form (without braces/escapes) are returned unchanged
+# by pybtex and do not need to be parsed
+_SIMPLE_NAME_RE = re.compile(
+    r"^[^\s,{}\\~]+(?: [^\s,{}\\~]+)*, [^\s,{}\\~]+(?: [^\s,{}\\~]+)*$"
+)
+_NAME_SEPARATOR_RE = re.compile(r" and ", re.IGNORECASE)
+_PERSON_FIELDS = ["author", "editor"]
+
+
+class _NonStandardBibFormat(Exception):
+    """The file deviates from the records.bib format (requires pybtex)"""
+
+
+def _format_name(person: Person) -> str:
+    def join(name_list: list) -> str:
+        return " ".join([name for name in name_list if name])
+
+    first = person.get_part_as_text("first")
+    middle = person.get_part_as_text("middle")
+    prelast = person.get_part_as_text("prelast")
+    last = person.get_part_as_text("last")
+    lineage = person.get_part_as_text("lineage")
+    name_string = ""
+    if last:
+        name_string += join([prelast, last])
+    if lineage:
+        name_string += f", {lineage}"
+    if first or middle:
+        name_string += ", "
+        name_string += join([first, middle])
+    return name_string
+
+
+def _format_persons(value: str) -> str:
+    """Format a list of names in the same way as the pybtex-based parser"""
+    names = _NAME_SEPARATOR_RE.split(value)
+    if all(_SIMPLE_NAME_RE.match(name) for name in names):
+        return " and ".join(names)
+    return " and ".join(_format_name(Person(name)) for name in split_name_list(value))
+
 
 class BIBLoader(colrev.loader.loader.Loader):
     """Loads BibTeX files"""
@@ -40,6 +87,7 @@ class BIBLoader(colrev.loader.loader.Loader):
         field_mapper: typing.Callable = lambda x: x,
         id_labeler: typing.Callable = lambda x: x,
         logger: logging.Logger = logging.getLogger(__name__),
+        source: typing.Optional[typing.Union[str, typing.TextIO]] = None,
     ):
         super().__init__(
             filename=filename,
@@ -48,7 +96,9 @@ class BIBLoader(colrev.loader.loader.Loader):
             entrytype_setter=entrytype_setter,
             field_mapper=field_mapper,
             logger=logger,
+            source=source,
         )
+        self._candidate_ids: typing.Dict[str, typing.Iterator[str]] = {}
 
     @classmethod
     def get_nr_records(cls, filename: Path) -> int:
@@ -64,203 +114,178 @@ class BIBLoader(colrev.loader.loader.Loader):
         self,
         *,
         temp_id: str,
-        existing_ids: list,
+        existing_ids: typing.Set[str],
+    ) -> str:
+        """Get the next unique ID (existing_ids: lower-case IDs)"""
+
+        def get_candidate_ids() -> typing.Iterator[str]:
+            yield temp_id
+            for order in itertools.count(1):
+                for append in itertools.product(string.ascii_lowercase, repeat=order):
+                    yield temp_id + "".join(append)
+
+        # Note : IDs are not removed from existing_ids.
+        # Candidates that were skipped before do not have to be checked again.
+        candidate_ids = self._candidate_ids.setdefault(temp_id, get_candidate_ids())
+        next_unique_id = next(candidate_ids)
+        while next_unique_id.lower() in existing_ids:
+            next_unique_id = next(candidate_ids)
+        return next_unique_id
+
+    def _fix_line(
+        self,
+        line: str,
+        *,
+        record_ids: typing.Set[str],
+        record_ids_lower: typing.Set[str],
     ) -> str:
-        """Get the next unique ID"""
-
-        order = 0
-        letters = list(string.ascii_lowercase)
-        next_unique_id = temp_id
-        appends: list = []
-        while next_unique_id.lower() in [i.lower() for i in existing_ids]:
-            if len(appends) == 0:
-                order += 1
-                appends = list(itertools.product(letters, repeat=order))
-            next_unique_id = temp_id + "".join(list(appends.pop(0)))
-        temp_id = next_unique_id
-        return temp_id
 
-    def _apply_file_fixes(self) -> None:
-        # pylint: disable=too-many-statements
-
-        def fix_key(
-            file: typing.IO, line: bytes, replacement_line: bytes, seekpos: int
-        ) -> int:
-            self.logger.info(
-                f"Fix invalid key: \n{line.decode('utf-8')}"
-                f"{replacement_line.decode('utf-8')}"
+        def fix_key(line: str, replacement_line: str) -> str:
+            if replacement_line != line:
+                self.logger.info(f"Fix invalid key: \n{line}{replacement_line}")
+            return replacement_line
+
+        if "@" in line[:3]:
+            current_id = line[line.find("{") + 1 : line.rfind(",")]
+            if ";" in current_id:
+                line = fix_key(line, re.sub(r";", r"_", line))
+
+            # Fix IDs
+            line = fix_key(
+                line,
+                re.sub(
+                    r"^(@[a-zA-Z0-9]+\{[a-zA-Z0-9]+)\s([a-zA-Z0-9]+,)",
+                    r"\1_\2",
+                    line,
+                ),
             )
-            line = file.readline()
-            remaining = line + file.read()
-            file.seek(seekpos)
-            file.write(replacement_line)
-            seekpos = file.tell()
-            file.flush()
-            os.fsync(file)
-            file.write(remaining)
-            file.truncate()  # if the replacement is shorter...
-            file.seek(seekpos)
-            return seekpos
-
-        if self.filename is not None:
-
-            with open(self.filename, encoding="utf8") as bibtex_file:
-                contents = bibtex_file.read()
-                if len(contents) < 10:
-                    return
-                bib_r = re.compile(r"@.*{.*,", re.M)
-                if len(re.findall(bib_r, contents)) == 0:
-                    self.logger.error(f"Not a bib file? {self.filename.name}")
-                    raise colrev_exceptions.UnsupportedImportFormatError(self.filename)
-
-            # Errors to fix before pybtex loading:
-            # - set_incremental_ids (otherwise, not all records will be loaded)
-            # - fix_keys (keys containing white spaces)
-            record_ids: typing.List[str] = []
-            with open(self.filename, "r+b") as file:
-                seekpos = file.tell()
-                line = file.readline()
-                while line:
-                    if b"@" in line[:3]:
-                        current_id = line[line.find(b"{") + 1 : line.rfind(b",")]
-                        current_id_str = current_id.decode("utf-8").lstrip().rstrip()
-
-                        if any(x in current_id_str for x in [";"]):
-                            replacement_line = re.sub(
-                                r";",
-                                r"_",
-                                line.decode("utf-8"),
-                            ).encode("utf-8")
-                            seekpos = fix_key(file, line, replacement_line, seekpos)
-
-                        if current_id_str in record_ids:
-                            next_id = self._generate_next_unique_id(
-                                temp_id=current_id_str, existing_ids=record_ids
-                            )
-                            self.logger.info(
-                                f"Fix duplicate ID: {current_id_str} >> {next_id}"
-                            )
-
-                            replacement_line = (
-                                line.decode("utf-8")
-                                .replace(current_id.decode("utf-8"), next_id)
-                                .encode("utf-8")
-                            )
-
-                            line = file.readline()
-                            remaining = line + file.read()
-                            file.seek(seekpos)
-                            file.write(replacement_line)
-                            seekpos = file.tell()
-                            file.flush()
-                            os.fsync(file)
-                            file.write(remaining)
-                            file.truncate()  # if the replacement is shorter...
-                            file.seek(seekpos)
-
-                            record_ids.append(next_id)
-
-                        else:
-                            record_ids.append(current_id_str)
-
-                    # Fix keys
-                    if re.match(
-                        r"^\s*[a-zA-Z0-9]+\s+[a-zA-Z0-9]+\s*\=", line.decode("utf-8")
-                    ):
-                        replacement_line = re.sub(
-                            r"(^\s*)([a-zA-Z0-9]+)\s+([a-zA-Z0-9]+)(\s*\=)",
-                            r"\1\2_\3\4",
-                            line.decode("utf-8"),
-                        ).encode("utf-8")
-                        seekpos = fix_key(file, line, replacement_line, seekpos)
-
-                    # Fix IDs
-                    if re.match(
-                        r"^@[a-zA-Z0-9]+\{[a-zA-Z0-9]+\s[a-zA-Z0-9]+,",
-                        line.decode("utf-8"),
-                    ):
-                        replacement_line = re.sub(
-                            r"^(@[a-zA-Z0-9]+\{[a-zA-Z0-9]+)\s([a-zA-Z0-9]+,)",
-                            r"\1_\2",
-                            line.decode("utf-8"),
-                        ).encode("utf-8")
-                        seekpos = fix_key(file, line, replacement_line, seekpos)
-
-                    seekpos = file.tell()
-                    line = file.readline()
+
+            current_id = line[line.find("{") + 1 : line.rfind(",")]
+            current_id_str = current_id.lstrip().rstrip()
+            if current_id_str in record_ids:
+                next_id = self._generate_next_unique_id(
+                    temp_id=current_id_str, existing_ids=record_ids_lower
+                )
+                self.logger.info(f"Fix duplicate ID: {current_id_str} >> {next_id}")
+                line = line.replace(current_id, next_id)
+                current_id_str = next_id
+            record_ids.add(current_id_str)
+            record_ids_lower.add(current_id_str.lower())
+
+        # Fix keys
+        return fix_key(
+            line,
+            re.sub(
+                r"(^\s*)([a-zA-Z0-9]+)\s+([a-zA-Z0-9]+)(\s*\=)",
+                r"\1\2_\3\4",
+                line,
+            ),
+        )
+
+    def _fix_lines(
+        self, lines: typing.Iterable[str], *, fixed_file: typing.IO[str]
+    ) -> bool:
+        """Write the fixed lines to fixed_file and return whether a line was fixed"""
+
+        record_ids: typing.Set[str] = set()
+        record_ids_lower: typing.Set[str] = set()
+        self._candidate_ids = {}
+        is_bib_file, fixed = False, False
+        for line in lines:
+            if not is_bib_file and _BIB_ENTRY_RE.search(line):
+                is_bib_file = True
+            fixed_line = self._fix_line(
+                line, record_ids=record_ids, record_ids_lower=record_ids_lower
+            )
+            if fixed_line != line:
+                fixed = True
+            fixed_file.write(fixed_line)
+
+        if not is_bib_file:
+            self.logger.error(f"Not a bib file? {self.filename.name}")
+            raise colrev_exceptions.UnsupportedImportFormatError(self.filename)
+        return fixed
+
+    def _apply_file_fixes(self) -> None:
+        """Fix IDs and keys before pybtex loading (in a single pass)
+
+        Errors to fix:
+        - duplicate IDs (otherwise, not all records will be loaded)
+        - invalid IDs and keys (e.g., containing white spaces)
+
+        If necessary, the file is replaced by a repaired copy."""
+
+        if self.filename is None or self.filename.stat().st_size < 10:
+            return
+
+        # The repaired copy is written to a temporary file in the same directory
+        # (os.replace is atomic) and always removed if it is not used
+        fixed_filename: typing.Optional[Path] = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                "w",
+                encoding="utf8",
+                newline="",
+                dir=self.filename.parent,
+                prefix=f".{self.filename.name}.",
+                suffix=".fixed",
+                delete=False,
+            ) as fixed_file:
+                fixed_filename = Path(fixed_file.name)
+                with open(self.filename, encoding="utf8", newline="") as file:
+                    fixed = self._fix_lines(file, fixed_file=fixed_file)
+            if fixed:
+                os.replace(fixed_filename, self.filename)
+        finally:
+            if fixed_filename is not None:
+                fixed_filename.unlink(missing_ok=True)
+
+    def _get_fixed_source_string(self) -> str:
+        """Apply the fixes of _apply_file_fixes() to the source (in memory)"""
+
+        with self._open_source() as file:
+            content = file.read()
+        if len(content) < 10:
+            return content
+        fixed_file = io.StringIO()
+        self._fix_lines(io.StringIO(content), fixed_file=fixed_file)
+        return fixed_file.getvalue()
+
+    def _parse_field_value(self, *, key: str, value: str) -> typing.Any:
+        """Parse a (whitespace-normalized) field value to colrev standard"""
+        # Cast status to Enum
+        if key == Fields.STATUS:
+            return RecordState[value]
+        # DOIs are case insensitive -> use upper case.
+        if key == Fields.DOI:
+            return value.upper()
+        # Note : the following two lines are a temporary fix
+        # to converg colrev_origins to list items
+        if key == Fields.ORIGIN:
+            return [el.rstrip().lstrip() for el in value.split(";") if "" != el]
+        if key in FieldSet.LIST_FIELDS:
+            return [el.rstrip() for el in (value + " ").split("; ") if "" != el]
+        if key in [Fields.MD_PROV, Fields.D_PROV]:
+            return self._load_field_dict(value=value, field=key)
+        return value
 
     def _parse_records_dict(self, *, records_dict: dict) -> dict:
         """Parse a records_dict from pybtex to colrev standard"""
 
-        def format_name(person: Person) -> str:
-            def join(name_list: list) -> str:
-                return " ".join([name for name in name_list if name])
-
-            first = person.get_part_as_text("first")
-            middle = person.get_part_as_text("middle")
-            prelast = person.get_part_as_text("prelast")
-            last = person.get_part_as_text("last")
-            lineage = person.get_part_as_text("lineage")
-            name_string = ""
-            if last:
-                name_string += join([prelast, last])
-            if lineage:
-                name_string += f", {lineage}"
-            if first or middle:
-                name_string += ", "
-                name_string += join([first, middle])
-            return name_string
-
         # Need to concatenate fields and persons dicts
         # but pybtex is still the most efficient solution.
         records_dict = {
             k: {
                 **{Fields.ID: k},
                 **{Fields.ENTRYTYPE: v.type},
-                **dict(
-                    {
-                        # Cast status to Enum
-                        k: (
-                            RecordState[v]
-                            if (Fields.STATUS == k)
-                            # DOIs are case insensitive -> use upper case.
-                            else (
-                                v.upper()
-                                if (Fields.DOI == k)
-                                # Note : the following two lines are a temporary fix
-                                # to converg colrev_origins to list items
-                                else (
-                                    [
-                                        el.rstrip().lstrip()
-                                        for el in v.split(";")
-                                        if "" != el
-                                    ]
-                                    if k == Fields.ORIGIN
-                                    else (
-                                        [
-                                            el.rstrip()
-                                            for el in (v + " ").split("; ")
-                                            if "" != el
-                                        ]
-                                        if k in FieldSet.LIST_FIELDS
-                                        else (
-                                            self._load_field_dict(value=v, field=k)
-                                            if k in [Fields.MD_PROV, Fields.D_PROV]
-                                            else v
-                                        )
-                                    )
-                                )
-                            )
-                        )
-                        for k, v in v.fields.items()
-                    }
-                ),
-                **dict(
-                    {
-                        k: " and ".join(format_name(person) for person in persons)
-                        for k, persons in v.persons.items()
-                    }
-                ),
+                **{
+                    k: self._parse_field_value(key=k, value=v)
+                    for k, v in v.fields.items()
+                },
+                **{
+                    k: " and ".join(_format_name(person) for person in persons)
+                    for k, persons in v.persons.items()
+                },
             }
             for k, v in records_dict.items()
         }
@@ -324,6 +349,108 @@ class BIBLoader(colrev.loader.loader.Loader):
 
         return return_dict
 
+    def _add_parsed_field(
+        self, *, record: dict, seen_fields: set, key: str, value: str
+    ) -> None:
+        # Note : like pybtex, keep the first value of duplicated fields
+        if key.lower() in seen_fields:
+            return
+        seen_fields.add(key.lower())
+        if "}" in value:
+            # The closing brace must not close a brace opened before the value
+            depth = 0
+            for char in value:
+                if char == "{":
+                    depth += 1
+                elif char == "}":
+                    depth -= 1
+                    if depth < 0:
+                        raise _NonStandardBibFormat
+        value = _WHITESPACE_RE.sub(" ", value.strip())
+        if key.lower() in _PERSON_FIELDS:
+            value = _format_persons(value) if value else ""
+            if value:
+                record[key] = value
+            return
+        record[key] = self._parse_field_value(key=key, value=value)
+
+    # pylint: disable=too-many-branches
+    # pylint: disable=too-many-locals
+    # pylint: disable=too-many-statements
+    def _parse_records(self, file_object: typing.TextIO) -> typing.Iterator[dict]:
+        """Parse records in a single pass (records.bib format, as written by
+        colrev.writer.bib).
+
+        Raises _NonStandardBibFormat for files that require the pybtex parser
+        (e.g., @string macros, quoted values, or IDs that need to be fixed)."""
+
+        record_ids: typing.Set[str] = set()
+        record: typing.Optional[dict] = None
+        seen_fields: typing.Set[str] = set()
+        key, value_lines, depth = "", [], 0
+        for line in file_object:
+            if depth > 0:
+                # Continuation of a multi-line value
+                depth += line.count("{") - line.count("}")
+                if depth > 0:
+                    value_lines.append(line)
+                    continue
+                end = line.rfind("}")
+                if depth < 0 or line[end + 1 :].strip() not in ["", ","]:
+                    raise _NonStandardBibFormat
+                value_lines.append(line[:end])
+                self._add_parsed_field(
+                    record=record,  # type: ignore
+                    seen_fields=seen_fields,
+                    key=key,
+                    value="".join(value_lines),
+                )
+                continue
+
+            stripped = line.strip()
+            if record is None:
+                if stripped == "" or stripped[0] == "%":
+                    continue
+                header_match = _ENTRY_HEADER_RE.match(stripped)
+                if not header_match:
+                    raise _NonStandardBibFormat
+                entrytype, record_id = header_match.groups()
+                if entrytype.lower() in ["comment", "string", "preamble"]:
+                    raise _NonStandardBibFormat
+                # Duplicate IDs are fixed in _apply_file_fixes()
+                if record_id.lower() in record_ids:
+                    raise _NonStandardBibFormat
+                record_ids.add(record_id.lower())
+                record = {Fields.ID: record_id, Fields.ENTRYTYPE: entrytype.lower()}
+                seen_fields = set()
+                continue
+
+            if stripped == "}":
+                yield record
+                record = None
+                continue
+            if stripped == "":
+                continue
+
+            field_match = _FIELD_START_RE.match(line)
+            if not field_match:
+                raise _NonStandardBibFormat
+            key = field_match.group(1)
+            rest = line[field_match.end() :]
+            depth = 1 + rest.count("{") - rest.count("}")
+            if depth > 0:
+                value_lines = [rest]
+                continue
+            end = rest.rfind("}")
+            if depth < 0 or rest[end + 1 :].strip() not in ["", ","]:
+                raise _NonStandardBibFormat
+            self._add_parsed_field(
+                record=record, seen_fields=seen_fields, key=key, value=rest[:end]
+            )
+
+        if record is not None or depth > 0 or not record_ids:
+            raise _NonStandardBibFormat
+
     def _parse_k_v(self, item_string: str) -> tuple:
         if " = " in item_string:
             key, value = item_string.split(" = ", 1)
@@ -417,12 +544,30 @@ class BIBLoader(colrev.loader.loader.Loader):
 
     def get_record_header_items(self) -> dict:
         """Get the record header items"""
-        record_header_list = []
-        record_header_list = self._read_record_header_items()
+        with self._open_source() as file:
+            record_header_list = self._read_record_header_items(file_object=file)
 
         record_header_dict = {r[Fields.ID]: r for r in record_header_list}
         return record_header_dict
 
+    def _load_records_dict_native(self) -> dict:
+        with self._open_source() as file:
+            return {record[Fields.ID]: record for record in self._parse_records(file)}
+
+    def _load_records_dict_pybtex(self) -> dict:
+        if self.source is None:
+            self._apply_file_fixes()
+
+        temp_f = io.StringIO()
+        pybtex.io.stderr = temp_f
+        pybtex.errors.set_strict_mode(False)
+        parser = bibtex.Parser()
+        if self.source is None:
+            bib_data = parser.parse_file(str(self.filename))
+        else:
+            bib_data = parser.parse_string(self._get_fixed_source_string())
+        return self._parse_records_dict(records_dict=bib_data.entries)
+
     def load_records_list(self) -> list:
 
         def drop_empty_fields(*, records: dict) -> None:
@@ -456,14 +601,13 @@ class BIBLoader(colrev.loader.loader.Loader):
             for crossref_id in crossref_ids:
                 del records[crossref_id]
 
-        self._apply_file_fixes()
-
-        temp_f = io.StringIO()
-        pybtex.io.stderr = temp_f
-        pybtex.errors.set_strict_mode(False)
-        parser = bibtex.Parser()
-        bib_data = parser.parse_file(str(self.filename))
-        records = self._parse_records_dict(records_dict=bib_data.entries)
+        if self.source is not None and not isinstance(self.source, str):
+            # The pybtex fallback may have to read the source again
+            self.source = self.source.read()
+        try:
+            records = self._load_records_dict_native()
+        except _NonStandardBibFormat:
+            records = self._load_records_dict_pybtex()
 
         drop_empty_fields(records=records)
         resolve_crossref(records=records)
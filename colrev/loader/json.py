@@ -28,6 +28,7 @@ class JSONLoader(colrev.loader.loader.Loader):
         id_labeler: typing.Callable,
         unique_id_field: str = "",
         logger: logging.Logger = logging.getLogger(__name__),
+        source: typing.Optional[typing.Union[str, typing.TextIO]] = None,
     ):
         super().__init__(
             filename=filename,
@@ -36,6 +37,7 @@ class JSONLoader(colrev.loader.loader.Loader):
             entrytype_setter=entrytype_setter,
             field_mapper=field_mapper,
             logger=logger,
+            source=source,
         )
 
     @classmethod
@@ -49,7 +51,7 @@ class JSONLoader(colrev.loader.loader.Loader):
     def load_records_list(self) -> list:
         """Load json entries"""
 
-        with open(self.filename, encoding="utf-8-sig") as file:
+        with self._open_source(encoding="utf-8-sig") as file:
             records_list = json.load(file)
 
         return records_list
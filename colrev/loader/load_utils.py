@@ -130,22 +130,58 @@ Example json record:
 from __future__ import annotations
 
 import logging
-import tempfile
 import typing
 from pathlib import Path
 
 import colrev.loader.bib
 import colrev.loader.enl
 import colrev.loader.json
-import colrev.loader.md
+import colrev.loader.loader
 import colrev.loader.nbib
 import colrev.loader.ris
-import colrev.loader.table
 
 
 # pylint: disable=too-many-arguments
+# pylint: disable=import-outside-toplevel
 # flake8: noqa: E501
 
+# The table (pandas) and md (grobid) loaders are imported on demand
+# to keep the import of load_utils (and the CLI startup) light.
+
+
+def _get_table_loader() -> typing.Type[colrev.loader.loader.Loader]:
+    from colrev.loader.table import TableLoader
+
+    return TableLoader
+
+
+def _get_md_loader() -> typing.Type[colrev.loader.loader.Loader]:
+    from colrev.loader.md import MarkdownLoader
+
+    return MarkdownLoader
+
+
+_LOADERS: typing.Dict[
+    str, typing.Callable[[], typing.Type[colrev.loader.loader.Loader]]
+] = {
+    ".bib": lambda: colrev.loader.bib.BIBLoader,
+    ".csv": _get_table_loader,
+    ".xls": _get_table_loader,
+    ".xlsx": _get_table_loader,
+    ".ris": lambda: colrev.loader.ris.RISLoader,
+    ".enl": lambda: colrev.loader.enl.ENLLoader,
+    ".txt": lambda: colrev.loader.enl.ENLLoader,
+    ".md": _get_md_loader,
+    ".nbib": lambda: colrev.loader.nbib.NBIBLoader,
+    ".json": lambda: colrev.loader.json.JSONLoader,
+}
+
+
+def _get_parser(filename: Path) -> typing.Type[colrev.loader.loader.Loader]:
+    if filename.suffix not in _LOADERS:
+        raise NotImplementedError
+    return _LOADERS[filename.suffix]()
+
 
 def load(  # type: ignore
     filename: Path,
@@ -164,22 +200,7 @@ def load(  # type: ignore
             return {}
         raise FileNotFoundError
 
-    if filename.suffix == ".bib":
-        parser = colrev.loader.bib.BIBLoader  # type: ignore
-    elif filename.suffix in [".csv", ".xls", ".xlsx"]:
-        parser = colrev.loader.table.TableLoader  # type: ignore
-    elif filename.suffix == ".ris":
-        parser = colrev.loader.ris.RISLoader  # type: ignore
-    elif filename.suffix in [".enl", ".txt"]:
-        parser = colrev.loader.enl.ENLLoader  # type: ignore
-    elif filename.suffix == ".md":
-        parser = colrev.loader.md.MarkdownLoader  # type: ignore
-    elif filename.suffix == ".nbib":
-        parser = colrev.loader.nbib.NBIBLoader  # type: ignore
-    elif filename.suffix == ".json":
-        parser = colrev.loader.json.JSONLoader  # type: ignore
-    else:
-        raise NotImplementedError
+    parser = _get_parser(filename)
 
     return parser(
         filename=filename,
@@ -192,7 +213,7 @@ def load(  # type: ignore
 
 
 def loads(  # type: ignore
-    load_string: str,
+    load_string: typing.Union[str, typing.TextIO],
     *,
     implementation: str,
     entrytype_setter: typing.Callable = lambda x: x,
@@ -201,7 +222,7 @@ def loads(  # type: ignore
     unique_id_field: str = "",
     logger: logging.Logger = logging.getLogger(__name__),
 ) -> dict:
-    """Load a string and return records as a dictionary"""
+    """Load a string (or file-like object) and return records as a dictionary"""
 
     if implementation not in [
         "bib",
@@ -216,20 +237,19 @@ def loads(  # type: ignore
     ]:
         raise NotImplementedError
 
-    with tempfile.NamedTemporaryFile(
-        mode="wb", delete=False, suffix=f".{implementation}"
-    ) as temp_file:
-        temp_file.write(load_string.encode("utf-8"))
-        temp_file_path = Path(temp_file.name)
+    # The string is parsed in memory (the filename only determines the parser)
+    filename = Path(f"<string>.{implementation}")
+    parser = _get_parser(filename)
 
-    return load(
-        filename=temp_file_path,
+    return parser(
+        filename=filename,
         entrytype_setter=entrytype_setter,
         field_mapper=field_mapper,
         id_labeler=id_labeler,
         unique_id_field=unique_id_field,
         logger=logger,
-    )
+        source=load_string,
+    ).load()
 
 
 def get_nr_records(  # type: ignore
@@ -240,21 +260,6 @@ def get_nr_records(  # type: ignore
     if not filename.exists():
         return 0
 
-    if filename.suffix == ".bib":
-        parser = colrev.loader.bib.BIBLoader  # type: ignore
-    elif filename.suffix in [".csv", ".xls", ".xlsx"]:
-        parser = colrev.loader.table.TableLoader  # type: ignore
-    elif filename.suffix == ".ris":
-        parser = colrev.loader.ris.RISLoader  # type: ignore
-    elif filename.suffix in [".enl", ".txt"]:
-        parser = colrev.loader.enl.ENLLoader  # type: ignore
-    elif filename.suffix == ".md":
-        parser = colrev.loader.md.MarkdownLoader  # type: ignore
-    elif filename.suffix == ".nbib":
-        parser = colrev.loader.nbib.NBIBLoader  # type: ignore
-    elif filename.suffix == ".json":
-        parser = colrev.loader.json.JSONLoader  # type: ignore
-    else:
-        raise NotImplementedError
+    parser = _get_parser(filename)
 
     return parser.get_nr_records(filename)
@@ -1,5 +1,7 @@
 #! /usr/bin/env python
 """Convenience functions to load files (BiBTeX, RIS, CSV, etc.)"""
+import contextlib
+import io
 import logging
 import typing
 from pathlib import Path
@@ -23,8 +25,12 @@ class Loader:
         id_labeler: typing.Callable,
         unique_id_field: str,
         logger: logging.Logger,
+        source: typing.Optional[typing.Union[str, typing.TextIO]] = None,
     ):
         self.filename = filename
+        # If a source (string or file-like object) is provided,
+        # it is loaded instead of the file (filename is only used for messages)
+        self.source = source
         self.unique_id_field = unique_id_field
         assert id_labeler is not None or unique_id_field != ""
         self.id_labeler = id_labeler
@@ -33,6 +39,20 @@ class Loader:
 
         self.logger = logger
 
+    @contextlib.contextmanager
+    def _open_source(
+        self, *, encoding: str = "utf-8"
+    ) -> typing.Iterator[typing.TextIO]:
+        """Open the source (string, file-like object, or file) for reading"""
+        if isinstance(self.source, str):
+            # newline=None: translate line endings like open() does
+            yield io.StringIO(self.source, newline=None)
+        elif self.source is not None:
+            yield self.source
+        else:
+            with open(self.filename, encoding=encoding) as file:
+                yield file
+
     def _set_ids(self, records_list: list) -> None:
         if self.unique_id_field == "INCREMENTAL":
             for next_id, record_dict in enumerate(records_list, 1):
@@ -93,6 +113,11 @@ class Loader:
                 f"Record contains invalid keys: {error_fields},\n record: {error_cases}"
             )
 
+    @classmethod
+    def get_nr_records(cls, filename: Path) -> int:
+        """The get_nr_records must be implemented by the inheriting class"""
+        raise NotImplementedError  # pragma: no cover
+
     def load_records_list(self) -> list:
         """The load_records_list must be implemented by the inheriting class
         (e.g., for ris/bib/...)"""
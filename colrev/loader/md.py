@@ -30,6 +30,7 @@ class MarkdownLoader(colrev.loader.loader.Loader):
         id_labeler: typing.Callable,
         unique_id_field: str = "",
         logger: logging.Logger = logging.getLogger(__name__),
+        source: typing.Optional[typing.Union[str, typing.TextIO]] = None,
     ):
 
         super().__init__(
@@ -39,6 +40,7 @@ class MarkdownLoader(colrev.loader.loader.Loader):
             entrytype_setter=entrytype_setter,
             field_mapper=field_mapper,
             logger=logger,
+            source=source,
         )
 
     @classmethod
@@ -61,7 +63,7 @@ class MarkdownLoader(colrev.loader.loader.Loader):
         grobid_service = colrev.env.grobid_service.GrobidService()
 
         grobid_service.check_grobid_availability()
-        with open(self.filename, encoding="utf8") as file:
+        with self._open_source(encoding="utf8") as file:
             references = [line.rstrip() for line in file if "#" not in line[:2]]
 
         data = ""
@@ -38,6 +38,7 @@ class NBIBLoader(colrev.loader.loader.Loader):
         id_labeler: typing.Callable,
         unique_id_field: str = "",
         logger: logging.Logger = logging.getLogger(__name__),
+        source: typing.Optional[typing.Union[str, typing.TextIO]] = None,
     ):
         super().__init__(
             filename=filename,
@@ -46,6 +47,7 @@ class NBIBLoader(colrev.loader.loader.Loader):
             entrytype_setter=entrytype_setter,
             field_mapper=field_mapper,
             logger=logger,
+            source=source,
         )
 
         self.current: dict = {}
@@ -104,7 +106,8 @@ class NBIBLoader(colrev.loader.loader.Loader):
         # Note: skip-tags and unknown-tags can be handled
         # between load_nbib_entries and convert_to_records.
 
-        text = self.filename.read_text(encoding="utf-8")
+        with self._open_source() as file:
+            text = file.read()
         # clean_text?
         lines = text.split("\n")
         records_list = list(r for r in self._parse_lines(lines) if r)
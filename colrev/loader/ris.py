@@ -38,6 +38,7 @@ class RISLoader(colrev.loader.loader.Loader):
         id_labeler: typing.Callable,
         unique_id_field: str = "",
         logger: logging.Logger = logging.getLogger(__name__),
+        source: typing.Optional[typing.Union[str, typing.TextIO]] = None,
     ):
         super().__init__(
             filename=filename,
@@ -46,6 +47,7 @@ class RISLoader(colrev.loader.loader.Loader):
             entrytype_setter=entrytype_setter,
             field_mapper=field_mapper,
             logger=logger,
+            source=source,
         )
 
         self.current: dict = {}
@@ -121,8 +123,8 @@ class RISLoader(colrev.loader.loader.Loader):
         # its DEFAULT_LIST_TAGS can be extended with list fields that should be joined automatically
 
         if content == "":
-            content = self.filename.read_text(encoding="utf-8")
-            content = self._clean_text(content)
+            with self._open_source() as file:
+                content = self._clean_text(file.read())
 
         lines = content.split("\n")
         records_list = list(r for r in self._parse_lines(lines) if r)
@@ -2,6 +2,7 @@
 """Convenience functions to load tabular files (csv, xlsx)"""
 from __future__ import annotations
 
+import io
 import logging
 import typing
 from pathlib import Path
@@ -28,6 +29,7 @@ class TableLoader(colrev.loader.loader.Loader):
         id_labeler: typing.Callable,
         unique_id_field: str = "",
         logger: logging.Logger = logging.getLogger(__name__),
+        source: typing.Optional[typing.Union[str, typing.TextIO]] = None,
     ):
         super().__init__(
             filename=filename,
@@ -36,6 +38,7 @@ class TableLoader(colrev.loader.loader.Loader):
             entrytype_setter=entrytype_setter,
             field_mapper=field_mapper,
             logger=logger,
+            source=source,
         )
 
     @classmethod
@@ -49,12 +52,17 @@ class TableLoader(colrev.loader.loader.Loader):
         return count
 
     def load_records_list(self) -> list:
+        source: typing.Any = self.filename
+        if isinstance(self.source, str):
+            source = io.StringIO(self.source)
+        elif self.source is not None:
+            source = self.source
         try:
             if self.filename.name.endswith(".csv"):
-                data = pd.read_csv(self.filename)
+                data = pd.read_csv(source)
             elif self.filename.name.endswith((".xls", ".xlsx")):
                 data = pd.read_excel(
-                    self.filename, dtype=str
+                    source, dtype=str
                 )  # dtype=str to avoid type casting
 
         except pd.errors.ParserError as exc:  # pragma: no cover
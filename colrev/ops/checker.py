@@ -7,6 +7,7 @@ import re
 import sys
 import typing
 from importlib.metadata import version
+from multiprocessing.pool import ThreadPool
 from pathlib import Path
 
 import yaml
@@ -485,11 +486,13 @@ class Checker:
 
     def _retrieve_prior(self) -> dict:
         prior: dict = {Fields.STATUS: [], "persisted_IDs": []}
+        # Note : the header items (ID, origin, status) are sufficient
         prior_records = next(
-            self.review_manager.dataset.load_records_from_history(), {}
+            self.review_manager.dataset.load_records_from_history(header_only=True),
+            {},
         )
         for prior_record in prior_records.values():
-            for orig in prior_record[Fields.ORIGIN]:
+            for orig in prior_record.get(Fields.ORIGIN, []):
                 prior[Fields.STATUS].append([orig, prior_record[Fields.STATUS]])
                 if prior_record[Fields.STATUS] in RecordState.get_post_x_states(
                     state=RecordState.md_processed
@@ -610,30 +613,13 @@ class Checker:
 
         return status_data
 
-    def check_repo_basics(self) -> list:
-        """Calls data.main() to update the stats"""
-
-        data_operation = self.review_manager.get_data_operation(
-            notify_state_transition_operation=False
-        )
-        records_file = self.review_manager.paths.records
-        if records_file.is_file():
-            self.records = self.review_manager.dataset.load_records_dict()
-
-        check_scripts: list[dict[str, typing.Any]] = []
-        data_checks = [
-            {
-                "script": data_operation.main,
-                "params": {"records": self.records, "silent_mode": True},
-            },
-            {
-                "script": self.review_manager.update_status_yaml,
-                "params": {"records": self.records},
-            },
-        ]
-
-        check_scripts.extend(data_checks)
+    def _load_records(self) -> dict:
+        """Load the records (snapshot shared by the checks)"""
+        if not self.review_manager.paths.records.is_file():
+            return {}
+        return self.review_manager.dataset.load_records_dict()
 
+    def _run_checks(self, check_scripts: list) -> list:
         failure_items = []
         for check_script in check_scripts:
             try:
@@ -658,14 +644,36 @@ class Checker:
                 failure_items.append(f"{type(exc).__name__}: {exc}")
         return failure_items
 
-    def check_repo_extended(self) -> list:
-        """Calls all checks that require prior data (take longer)"""
+    def check_repo_basics(self, *, records: typing.Optional[dict] = None) -> list:
+        """Calls data.main() to update the stats
+
+        records: snapshot of the records (loaded if not provided)
+        """
+
+        data_operation = self.review_manager.get_data_operation(
+            notify_state_transition_operation=False
+        )
+        if records is None:
+            records = self._load_records()
+        self.records = records
 
-        # pylint: disable=not-a-mapping
+        check_scripts: list[dict[str, typing.Any]] = [
+            {
+                "script": data_operation.main,
+                "params": {"records": self.records, "silent_mode": True},
+            },
+            {
+                "script": self.review_manager.update_status_yaml,
+                "params": {"records": self.records},
+            },
+        ]
+        return self._run_checks(check_scripts)
+
+    def check_repo_extended(self, *, records: typing.Optional[dict] = None) -> list:
+        """Calls all checks that require prior data (take longer)
 
-        self.records: typing.Dict[str, typing.Any] = {}
-        if self.review_manager.paths.records.is_file():
-            self.records = self.review_manager.dataset.load_records_dict()
+        records: snapshot of the records (loaded if not provided)
+        """
 
         # We work with exceptions because each issue may be raised in different checks.
         # Currently, linting is limited for the scripts.
@@ -681,75 +689,67 @@ class Checker:
             {"script": self._check_software, "params": []},
         ]
 
-        if self.review_manager.paths.records.is_file():
-            if self.review_manager.dataset.file_in_history(
+        records_file_exists = self.review_manager.paths.records.is_file()
+        prior_in_history = (
+            records_file_exists
+            and self.review_manager.dataset.file_in_history(
                 self.review_manager.paths.RECORDS_FILE
-            ):
-                prior = self._retrieve_prior()
-                self.review_manager.logger.debug("prior")
-                self.review_manager.logger.debug(
-                    self.review_manager.p_printer.pformat(prior)
-                )
-            else:  # if RECORDS_FILE not yet in git history
-                prior = {}
+            )
+        )
 
-            status_data = self._retrieve_status_data(prior=prior, records=self.records)
+        # The prior records (last commit) are retrieved while the current records
+        # are loaded and the setup checks run (they do not depend on each other)
+        with ThreadPool(1) as pool:
+            prior_result = (
+                pool.apply_async(self._retrieve_prior) if prior_in_history else None
+            )
+            if records is None:
+                records = self._load_records()
+            self.records = records
+            failure_items = self._run_checks(check_scripts)
+            # if RECORDS_FILE not yet in git history: prior = {}
+            prior = prior_result.get() if prior_result else {}
 
-            main_refs_checks = [
-                {"script": self.check_sources, "params": []},
-            ]
-            # Note : duplicate record IDs are already prevented by pybtex...
-
-            if prior:  # if RECORDS_FILE in git history
-                main_refs_checks.extend(
-                    [
-                        {
-                            "script": self._check_colrev_origins,
-                            "params": {"status_data": status_data},
-                        },
-                        {
-                            "script": self._check_change_in_propagated_ids,
-                            "params": {"prior": prior, "status_data": status_data},
-                        },
-                        {
-                            "script": self.check_status_transitions,
-                            "params": {"status_data": status_data},
-                        },
-                        {
-                            "script": self._check_records_screen,
-                            "params": {"status_data": status_data},
-                        },
-                        {
-                            "script": self.check_fields,
-                            "params": {"status_data": status_data},
-                        },
-                    ]
-                )
+        if not records_file_exists:
+            return failure_items
 
-            check_scripts.extend(main_refs_checks)
+        self.review_manager.logger.debug("prior")
+        self.review_manager.logger.debug(self.review_manager.p_printer.pformat(prior))
 
-        failure_items = []
-        for check_script in check_scripts:
-            try:
-                if not check_script["params"]:
-                    check_script["script"]()
-                else:
-                    if isinstance(check_script["params"], list):
-                        check_script["script"](*check_script["params"])
-                    else:
-                        check_script["script"](**check_script["params"])
-            except (
-                colrev_exceptions.MissingDependencyError,
-                colrev_exceptions.GitConflictError,
-                colrev_exceptions.PropagatedIDChange,
-                colrev_exceptions.DuplicateIDsError,
-                colrev_exceptions.OriginError,
-                colrev_exceptions.FieldValueError,
-                colrev_exceptions.StatusTransitionError,
-                colrev_exceptions.UnstagedGitChangesError,
-                colrev_exceptions.StatusFieldValueError,
-            ) as exc:
-                failure_items.append(f"{type(exc).__name__}: {exc}")
+        status_data = self._retrieve_status_data(prior=prior, records=self.records)
+
+        main_refs_checks = [
+            {"script": self.check_sources, "params": []},
+        ]
+        # Note : duplicate record IDs are already prevented by pybtex...
+
+        if prior:  # if RECORDS_FILE in git history
+            main_refs_checks.extend(
+                [
+                    {
+                        "script": self._check_colrev_origins,
+                        "params": {"status_data": status_data},
+                    },
+                    {
+                        "script": self._check_change_in_propagated_ids,
+                        "params": {"prior": prior, "status_data": status_data},
+                    },
+                    {
+                        "script": self.check_status_transitions,
+                        "params": {"status_data": status_data},
+                    },
+                    {
+                        "script": self._check_records_screen,
+                        "params": {"status_data": status_data},
+                    },
+                    {
+                        "script": self.check_fields,
+                        "params": {"status_data": status_data},
+                    },
+                ]
+            )
+
+        failure_items.extend(self._run_checks(main_refs_checks))
         return failure_items
 
     def check_repo(self) -> dict:
@@ -757,9 +757,12 @@ class Checker:
         Entrypoint for pre-commit hooks
         """
 
+        # One snapshot of the records for all checks
+        # (the extended checks do not modify the records)
+        records = self._load_records()
         failure_items = []
-        failure_items.extend(self.check_repo_extended())
-        failure_items.extend(self.check_repo_basics())
+        failure_items.extend(self.check_repo_extended(records=records))
+        failure_items.extend(self.check_repo_basics(records=records))
 
         if failure_items:
             return {"status": ExitCodes.FAIL, "msg": "  " + "\n  ".join(failure_items)}
@@ -10,6 +10,7 @@ from pathlib import Path
 
 import colrev.exceptions as colrev_exceptions
 import colrev.process.operation
+import colrev.process.profiler
 import colrev.record.record_pdf
 from colrev.constants import Colors
 from colrev.constants import EndpointType
@@ -20,6 +21,7 @@ from colrev.constants import RecordState
 from colrev.writer.write_utils import write_file
 
 
+# pylint: disable=too-many-instance-attributes
 class PDFGet(colrev.process.operation.Operation):
     """Get the PDFs"""
 
@@ -34,6 +36,7 @@ class PDFGet(colrev.process.operation.Operation):
         *,
         review_manager: colrev.review_manager.ReviewManager,
         notify_state_transition_operation: bool = True,
+        profiler: typing.Optional[colrev.process.profiler.OperationProfiler] = None,
     ) -> None:
         super().__init__(
             review_manager=review_manager,
@@ -42,6 +45,11 @@ class PDFGet(colrev.process.operation.Operation):
         )
 
         self.package_manager = self.review_manager.get_package_manager()
+        # Note : the report is saved if a profiler is passed
+        self._profile_report = profiler is not None
+        self.profiler = profiler or colrev.process.profiler.OperationProfiler(
+            operation="pdf_get"
+        )
 
         pdf_dir = self.review_manager.paths.pdf
         pdf_dir.mkdir(exist_ok=True, parents=True)
@@ -189,37 +197,61 @@ class PDFGet(colrev.process.operation.Operation):
 
         record = colrev.record.record_pdf.PDFRecord(record_dict)
 
-        for (
-            pdf_get_package_endpoint
-        ) in self.review_manager.settings.pdf_get.pdf_get_package_endpoints:
+        # Note : the PDF analysis (endpoints and quality model) is closed on exit
+        with record, self.profiler.profile_record(record.data[Fields.ID]):
+            for (
+                pdf_get_package_endpoint
+            ) in self.review_manager.settings.pdf_get.pdf_get_package_endpoints:
 
-            pdf_get_class = self.package_manager.get_package_endpoint_class(
-                package_type=EndpointType.pdf_get,
-                package_identifier=pdf_get_package_endpoint["endpoint"],
-            )
-            endpoint = pdf_get_class(
-                pdf_get_operation=self, settings=pdf_get_package_endpoint
-            )
+                pdf_get_class = self.package_manager.get_package_endpoint_class(
+                    package_type=EndpointType.pdf_get,
+                    package_identifier=pdf_get_package_endpoint["endpoint"],
+                )
+                endpoint = pdf_get_class(
+                    pdf_get_operation=self, settings=pdf_get_package_endpoint
+                )
 
-            endpoint.get_pdf(record)  # type: ignore
+                with self.profiler.time_call(pdf_get_package_endpoint["endpoint"]):
+                    endpoint.get_pdf(record)  # type: ignore
 
-            if Fields.FILE in record.data:
-                self.review_manager.report_logger.info(
-                    f"{endpoint.settings.endpoint}"  # type: ignore
-                    f"({record.data[Fields.ID]}): retrieved .../"
-                    f"{Path(record.data[Fields.FILE]).name}"
-                )
-                break
+                if Fields.FILE in record.data:
+                    self.review_manager.report_logger.info(
+                        f"{endpoint.settings.endpoint}"  # type: ignore
+                        f"({record.data[Fields.ID]}): retrieved .../"
+                        f"{Path(record.data[Fields.FILE]).name}"
+                    )
+                    break
 
-        if Fields.FILE in record.data:
-            record.run_pdf_quality_model(self.pdf_qm, set_prepared=True)
-        else:
-            record.set_status(RecordState.pdf_needs_manual_retrieval)
+            if Fields.FILE in record.data:
+                record.run_pdf_quality_model(self.pdf_qm, set_prepared=True)
+            else:
+                record.set_status(RecordState.pdf_needs_manual_retrieval)
 
         self._log_infos(record)
 
         return record.get_data()
 
+    def _get_pdf_candidates(self, pdf_dir: Path) -> typing.Dict[Path, str]:
+        pdf_paths = list(pdf_dir.glob("**/*.pdf"))
+        colrev_pdf_ids = colrev.record.record_pdf.PDFRecord.get_colrev_pdf_ids(
+            pdf_paths
+        )
+        skipped_pdfs = [
+            pdf_path.relative_to(self.review_manager.path)
+            for pdf_path in pdf_paths
+            if pdf_path not in colrev_pdf_ids
+        ]
+        if skipped_pdfs:
+            self.review_manager.logger.warning(
+                f"{Colors.ORANGE}Skipped {len(skipped_pdfs)} PDFs "
+                f"(cannot create pdf-hash):{Colors.END}\n"
+                + "\n".join(f" {pdf_path}" for pdf_path in skipped_pdfs)
+            )
+        return {
+            pdf_path.relative_to(self.review_manager.path): colrev_pdf_id
+            for pdf_path, colrev_pdf_id in colrev_pdf_ids.items()
+        }
+
     def _relink_pdfs(
         self,
         records: typing.Dict[str, typing.Dict],
@@ -247,12 +279,7 @@ class PDFGet(colrev.process.operation.Operation):
             source_records = list(source_records_dict.values())
 
             self.review_manager.logger.info("Calculate colrev_pdf_ids")
-            pdf_candidates = {
-                pdf_candidate.relative_to(
-                    self.review_manager.path
-                ): colrev.record.record_pdf.PDFRecord.get_colrev_pdf_id(pdf_candidate)
-                for pdf_candidate in list(pdf_dir.glob("**/*.pdf"))
-            }
+            pdf_candidates = self._get_pdf_candidates(pdf_dir)
 
             for record in records.values():
                 if Fields.FILE not in record:
@@ -479,29 +506,16 @@ class PDFGet(colrev.process.operation.Operation):
     def _get_data(self) -> dict:
         # pylint: disable=duplicate-code
 
-        records_headers = self.review_manager.dataset.load_records_dict(
-            header_only=True
-        )
-        record_header_list = list(records_headers.values())
-
-        nr_tasks = len(
-            [
-                x
-                for x in record_header_list
-                if x[Fields.STATUS]
-                in [
-                    RecordState.pdf_needs_manual_retrieval,
-                    RecordState.rev_prescreen_included,
-                ]
-            ]
-        )
-
-        items = self.review_manager.dataset.read_next_record(
-            conditions=[
-                {Fields.STATUS: RecordState.rev_prescreen_included},
-                {Fields.STATUS: RecordState.pdf_needs_manual_retrieval},
-            ],
+        # Note : read only the selected records (based on the records index)
+        items = list(
+            self.review_manager.dataset.read_next_record(
+                conditions=[
+                    {Fields.STATUS: RecordState.rev_prescreen_included},
+                    {Fields.STATUS: RecordState.pdf_needs_manual_retrieval},
+                ],
+            )
         )
+        nr_tasks = len(items)
 
         self.to_retrieve = nr_tasks
 
@@ -630,7 +644,8 @@ class PDFGet(colrev.process.operation.Operation):
                 "PDFs to get".ljust(38) + f'{pdf_get_data["nr_tasks"]} PDFs'
             )
 
-            pool = Pool(4)
+            # Note: profiles of records are captured sequentially
+            pool = Pool(1 if self.profiler.slowest else 4)
             retrieved_record_list = pool.map(self.get_pdf, pdf_get_data["items"])
             pool.close()
             pool.join()
@@ -641,6 +656,14 @@ class PDFGet(colrev.process.operation.Operation):
 
             self._print_stats(retrieved_record_list)
 
+            if self._profile_report:
+                report_file = self.profiler.save_report(
+                    path=self.review_manager.paths.profile
+                )
+                self.review_manager.logger.info(
+                    f"Profile saved to {report_file.relative_to(self.review_manager.path)}"
+                )
+
         # Note: rename should be after copy.
         # Note : do not pass records as an argument.
         if self.review_manager.settings.pdf_get.rename_pdfs:
@@ -5,7 +5,7 @@ from __future__ import annotations
 import multiprocessing as mp
 import os
 import shutil
-from multiprocessing.pool import ThreadPool as Pool
+import typing
 from pathlib import Path
 
 import requests
@@ -13,6 +13,7 @@ import requests
 import colrev.exceptions as colrev_exceptions
 import colrev.packages.grobid_tei.src.grobid_tei
 import colrev.process.operation
+import colrev.process.profiler
 import colrev.record.record_pdf
 from colrev.constants import Colors
 from colrev.constants import EndpointType
@@ -20,7 +21,80 @@ from colrev.constants import Fields
 from colrev.constants import OperationsType
 from colrev.constants import RecordState
 
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import colrev.review_manager
+
+# Note : pdf-prep endpoints are CPU-bound (pymupdf, hashing, quality model).
+# Records are therefore prepared in processes, each with its own
+# review_manager, endpoints and pymupdf state (set up in _init_pdf_prep_worker).
+_WORKER_PDF_PREP: typing.Optional[PDFPrep] = None
+
+# Number of chunks per process (balances the load when PDF sizes differ)
+CHUNKS_PER_CPU = 4
+
+
+def _init_pdf_prep_worker(args: tuple) -> None:
+    # pylint: disable=global-statement
+    # pylint: disable=import-outside-toplevel
+    global _WORKER_PDF_PREP
+    import colrev.review_manager
+
+    path_str, force_mode, high_level_operation = args
+
+    review_manager = colrev.review_manager.ReviewManager(
+        path_str=path_str,
+        force_mode=force_mode,
+        high_level_operation=high_level_operation,
+    )
+    _WORKER_PDF_PREP = PDFPrep(
+        review_manager=review_manager, notify_state_transition_operation=False, cpu=1
+    )
+    _WORKER_PDF_PREP.load_package_endpoints()
+
+
+# Note : no named arguments (multiprocessing)
+def _prepare_pdf_chunk(chunk: list) -> typing.Tuple[list, dict]:
+    assert _WORKER_PDF_PREP is not None
+    records = [_WORKER_PDF_PREP.prepare_pdf(item) for item in chunk]
+    # The profile of the worker is merged by the main process
+    return records, _WORKER_PDF_PREP.profiler.pop_state()
+
+
+def get_pdf_prep_chunks(
+    items: list, *, nr_chunks: int, path: Path
+) -> typing.List[list]:
+    """Split the items into chunks of similar (total) PDF size
+
+    The largest PDFs are assigned first (to the chunk with the smallest total)
+    and the chunks are returned in descending order of size so that
+    long-running chunks are scheduled first."""
+
+    def get_size(item: dict) -> int:
+        pdf_path = path / Path(item["record"].get(Fields.FILE, ""))
+        return pdf_path.stat().st_size if pdf_path.is_file() else 0
+
+    nr_chunks = max(1, min(nr_chunks, len(items)))
+    chunks: typing.List[list] = [[] for _ in range(nr_chunks)]
+    chunk_sizes = [0] * nr_chunks
+    for size, item in sorted(
+        ((get_size(item), item) for item in items),
+        key=lambda x: x[0],
+        reverse=True,
+    ):
+        smallest = chunk_sizes.index(min(chunk_sizes))
+        chunks[smallest].append(item)
+        chunk_sizes[smallest] += size
+
+    return [
+        chunk
+        for _, chunk in sorted(
+            zip(chunk_sizes, chunks), key=lambda x: x[0], reverse=True
+        )
+        if chunk
+    ]
+
 
+# pylint: disable=too-many-instance-attributes
 class PDFPrep(colrev.process.operation.Operation):
     """Prepare PDFs"""
 
@@ -32,12 +106,15 @@ class PDFPrep(colrev.process.operation.Operation):
 
     type = OperationsType.pdf_prep
 
+    # pylint: disable=too-many-arguments
     def __init__(
         self,
         *,
         review_manager: colrev.review_manager.ReviewManager,
         reprocess: bool = False,
         notify_state_transition_operation: bool = True,
+        cpu: typing.Optional[int] = None,
+        profiler: typing.Optional[colrev.process.profiler.OperationProfiler] = None,
     ) -> None:
         super().__init__(
             review_manager=review_manager,
@@ -47,10 +124,17 @@ class PDFPrep(colrev.process.operation.Operation):
 
         self.reprocess = reprocess
 
-        self.cpus = 4
+        # Note : default: all cores (processes)
+        self.cpus = max(1, cpu or mp.cpu_count())
 
         self.pdf_qm = self.review_manager.get_pdf_qm()
 
+        # Note : the report is saved if a profiler is passed
+        self._profile_report = profiler is not None
+        self.profiler = profiler or colrev.process.profiler.OperationProfiler(
+            operation="pdf_prep"
+        )
+
     def _complete_successful_pdf_prep(
         self, *, record: colrev.record.record.Record, original_filename: str
     ) -> None:
@@ -134,65 +218,71 @@ class PDFPrep(colrev.process.operation.Operation):
             return record_dict
 
         record = colrev.record.record_pdf.PDFRecord(record_dict)
-        if record_dict[Fields.FILE].endswith(".pdf"):
-            record.set_text_from_pdf()
         original_filename = record_dict[Fields.FILE]
 
         self.review_manager.logger.debug(f"Start PDF prep of {record_dict[Fields.ID]}")
         # Note: if there are problems
         # colrev_status is set to pdf_needs_manual_preparation
         # if it remains 'imported', all preparation checks have passed
-        detailed_msgs = []
-        for (
-            pdf_prep_package_endpoint
-        ) in self.review_manager.settings.pdf_prep.pdf_prep_package_endpoints:
-            try:
-                if (
-                    pdf_prep_package_endpoint["endpoint"]
-                    not in self.pdf_prep_package_endpoints
-                ):
-                    self.review_manager.logger.error(
-                        f'Skip {pdf_prep_package_endpoint["endpoint"]} (not available)'
+        # Note : the PDF analysis (shared by endpoints and checkers) is closed on exit
+        with record, self.profiler.profile_record(record_dict[Fields.ID]):
+            if record_dict[Fields.FILE].endswith(".pdf"):
+                record.set_text_from_pdf()
+            detailed_msgs = []
+            for (
+                pdf_prep_package_endpoint
+            ) in self.review_manager.settings.pdf_prep.pdf_prep_package_endpoints:
+                try:
+                    if (
+                        pdf_prep_package_endpoint["endpoint"]
+                        not in self.pdf_prep_package_endpoints
+                    ):
+                        self.review_manager.logger.error(
+                            f'Skip {pdf_prep_package_endpoint["endpoint"]} (not available)'
+                        )
+                        continue
+                    endpoint = self.pdf_prep_package_endpoints[
+                        pdf_prep_package_endpoint["endpoint"]  # type: ignore
+                    ]
+
+                    msg = f"{endpoint.settings.endpoint}({record.data[Fields.ID]}):"
+                    self.review_manager.logger.debug(
+                        msg.ljust(50, " ") + "called"  # type: ignore
                     )
-                    continue
-                endpoint = self.pdf_prep_package_endpoints[
-                    pdf_prep_package_endpoint["endpoint"]  # type: ignore
-                ]
-
-                msg = f"{endpoint.settings.endpoint}({record.data[Fields.ID]}):"
-                self.review_manager.logger.debug(
-                    msg.ljust(50, " ") + "called"  # type: ignore
-                )
 
-                record.data = endpoint.prep_pdf(record, pad)  # type: ignore
-            except colrev_exceptions.PDFHashError:
-                record.add_field_provenance_note(key=Fields.FILE, note="pdf-hash-error")
+                    with self.profiler.time_call(pdf_prep_package_endpoint["endpoint"]):
+                        record.data = endpoint.prep_pdf(record, pad)  # type: ignore
+                except colrev_exceptions.PDFHashError:
+                    record.add_field_provenance_note(
+                        key=Fields.FILE, note="pdf-hash-error"
+                    )
 
-            except (
-                colrev_exceptions.InvalidPDFException,
-                colrev_exceptions.TEIException,
-                requests.exceptions.ReadTimeout,
-            ) as err:
-                self.review_manager.logger.error(
-                    f"Error for {record.data[Fields.ID]} "  # type: ignore
-                    f"(in {endpoint.settings.endpoint} : {err})"  # type: ignore
-                )
-                record.set_status(RecordState.pdf_needs_manual_preparation)
+                except (
+                    colrev_exceptions.InvalidPDFException,
+                    colrev_exceptions.TEIException,
+                    requests.exceptions.ReadTimeout,
+                ) as err:
+                    self.review_manager.logger.error(
+                        f"Error for {record.data[Fields.ID]} "  # type: ignore
+                        f"(in {endpoint.settings.endpoint} : {err})"  # type: ignore
+                    )
+                    record.set_status(RecordState.pdf_needs_manual_preparation)
 
-            failed = (
-                RecordState.pdf_needs_manual_preparation == record.data[Fields.STATUS]
-            )
+                failed = (
+                    RecordState.pdf_needs_manual_preparation
+                    == record.data[Fields.STATUS]
+                )
 
-            if failed:
-                msg_str = f"{endpoint.settings.endpoint}"  # type: ignore
-                msg_str = msg_str.replace("colrev.", "")
-                detailed_msgs.append(f"{Colors.ORANGE}{msg_str}{Colors.END}")
+                if failed:
+                    msg_str = f"{endpoint.settings.endpoint}"  # type: ignore
+                    msg_str = msg_str.replace("colrev.", "")
+                    detailed_msgs.append(f"{Colors.ORANGE}{msg_str}{Colors.END}")
 
-            # Note: if we break, the teis will not be generated.
-            # if failed:
-            #     break
+                # Note: if we break, the teis will not be generated.
+                # if failed:
+                #     break
 
-        record.run_pdf_quality_model(self.pdf_qm, set_prepared=True)
+            record.run_pdf_quality_model(self.pdf_qm, set_prepared=True)
 
         # Each pdf_prep_package_endpoint can create a new file
         # previous/temporary pdfs are deleted when the process is successful
@@ -272,29 +362,85 @@ class PDFPrep(colrev.process.operation.Operation):
 
         self.review_manager.dataset.save_records_dict(records)
 
-    # Note : no named arguments (multiprocessing)
-    def _update_colrev_pdf_ids(self, record_dict: dict) -> dict:
-        if Fields.FILE in record_dict:
-            pdf_path = self.review_manager.path / Path(record_dict[Fields.FILE])
-            record_dict.update(
-                colrev_pdf_id=colrev.record.record_pdf.PDFRecord.get_colrev_pdf_id(
-                    pdf_path
-                )
-            )
-        return record_dict
-
     def update_colrev_pdf_ids(self) -> None:
         """Update the colrev-pdf-ids"""
         self.review_manager.logger.info("Update colrev_pdf_ids")
         records = self.review_manager.dataset.load_records_dict()
-        pool = Pool(self.cpus)
-        records_list = pool.map(self._update_colrev_pdf_ids, records.values())
-        pool.close()
-        pool.join()
-        records = {r[Fields.ID]: r for r in records_list}
+        pdf_paths = {
+            record_id: self.review_manager.path / Path(r[Fields.FILE])
+            for record_id, r in records.items()
+            if Fields.FILE in r
+        }
+        colrev_pdf_ids = colrev.record.record_pdf.PDFRecord.get_colrev_pdf_ids(
+            list(pdf_paths.values()), cpu=self.cpus
+        )
+        for record_id, pdf_path in pdf_paths.items():
+            if pdf_path in colrev_pdf_ids:
+                records[record_id].update(colrev_pdf_id=colrev_pdf_ids[pdf_path])
         self.review_manager.dataset.save_records_dict(records)
         self.review_manager.dataset.create_commit(msg="Update colrev_pdf_ids")
 
+    def load_package_endpoints(self) -> None:
+        """Load the pdf-prep package endpoints (based on the settings)"""
+        package_manager = self.review_manager.get_package_manager()
+        self.pdf_prep_package_endpoints = {}
+        for (
+            pdf_prep_package_endpoint
+        ) in self.review_manager.settings.pdf_prep.pdf_prep_package_endpoints:
+
+            pdf_prep_class = package_manager.get_package_endpoint_class(
+                package_type=EndpointType.pdf_prep,
+                package_identifier=pdf_prep_package_endpoint["endpoint"],
+            )
+            self.pdf_prep_package_endpoints[pdf_prep_package_endpoint["endpoint"]] = (
+                pdf_prep_class(
+                    pdf_prep_operation=self, settings=pdf_prep_package_endpoint
+                )
+            )
+
+    def _get_nr_processes(self) -> int:
+        if self.profiler.slowest:
+            # Profiles of records are captured sequentially (in the main process)
+            return 1
+        endpoint_names = [
+            s["endpoint"]
+            for s in self.review_manager.settings.pdf_prep.pdf_prep_package_endpoints
+        ]
+        if "colrev.grobid_tei" in endpoint_names:
+            # The GROBID service (Docker) requires resources
+            return max(1, min(self.cpus, mp.cpu_count() // 2))
+        return self.cpus
+
+    def _prepare_pdfs(self, items: list) -> list:
+        """Prepare the PDFs in processes (records are merged by the caller)"""
+        nr_processes = min(self._get_nr_processes(), len(items))
+        if nr_processes <= 1:
+            return [self.prepare_pdf(item) for item in items]
+
+        chunks = get_pdf_prep_chunks(
+            items,
+            nr_chunks=nr_processes * CHUNKS_PER_CPU,
+            path=self.review_manager.path,
+        )
+        pdf_prep_record_list = []
+        with mp.Pool(
+            nr_processes,
+            initializer=_init_pdf_prep_worker,
+            initargs=(
+                (
+                    str(self.review_manager.path),
+                    self.review_manager.force_mode,
+                    self.review_manager.high_level_operation,
+                ),
+            ),
+        ) as pool:
+            for records, profile_state in pool.imap_unordered(
+                _prepare_pdf_chunk, chunks
+            ):
+                pdf_prep_record_list.extend(records)
+                self.profiler.merge_state(profile_state)
+        return pdf_prep_record_list
+
     def _print_stats(self, *, pdf_prep_record_list: list) -> None:
         self.pdf_prepared = len(
             [
@@ -373,10 +519,8 @@ class PDFPrep(colrev.process.operation.Operation):
                 continue
             self.review_manager.logger.info(record_dict[Fields.ID])
             try:
-                endpoint.prep_pdf(
-                    record=colrev.record.record_pdf.PDFRecord(record_dict),
-                    pad=0,
-                )
+                with colrev.record.record_pdf.PDFRecord(record_dict) as record:
+                    endpoint.prep_pdf(record=record, pad=0)
             except colrev_exceptions.TEIException:
                 self.review_manager.logger.error("Error generating TEI")
 
@@ -418,21 +562,7 @@ class PDFPrep(colrev.process.operation.Operation):
 
         pdf_prep_data = self._get_data(batch_size=batch_size)
 
-        package_manager = self.review_manager.get_package_manager()
-        self.pdf_prep_package_endpoints = {}
-        for (
-            pdf_prep_package_endpoint
-        ) in self.review_manager.settings.pdf_prep.pdf_prep_package_endpoints:
-
-            pdf_prep_class = package_manager.get_package_endpoint_class(
-                package_type=EndpointType.pdf_prep,
-                package_identifier=pdf_prep_package_endpoint["endpoint"],
-            )
-            self.pdf_prep_package_endpoints[pdf_prep_package_endpoint["endpoint"]] = (
-                pdf_prep_class(
-                    pdf_prep_operation=self, settings=pdf_prep_package_endpoint
-                )
-            )
+        self.load_package_endpoints()
 
         self.review_manager.logger.info(
             "PDFs to prep".ljust(38) + f'{pdf_prep_data["nr_tasks"]} PDFs'
@@ -447,17 +577,7 @@ class PDFPrep(colrev.process.operation.Operation):
                 )
 
         else:
-            endpoint_names = [
-                s["endpoint"]
-                for s in self.review_manager.settings.pdf_prep.pdf_prep_package_endpoints
-            ]
-            if "colrev.grobid_tei" in endpoint_names:  # type: ignore
-                pool = Pool(mp.cpu_count() // 2)
-            else:
-                pool = Pool(self.cpus)
-            pdf_prep_record_list = pool.map(self.prepare_pdf, pdf_prep_data["items"])
-            pool.close()
-            pool.join()
+            pdf_prep_record_list = self._prepare_pdfs(pdf_prep_data["items"])
 
             self.review_manager.dataset.save_records_dict(
                 {r[Fields.ID]: r for r in pdf_prep_record_list}, partial=True
@@ -465,6 +585,14 @@ class PDFPrep(colrev.process.operation.Operation):
 
             self._print_stats(pdf_prep_record_list=pdf_prep_record_list)
 
+        if self._profile_report:
+            report_file = self.profiler.save_report(
+                path=self.review_manager.paths.profile
+            )
+            self.review_manager.logger.info(
+                f"Profile saved to {report_file.relative_to(self.review_manager.path)}"
+            )
+
         # Note: for formatting...
         records = self.review_manager.dataset.load_records_dict()
         self.review_manager.dataset.save_records_dict(records)
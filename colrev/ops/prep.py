@@ -2,15 +2,15 @@
 """CoLRev prep operation: Prepare record metadata."""
 from __future__ import annotations
 
+import contextlib
 import inspect
 import logging
 import multiprocessing as mp
 import random
 import shutil
+import threading
 import typing
 from copy import deepcopy
-from datetime import datetime
-from datetime import timedelta
 from multiprocessing import Lock
 from multiprocessing import Value
 from multiprocessing.pool import ThreadPool as Pool
@@ -19,10 +19,13 @@ from pathlib import Path
 from requests.exceptions import ConnectionError as requests_ConnectionError
 from requests.exceptions import ReadTimeout
 
+import colrev.env.prep_cache
 import colrev.env.utils
 import colrev.exceptions as colrev_exceptions
 import colrev.loader.load_utils
+import colrev.ops.search_api_feed
 import colrev.process.operation
+import colrev.process.profiler
 import colrev.record.record_prep
 from colrev.constants import Colors
 from colrev.constants import DefectCodes
@@ -50,6 +53,7 @@ class PreparationBreak(Exception):
 
 
 # pylint: disable=duplicate-code
+# pylint: disable=too-many-lines
 FIELDS_TO_KEEP = FieldSet.STANDARDIZED_FIELD_KEYS + [
     Fields.DBLP_KEY,
     Fields.SEMANTIC_SCHOLAR_ID,
@@ -64,6 +68,11 @@ class Prep(colrev.process.operation.Operation):
 
     timeout = 30
     max_retries_on_error = 3
+    feed_batch_size = 100
+    # Endpoints that require the network (requires_network) can run
+    # concurrently on more records than cpu-bound endpoints
+    network_concurrency_per_cpu = 4
+    max_network_concurrency = 20
     pad: int = 0
 
     first_round: bool
@@ -78,6 +87,7 @@ class Prep(colrev.process.operation.Operation):
 
     type = OperationsType.prep
 
+    # pylint: disable=too-many-arguments
     def __init__(
         self,
         *,
@@ -85,6 +95,8 @@ class Prep(colrev.process.operation.Operation):
         notify_state_transition_operation: bool,
         polish: bool,
         cpu: int,
+        prep_cache: bool = False,
+        profiler: typing.Optional[colrev.process.profiler.OperationProfiler] = None,
     ) -> None:
         super().__init__(
             review_manager=review_manager,
@@ -95,9 +107,19 @@ class Prep(colrev.process.operation.Operation):
             FIELDS_TO_KEEP + self.review_manager.settings.prep.fields_to_keep
         )
 
-        self._stats: typing.Dict[str, typing.List[timedelta]] = {}
+        # Note : the report is saved if a profiler is passed
+        self._profile_report = profiler is not None
+        self.profiler = profiler or colrev.process.profiler.OperationProfiler(
+            operation="prep"
+        )
+        # Concurrency budgets for cpu and network endpoints (set when running in parallel)
+        self._endpoint_budgets: typing.Dict[
+            str, colrev.process.profiler.ProfiledLock
+        ] = {}
 
-        self.temp_prep_lock = Lock()
+        self.temp_prep_lock = colrev.process.profiler.ProfiledLock(
+            Lock(), name="temp_prep_lock"
+        )
         self.current_temp_records = self.review_manager.path / Path(
             ".colrev/cur_temp_recs.bib"
         )
@@ -109,54 +131,42 @@ class Prep(colrev.process.operation.Operation):
 
         self.polish = polish
         self._cpu = cpu
+        self._use_prep_cache = prep_cache
+        self._prep_cache: typing.Optional[colrev.env.prep_cache.PrepCache] = None
 
         # Note: for unit testing, we use a simple loop (instead of parallel)
         # to ensure that the IDs of feed records don't change
         unit_testing = "test_prep" == inspect.stack()[1][3]
         if unit_testing:
             self._cpu = 1
-
-    def _add_stats(
-        self, *, prep_round_package_endpoint: dict, start_time: datetime
-    ) -> None:
-        if prep_round_package_endpoint["endpoint"] not in self._stats:
-            self._stats[prep_round_package_endpoint["endpoint"]] = [
-                datetime.now() - start_time
-            ]
-        else:
-            self._stats[prep_round_package_endpoint["endpoint"]].append(
-                datetime.now() - start_time
-            )
+        # Note: profiles of records are captured sequentially
+        if self.profiler.slowest:
+            self._cpu = 1
 
     def _print_stats(self) -> None:
         if self.review_manager.verbose_mode:
-            print("Runtime statistics (averages)")
-            averaged_list = [
-                {
-                    "script": script,
-                    "average": sum(deltalist, timedelta(0)) / len(deltalist),
-                }
-                for script, deltalist in self._stats.items()
-            ]
+            print("Runtime statistics (averages, p95)")
             for item in sorted(
-                averaged_list,
-                key=lambda k: k["average"],  # type: ignore
+                self.profiler.get_endpoint_stats(),
+                key=lambda k: k["mean"],
                 reverse=True,
             ):
-                average_time_str = (
-                    f"{item['average'].seconds}."  # type: ignore
-                    f"{item['average'].microseconds}"  # type: ignore
-                )
-                average_time = float(average_time_str)
-                average_time = round(average_time, 2)
-                average_time_str = f"{average_time:.2f}"
                 print(
-                    f"{item['script']} ".ljust(50, " ")
+                    f"{item['endpoint']} ".ljust(50, " ")
                     + ":"
-                    + f"{average_time_str} s".rjust(10, " ")
+                    + f"{item['mean']:.2f} s".rjust(10, " ")
+                    + f"{item['p95']:.2f} s".rjust(10, " ")
                 )
             print()
 
+    def _save_profile(self) -> None:
+        if not self._profile_report:
+            return
+        report_file = self.profiler.save_report(path=self.review_manager.paths.profile)
+        self.review_manager.logger.info(
+            f"Profile saved to {report_file.relative_to(self.review_manager.path)}"
+        )
+
     def _print_diffs_for_debug(
         self,
         *,
@@ -166,6 +176,44 @@ class Prep(colrev.process.operation.Operation):
     ) -> None:
         pass  # this method can be replaced by inheriting class (for debugging)
 
+    def _get_endpoint_budget(self, endpoint: typing.Any) -> typing.ContextManager:
+        budget = "network" if getattr(endpoint, "requires_network", False) else "cpu"
+        return self._endpoint_budgets.get(budget, contextlib.nullcontext())
+
+    def _run_endpoint(
+        self,
+        endpoint: typing.Any,
+        *,
+        prep_round_package_endpoint: dict,
+        preparation_record: colrev.record.record_prep.PrepRecord,
+        prior: colrev.record.record_prep.PrepRecord,
+    ) -> colrev.record.record_prep.PrepRecord:
+        # Note: time waiting for the budget is recorded as a lock wait
+        endpoint_name = prep_round_package_endpoint["endpoint"]
+        if self._prep_cache is None or not self._prep_cache.is_cacheable(endpoint):
+            with self._get_endpoint_budget(endpoint), self.profiler.time_call(
+                endpoint_name
+            ):
+                return endpoint.prepare(preparation_record)
+
+        cache_key = self._prep_cache.get_key(
+            endpoint=endpoint,
+            endpoint_settings=prep_round_package_endpoint,
+            record=preparation_record,
+        )
+        delta = self._prep_cache.get_delta(cache_key)
+        if delta is not None:
+            with self.profiler.time_call(endpoint_name, cache_hit=True):
+                self._prep_cache.apply_delta(record=preparation_record, delta=delta)
+            return preparation_record
+
+        with self._get_endpoint_budget(endpoint), self.profiler.time_call(
+            endpoint_name, cache_hit=False
+        ):
+            preparation_record = endpoint.prepare(preparation_record)
+        self._prep_cache.add_delta(cache_key, prior=prior, record=preparation_record)
+        return preparation_record
+
     def _package_prep(
         self,
         prep_round_package_endpoint: dict,
@@ -185,11 +233,11 @@ class Prep(colrev.process.operation.Operation):
 
             prior = preparation_record.copy_prep_rec()
 
-            start_time = datetime.now()
-            preparation_record = endpoint.prepare(preparation_record)
-            self._add_stats(
-                start_time=start_time,
+            preparation_record = self._run_endpoint(
+                endpoint,
                 prep_round_package_endpoint=prep_round_package_endpoint,
+                preparation_record=preparation_record,
+                prior=prior,
             )
 
             self._print_diffs_for_debug(
@@ -211,10 +259,6 @@ class Prep(colrev.process.operation.Operation):
                 record.update_by_record(preparation_record)
                 raise PreparationBreak
         except ReadTimeout:
-            self._add_stats(
-                start_time=start_time,
-                prep_round_package_endpoint=prep_round_package_endpoint,
-            )
             if self.review_manager.verbose_mode:
                 self.review_manager.logger.error(
                     f" {Colors.RED}{record.data['ID']}".ljust(45)
@@ -223,10 +267,6 @@ class Prep(colrev.process.operation.Operation):
 
         except colrev_exceptions.ServiceNotAvailableException as exc:
             if self.review_manager.force_mode:
-                self._add_stats(
-                    start_time=start_time,
-                    prep_round_package_endpoint=prep_round_package_endpoint,
-                )
                 self.review_manager.logger.error(exc)
             else:
                 raise exc
@@ -493,45 +533,46 @@ class Prep(colrev.process.operation.Operation):
 
         record.require_prov()
 
-        # preparation_record changes with each endpoint and
-        # eventually replaces record (if md_prepared or endpoint.always_apply_changes)
-        preparation_record = record.copy_prep_rec()
-        prior_state = record.data[Fields.STATUS]
+        with self.profiler.profile_record(record.data[Fields.ID]):
+            # preparation_record changes with each endpoint and
+            # eventually replaces record (if md_prepared or endpoint.always_apply_changes)
+            preparation_record = record.copy_prep_rec()
+            prior_state = record.data[Fields.STATUS]
 
-        # Rerun quality model (in case there are manual prep changes)
-        preparation_record.change_entrytype(
-            new_entrytype=record.data[Fields.ENTRYTYPE], qm=self.quality_model
-        )
-        preparation_record.run_quality_model(
-            self.quality_model, set_prepared=not self.polish
-        )
+            # Rerun quality model (in case there are manual prep changes)
+            preparation_record.change_entrytype(
+                new_entrytype=record.data[Fields.ENTRYTYPE], qm=self.quality_model
+            )
+            preparation_record.run_quality_model(
+                self.quality_model, set_prepared=not self.polish
+            )
 
-        for prep_round_package_endpoint in deepcopy(
-            item["prep_round_package_endpoints"]
-        ):
-            try:
-                self._package_prep(
-                    prep_round_package_endpoint,
-                    record,
-                    preparation_record,
-                )
-                self._validate_record(
-                    record=record,
-                    prep_round_package_endpoint=prep_round_package_endpoint,
-                )
-                # Note: ServiceNotAvailableException should be ignored
-                # in the packages if review_manager.force_mode
-            except PreparationBreak:
-                break
-
-        self._post_package_prep(
-            record=record,
-            preparation_record=preparation_record,
-            item=item,
-            prior_state=prior_state,
-        )
+            for prep_round_package_endpoint in deepcopy(
+                item["prep_round_package_endpoints"]
+            ):
+                try:
+                    self._package_prep(
+                        prep_round_package_endpoint,
+                        record,
+                        preparation_record,
+                    )
+                    self._validate_record(
+                        record=record,
+                        prep_round_package_endpoint=prep_round_package_endpoint,
+                    )
+                    # Note: ServiceNotAvailableException should be ignored
+                    # in the packages if review_manager.force_mode
+                except PreparationBreak:
+                    break
 
-        self._save_to_temp(record)
+            self._post_package_prep(
+                record=record,
+                preparation_record=preparation_record,
+                item=item,
+                prior_state=prior_state,
+            )
+
+            self._save_to_temp(record)
 
         return record.get_data()
 
@@ -868,11 +909,25 @@ class Prep(colrev.process.operation.Operation):
         self, prep_round: colrev.settings.PrepRound
     ) -> mp.pool.ThreadPool:
         if self._prep_packages_ram_heavy(prep_round=prep_round):
-            pool = Pool(mp.cpu_count() // 2)
+            cpu = max(1, mp.cpu_count() // 2)
         else:
-            # Note : if we use too many CPUS,
-            # a "too many open files" exception is thrown
-            pool = Pool(self._cpu)
+            # Note : --cpu is optional (all cpus by default)
+            cpu = self._cpu or mp.cpu_count()
+        # Note : records are prepared by cpu + network threads.
+        # The budgets limit the number of endpoints running concurrently
+        # (if network requests are not limited, a "too many open files" exception is thrown)
+        network = min(
+            self.max_network_concurrency, self.network_concurrency_per_cpu * cpu
+        )
+        self._endpoint_budgets = {
+            "cpu": colrev.process.profiler.ProfiledLock(
+                threading.BoundedSemaphore(cpu), name="cpu_budget"
+            ),
+            "network": colrev.process.profiler.ProfiledLock(
+                threading.BoundedSemaphore(network), name="network_budget"
+            ),
+        }
+        pool = Pool(cpu + network)
         self.review_manager.logger.info(
             "Info: ✔ = quality-assured by CoLRev community curators"
         )
@@ -920,6 +975,54 @@ class Prep(colrev.process.operation.Operation):
         if self.review_manager.in_ci_environment():
             print("\n\n")
 
+    def _prefetch(self, preparation_data: list) -> None:
+        """Let the endpoints retrieve data for all records in batches
+        (optional prefetch method of the endpoints)"""
+        records = [
+            item["record"]
+            for item in preparation_data
+            if self._status_to_prepare(item["record"]) or self.polish
+        ]
+        if not records:
+            return
+        for endpoint_name, endpoint in self.prep_package_endpoints.items():
+            prefetch_function = getattr(endpoint, "prefetch", None)
+            if callable(prefetch_function):
+                self.review_manager.logger.debug(f"Prefetch {endpoint_name}")
+                prefetch_function(records=records)
+
+    def _prepare_records(
+        self, preparation_data: list, prep_round: colrev.settings.PrepRound
+    ) -> list:
+        self._prefetch(preparation_data)
+        if self._use_prep_cache:
+            self._prep_cache = colrev.env.prep_cache.PrepCache()
+        # Note: feeds linked in prep are kept in memory (shared by the threads)
+        # and saved after each batch of records (and at the end of the prep round)
+        with colrev.ops.search_api_feed.SearchAPIFeed.keep_resident():
+            pool = None if self._cpu == 1 else self._get_prep_pool(prep_round)
+            prepared_records = []
+            for record in (
+                pool.imap(self.prepare, preparation_data)
+                if pool
+                else map(self.prepare, preparation_data)
+            ):
+                prepared_records.append(record)
+                if len(prepared_records) % self.feed_batch_size == 0:
+                    colrev.ops.search_api_feed.SearchAPIFeed.flush_resident_feeds()
+            if pool:
+                pool.close()
+                pool.join()
+                self._endpoint_budgets = {}
+        if self._prep_cache is not None:
+            self.review_manager.logger.debug(
+                f"Prep cache: {self._prep_cache.hits} hits, "
+                f"{self._prep_cache.misses} misses"
+            )
+            self._prep_cache.close()
+            self._prep_cache = None
+        return prepared_records
+
     @colrev.process.operation.Operation.decorate()
     def main(self, *, keep_ids: bool = False) -> None:
         """Preparation of records (main entrypoint)"""
@@ -940,17 +1043,7 @@ class Prep(colrev.process.operation.Operation):
                     print()
                     return
 
-                if self._cpu == 1:
-                    # Note: preparation_data is not turned into a list of records.
-                    prepared_records = []
-                    for item in preparation_data:
-                        record = self.prepare(item)
-                        prepared_records.append(record)
-                else:
-                    pool = self._get_prep_pool(prep_round)
-                    prepared_records = pool.map(self.prepare, preparation_data)
-                    pool.close()
-                    pool.join()
+                prepared_records = self._prepare_records(preparation_data, prep_round)
 
                 self._complete_resumed_operation(prepared_records)
 
@@ -976,6 +1069,8 @@ class Prep(colrev.process.operation.Operation):
                 ) from exc
             raise exc
 
+        self._save_profile()
+
         if not keep_ids and not self.polish:
             self.review_manager.logger.info("Set record IDs")
             self.review_manager.dataset.set_ids()
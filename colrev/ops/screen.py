@@ -290,22 +290,22 @@ class Screen(colrev.process.operation.Operation):
         )
 
     def _print_stats(self, selected_record_ids: list) -> None:
-        records_headers = self.review_manager.dataset.load_records_dict(
-            header_only=True
-        )
+        # Note : read only the selected records (based on the records index)
+        records_headers = {
+            r[Fields.ID]: r
+            for r in self.review_manager.dataset.read_next_record(
+                conditions=[{Fields.ID: record_id} for record_id in selected_record_ids]
+            )
+        }
         screen_excluded = [
             r[Fields.ID]
             for r in records_headers.values()
-            if RecordState.rev_excluded == r[Fields.STATUS]
-            and not self.to_screen(r)
-            and r[Fields.ID] in selected_record_ids
+            if RecordState.rev_excluded == r[Fields.STATUS] and not self.to_screen(r)
         ]
         screen_included = [
             r[Fields.ID]
             for r in records_headers.values()
-            if RecordState.rev_included == r[Fields.STATUS]
-            and not self.to_screen(r)
-            and r[Fields.ID] in selected_record_ids
+            if RecordState.rev_included == r[Fields.STATUS] and not self.to_screen(r)
         ]
 
         if not screen_excluded and not screen_included:
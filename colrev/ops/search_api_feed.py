@@ -2,9 +2,13 @@
 """CoLRev search feed: store and update origin records and update main records."""
 from __future__ import annotations
 
+import contextlib
 import json
+import threading
 import time
+import typing
 from copy import deepcopy
+from pathlib import Path
 from random import randint
 
 import colrev.exceptions as colrev_exceptions
@@ -21,7 +25,6 @@ from colrev.writer.write_utils import to_string
 from colrev.writer.write_utils import write_file
 
 
-# Keep in mind the need for lock-mechanisms, e.g., in concurrent prep operations
 class SearchAPIFeed:
     """A feed managing results from API searches"""
 
@@ -31,6 +34,12 @@ class SearchAPIFeed:
     _nr_added: int = 0
     _nr_changed: int = 0
 
+    # Feeds that are kept in memory and shared by the prep threads
+    # (instead of loading and saving them for every linked record)
+    _keep_resident = False
+    _resident_feeds: typing.Dict[Path, SearchAPIFeed] = {}
+    _resident_feeds_lock = threading.Lock()
+
     def __init__(
         self,
         *,
@@ -71,6 +80,69 @@ class SearchAPIFeed:
         if not prep_mode:
             self.records = self.review_manager.dataset.load_records_dict()
 
+        self._lock = threading.RLock()
+        self._resident = False
+        self._unsaved_changes = False
+
+    @classmethod
+    def get_resident_feed(
+        cls,
+        *,
+        review_manager: colrev.review_manager.ReviewManager,
+        source_identifier: str,
+        search_source: colrev.settings.SearchSource,
+    ) -> typing.Optional[SearchAPIFeed]:
+        """Get the (shared) resident feed in prep mode.
+        Returns None if feeds are not kept resident (see keep_resident())."""
+
+        with cls._resident_feeds_lock:
+            if not cls._keep_resident:
+                return None
+            feed_path = review_manager.path / search_source.filename
+            if feed_path not in cls._resident_feeds:
+                feed = cls(
+                    review_manager=review_manager,
+                    source_identifier=source_identifier,
+                    search_source=search_source,
+                    update_only=False,
+                    prep_mode=True,
+                )
+                feed._resident = True
+                cls._resident_feeds[feed_path] = feed
+            return cls._resident_feeds[feed_path]
+
+    @classmethod
+    @contextlib.contextmanager
+    def keep_resident(cls) -> typing.Iterator[None]:
+        """Keep the feeds in memory (prep mode) and save them when exiting the context"""
+
+        with cls._resident_feeds_lock:
+            cls._keep_resident = True
+            cls._resident_feeds = {}
+        try:
+            yield
+        finally:
+            cls.flush_resident_feeds()
+            with cls._resident_feeds_lock:
+                cls._keep_resident = False
+                cls._resident_feeds = {}
+
+    @classmethod
+    def flush_resident_feeds(cls) -> None:
+        """Save the resident feeds with changes"""
+
+        with cls._resident_feeds_lock:
+            feeds = list(cls._resident_feeds.values())
+        for feed in feeds:
+            feed.flush()
+
+    def flush(self) -> None:
+        """Save the feed if it has unsaved changes (resident feeds)"""
+        with self._lock:
+            if self._unsaved_changes:
+                self._save(skip_print=True)
+                self._unsaved_changes = False
+
     def _load_feed(self) -> None:
         if not self.feed_file.is_file():
             self._available_ids = {}
@@ -424,6 +496,11 @@ class SearchAPIFeed:
 
     def add_update_record(self, retrieved_record: colrev.record.record.Record) -> bool:
         """Add or update a record in the api_search_feed and records"""
+        with self._lock:
+            self._unsaved_changes = True
+            return self._add_update_record(retrieved_record)
+
+    def _add_update_record(self, retrieved_record: colrev.record.record.Record) -> bool:
         self._prep_retrieved_record(retrieved_record)
         prev_feed_record = self._get_prev_feed_record(retrieved_record)
 
@@ -444,8 +521,15 @@ class SearchAPIFeed:
         return added
 
     def save(self, *, skip_print: bool = False) -> None:
-        """Save the feed file and records, printing post-run search infos."""
+        """Save the feed file and records, printing post-run search infos.
+        Resident feeds are saved when they are flushed."""
+
+        if self._resident:
+            return
+        with self._lock:
+            self._save(skip_print=skip_print)
 
+    def _save(self, *, skip_print: bool) -> None:
         if not skip_print and not self.prep_mode:
             self._print_post_run_search_infos()
 
@@ -115,6 +115,15 @@ class PrepInterface(
         """Flag indicating whether changes should always be applied
         (even if the colrev_status does not transition to md_prepared)"""
     )
+    requires_network = zope.interface.Attribute(
+        """Optional flag indicating that the endpoint mainly waits for network responses
+        (run within the network concurrency budget of the prep operation)"""
+    )
+    cacheable = zope.interface.Attribute(
+        """Optional flag indicating that the results only depend on the record
+        and the settings (changes are cached with colrev prep --prep-cache).
+        Endpoints that write API feeds (prep_link_md) must not be cacheable"""
+    )
 
     # pylint: disable=no-self-argument
     def prepare(prep_record: dict) -> dict:  # type: ignore
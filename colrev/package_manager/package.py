@@ -10,12 +10,8 @@ import toml
 import zope.interface.exceptions
 from zope.interface.verify import verifyClass
 
-import colrev.env.utils
 import colrev.exceptions as colrev_exceptions
 import colrev.package_manager.interfaces
-import colrev.process.operation
-import colrev.record.record
-import colrev.settings
 from colrev.constants import EndpointType
 
 # Inspiration for package descriptions:
@@ -26,6 +22,33 @@ from colrev.constants import EndpointType
 ENDPOINT_OVERVIEW = colrev.package_manager.interfaces.ENDPOINT_OVERVIEW
 
 
+def _endpoint_verified(
+    endpoint_class: Any, endpoint_type: EndpointType, identifier: str
+) -> bool:
+    interface_definition = ENDPOINT_OVERVIEW[endpoint_type]["import_name"]
+    try:
+        verifyClass(interface_definition, endpoint_class)  # type: ignore
+        return True
+    except zope.interface.exceptions.BrokenImplementation as exc:
+        print(f"Error registering endpoint {identifier}: {exc}")
+    return False
+
+
+def load_endpoint_class(
+    endpoint_path: str, endpoint_type: EndpointType, identifier: str
+) -> Any:
+    """Import and verify the endpoint class (endpoint_path: module:class)"""
+    module_name, class_name = endpoint_path.split(":")
+    module = importlib.import_module(module_name)
+    cls = getattr(module, class_name)
+    if not _endpoint_verified(cls, endpoint_type, identifier):
+        raise colrev_exceptions.MissingDependencyError(
+            f"Endpoint {class_name} in {module_name} "
+            f"does not implement the {endpoint_type} interface"
+        )
+    return cls
+
+
 class Package:
     """A Python package for CoLRev"""
 
@@ -79,34 +102,15 @@ class Package:
         """Get the endpoint for a package type"""
         return self.config["tool"]["colrev"][endpoint_type.value]
 
-    def _endpoint_verified(
-        self, endpoint_class: Any, endpoint_type: EndpointType, identifier: str
-    ) -> bool:
-        interface_definition = ENDPOINT_OVERVIEW[endpoint_type]["import_name"]
-        try:
-            verifyClass(interface_definition, endpoint_class)  # type: ignore
-            return True
-        except zope.interface.exceptions.BrokenImplementation as exc:
-            print(f"Error registering endpoint {identifier}: {exc}")
-        return False
-
     def get_endpoint_class(self, package_type: EndpointType) -> Any:
         """Get the endpoint class for a package type"""
         if not self.has_endpoint(package_type):
             raise colrev_exceptions.MissingDependencyError(
                 f"Package {self.name} does not have a {package_type} endpoint"
             )
-
-        endpoint_path = self.get_endpoint(package_type)
-        module_name, class_name = endpoint_path.split(":")
-        module = importlib.import_module(module_name)
-        cls = getattr(module, class_name)
-        if not self._endpoint_verified(cls, package_type, self.name):
-            raise colrev_exceptions.MissingDependencyError(
-                f"Endpoint {class_name} in {module_name} "
-                f"does not implement the {package_type} interface"
-            )
-        return cls
+        return load_endpoint_class(
+            self.get_endpoint(package_type), package_type, self.name
+        )
 
     def add_to_type_identifier_endpoint_dict(
         self, type_identifier_endpoint_dict: dict
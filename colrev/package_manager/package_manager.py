@@ -2,13 +2,14 @@
 """Discovering and using packages."""
 from __future__ import annotations
 
+import hashlib
 import importlib.util
+import json
 import typing
 from pathlib import Path
 from typing import Any
 
 import colrev.exceptions as colrev_exceptions
-import colrev.package_manager.doc_registry_manager
 import colrev.package_manager.package
 from colrev.constants import EndpointType
 
@@ -16,6 +17,14 @@ from colrev.constants import EndpointType
 class PackageManager:
     """The PackageManager provides functionality for package lookup and discovery"""
 
+    # The manifest maps package identifiers to the endpoints (module:class)
+    # (generated by update_package_list(), shipped in colrev/packages)
+    MANIFEST_FILENAME = "package_manifest.json"
+
+    # Loaded once per process (shared by all PackageManager instances)
+    _manifest: typing.Optional[dict] = None
+    _endpoint_classes: typing.Dict[typing.Tuple[EndpointType, str], Any] = {}
+
     def _get_package_dir(self, package_identifier: str) -> Path:
         if package_identifier.startswith("colrev."):
             colrev_package_module = importlib.import_module("colrev.packages")
@@ -42,22 +51,89 @@ class PackageManager:
             "Could not find the colrev package"
         )
 
-    def load_type_identifier_endpoint_dict(self) -> dict:
-        """Load the type_identifier_endpoint_dict from the packages"""
+    def _get_packages_fingerprint(self, package_dirs: list) -> str:
+        """Hash of the pyproject.toml files (to detect outdated manifests)"""
+        fingerprint = hashlib.sha1(usedforsecurity=False)
+        for package_dir in sorted(package_dirs):
+            config_path = package_dir / "pyproject.toml"
+            if not config_path.is_file():
+                continue
+            fingerprint.update(package_dir.name.encode("utf-8") + b"\0")
+            fingerprint.update(config_path.read_bytes() + b"\0")
+        return fingerprint.hexdigest()
 
-        type_identifier_endpoint_dict: typing.Dict[
-            EndpointType, typing.Dict[str, Any]
-        ] = {endpoint_type: {} for endpoint_type in EndpointType}
+    def build_manifest(self) -> dict:
+        """Build the package manifest from the pyproject.toml files"""
 
-        for package_dir in self._get_packages_dirs():
+        package_dirs = self._get_packages_dirs()
+        packages: typing.Dict[str, typing.Dict[str, str]] = {}
+        for package_dir in sorted(package_dirs):
             try:
                 package = colrev.package_manager.package.Package(package_dir)
-                package.add_to_type_identifier_endpoint_dict(
-                    type_identifier_endpoint_dict
-                )
             except colrev_exceptions.MissingDependencyError as exc:
                 print(exc)
                 continue
+            packages[package.name] = {
+                endpoint_type.value: package.get_endpoint(endpoint_type)
+                for endpoint_type in EndpointType
+                if package.has_endpoint(endpoint_type)
+            }
+        return {
+            "fingerprint": self._get_packages_fingerprint(package_dirs),
+            "packages": packages,
+        }
+
+    def _get_manifest_path(self) -> Path:
+        colrev_package_module = importlib.import_module("colrev.packages")
+        if colrev_package_module.__file__:
+            colrev_package_dir = Path(colrev_package_module.__file__).parent
+            return colrev_package_dir / self.MANIFEST_FILENAME
+        raise colrev_exceptions.MissingDependencyError(
+            "Could not find the colrev package"
+        )
+
+    def save_manifest(self) -> None:
+        """Generate the package manifest (colrev/packages/package_manifest.json)"""
+
+        manifest = self.build_manifest()
+        with open(self._get_manifest_path(), "w", encoding="utf-8") as file:
+            file.write(json.dumps(manifest, indent=4) + "\n")
+        PackageManager._manifest = manifest
+
+    def _load_manifest(self) -> dict:
+        """Load the package manifest (rebuilt in memory if it is outdated)"""
+
+        if PackageManager._manifest is not None:
+            return PackageManager._manifest
+
+        manifest: typing.Optional[dict] = None
+        try:
+            with open(self._get_manifest_path(), encoding="utf-8") as file:
+                manifest = json.load(file)
+        except (OSError, ValueError):
+            pass
+
+        if manifest is None or manifest.get(
+            "fingerprint"
+        ) != self._get_packages_fingerprint(self._get_packages_dirs()):
+            manifest = self.build_manifest()
+
+        PackageManager._manifest = manifest
+        return manifest
+
+    def load_type_identifier_endpoint_dict(self) -> dict:
+        """Load the type_identifier_endpoint_dict from the packages"""
+
+        type_identifier_endpoint_dict: typing.Dict[
+            EndpointType, typing.Dict[str, Any]
+        ] = {endpoint_type: {} for endpoint_type in EndpointType}
+
+        for package_identifier, endpoints in self._load_manifest()["packages"].items():
+            for endpoint_type in EndpointType:
+                if endpoint_type.value in endpoints:
+                    type_identifier_endpoint_dict[endpoint_type][package_identifier] = (
+                        endpoints[endpoint_type.value]
+                    )
 
         return type_identifier_endpoint_dict
 
@@ -85,6 +161,8 @@ class PackageManager:
         """Generates the package_endpoints.json
         based on the packages in packages/packages.json
         and the endpoints.json files in the top directory of each package."""
+        # pylint: disable=import-outside-toplevel,redefined-outer-name
+        import colrev.package_manager.doc_registry_manager
 
         doc_reg_manager = (
             colrev.package_manager.doc_registry_manager.DocRegistryManager(
@@ -92,6 +170,7 @@ class PackageManager:
             )
         )
         doc_reg_manager.update()
+        self.save_manifest()
 
     def discover_packages(self, *, package_type: EndpointType) -> typing.Dict:
         """Discover packages (for cli usage)"""
@@ -114,6 +193,25 @@ class PackageManager:
                 f"{package_identifier} is not a CoLRev package"
             )
 
-        module_path = self._get_package_dir(package_identifier)
-        package = colrev.package_manager.package.Package(module_path)
-        return package.get_endpoint_class(package_type)
+        if (package_type, package_identifier) in self._endpoint_classes:
+            return self._endpoint_classes[(package_type, package_identifier)]
+
+        packages = self._load_manifest()["packages"]
+        if package_identifier not in packages:
+            raise colrev_exceptions.MissingDependencyError(
+                f"Package {self._get_package_dir(package_identifier)} "
+                "not a CoLRev package"
+            )
+        if package_type.value not in packages[package_identifier]:
+            raise colrev_exceptions.MissingDependencyError(
+                f"Package {package_identifier} does not have a {package_type} endpoint"
+            )
+
+        # Note : the endpoint class is verified when it is loaded (once per process)
+        endpoint_class = colrev.package_manager.package.load_endpoint_class(
+            packages[package_identifier][package_type.value],
+            package_type,
+            package_identifier,
+        )
+        self._endpoint_classes[(package_type, package_identifier)] = endpoint_class
+        return endpoint_class
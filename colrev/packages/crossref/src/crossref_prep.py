@@ -33,6 +33,7 @@ class CrossrefMetadataPrep(JsonSchemaMixin):
         + "metadata-corrections-updates-and-additions-in-metadata-manager/"
     )
     always_apply_changes = False
+    requires_network = True
 
     def __init__(
         self,
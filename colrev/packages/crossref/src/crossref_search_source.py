@@ -30,6 +30,7 @@ import colrev.package_manager.package_manager
 import colrev.package_manager.package_settings
 import colrev.packages.crossref.src.utils as connector_utils
 import colrev.packages.doi_org.src.doi_org as doi_connector
+import colrev.process.profiler
 import colrev.record.record
 import colrev.record.record_prep
 import colrev.record.record_similarity
@@ -109,7 +110,9 @@ class CrossrefSearchSource(JsonSchemaMixin):
                     comment="",
                 )
 
-            self.crossref_lock = Lock()
+            self.crossref_lock = colrev.process.profiler.ProfiledLock(
+                Lock(), name="crossref_lock"
+            )
 
         self.language_service = colrev.env.language_service.LanguageService()
 
@@ -488,7 +491,7 @@ class CrossrefSearchSource(JsonSchemaMixin):
             try:
                 self.crossref_lock.acquire(timeout=120)
 
-                # Note : need to reload file because the object is not shared between processes
+                # Note : in prep, the (resident) feed is shared and saved in batches
                 crossref_feed = self.search_source.get_api_feed(
                     review_manager=self.review_manager,
                     source_identifier=self.source_identifier,
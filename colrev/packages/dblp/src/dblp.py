@@ -21,6 +21,7 @@ import colrev.exceptions as colrev_exceptions
 import colrev.package_manager.interfaces
 import colrev.package_manager.package_manager
 import colrev.package_manager.package_settings
+import colrev.process.profiler
 import colrev.record.record
 import colrev.record.record_prep
 import colrev.record.record_similarity
@@ -110,7 +111,7 @@ class DBLPSearchSource(JsonSchemaMixin):
                     search_parameters={},
                     comment="",
                 )
-        self.dblp_lock = Lock()
+        self.dblp_lock = colrev.process.profiler.ProfiledLock(Lock(), name="dblp_lock")
         self.origin_prefix = self.search_source.get_origin_prefix()
 
         _, self.email = self.review_manager.get_committer()
@@ -665,8 +666,7 @@ class DBLPSearchSource(JsonSchemaMixin):
             try:
                 self.dblp_lock.acquire(timeout=60)
 
-                # Note : need to reload file
-                # because the object is not shared between processes
+                # Note : in prep, the (resident) feed is shared and saved in batches
                 dblp_feed = self.search_source.get_api_feed(
                     review_manager=self.review_manager,
                     source_identifier=self.source_identifier,
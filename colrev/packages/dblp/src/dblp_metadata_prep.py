@@ -32,6 +32,7 @@ class DBLPMetadataPrep(JsonSchemaMixin):
         + " (see https://dblp.org/faq/How+can+I+correct+errors+in+dblp.html)"
     )
     always_apply_changes = False
+    requires_network = True
 
     def __init__(
         self,
@@ -23,6 +23,7 @@ import colrev.exceptions as colrev_exceptions
 import colrev.package_manager.interfaces
 import colrev.package_manager.package_manager
 import colrev.package_manager.package_settings
+import colrev.process.profiler
 import colrev.record.record
 import colrev.record.record_prep
 import colrev.record.record_similarity
@@ -108,7 +109,9 @@ class EuropePMCSearchSource(JsonSchemaMixin):
                     comment="",
                 )
 
-            self.europe_pmc_lock = Lock()
+            self.europe_pmc_lock = colrev.process.profiler.ProfiledLock(
+                Lock(), name="europe_pmc_lock"
+            )
         self.source_operation = source_operation
 
     # @classmethod
@@ -323,7 +326,7 @@ class EuropePMCSearchSource(JsonSchemaMixin):
 
                 self.europe_pmc_lock.acquire(timeout=60)
 
-                # Note : need to reload file because the object is not shared between processes
+                # Note : in prep, the (resident) feed is shared and saved in batches
                 europe_pmc_feed = self.search_source.get_api_feed(
                     review_manager=prep_operation.review_manager,
                     source_identifier=self.source_identifier,
@@ -310,8 +310,8 @@ class FilesSearchSource(JsonSchemaMixin):
             with pymupdf.open(file_path) as doc:
                 pages_in_file = doc.page_count
                 if pages_in_file < 6:
-                    record = colrev.record.record_pdf.PDFRecord(record_dict)
-                    record.set_text_from_pdf()
+                    with colrev.record.record_pdf.PDFRecord(record_dict) as record:
+                        record.set_text_from_pdf()
                     record_dict = record.get_data()
                     if Fields.TEXT_FROM_PDF in record_dict:
                         text: str = record_dict[Fields.TEXT_FROM_PDF]
@@ -606,7 +606,8 @@ class FilesSearchSource(JsonSchemaMixin):
             return
         record = colrev.record.record_pdf.PDFRecord(record_dict)
         if Fields.DOI not in record_dict:
-            record.set_text_from_pdf()
+            with record:
+                record.set_text_from_pdf()
             res = re.findall(self._doi_regex, record.data[Fields.TEXT_FROM_PDF])
             if res:
                 record.data[Fields.DOI] = res[0].upper()
@@ -35,6 +35,8 @@ class DOIFromURLsPrep(JsonSchemaMixin):
 
     source_correction_hint = "check with the developer"
     always_apply_changes = False
+    requires_network = True
+    cacheable = True
 
     # https://www.crossref.org/blog/dois-and-matching-regular-expressions/
     doi_regex = re.compile(r"10\.\d{4,9}/[-._;/:A-Za-z0-9]*")
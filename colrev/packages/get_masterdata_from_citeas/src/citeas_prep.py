@@ -30,6 +30,8 @@ class CiteAsPrep(JsonSchemaMixin):
 
     source_correction_hint = "Search on https://citeas.org/ and click 'modify'"
     always_apply_changes = False
+    requires_network = True
+    cacheable = True
     ci_supported: bool = True
 
     requests_headers = {
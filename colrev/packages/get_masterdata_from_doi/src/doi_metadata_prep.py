@@ -33,6 +33,8 @@ class DOIMetadataPrep(JsonSchemaMixin):
         + "metadata-corrections-updates-and-additions-in-metadata-manager/"
     )
     always_apply_changes = False
+    requires_network = True
+    cacheable = True
 
     def __init__(
         self,
@@ -28,6 +28,7 @@ class GithubMetadataPrep(JsonSchemaMixin):
 
     source_correction_hint = "ask the publisher to correct the metadata"
     always_apply_changes = False
+    requires_network = True
     docs_link = ()
 
     def __init__(
@@ -21,6 +21,7 @@ import colrev.ops.check
 import colrev.package_manager.interfaces
 import colrev.package_manager.package_manager
 import colrev.package_manager.package_settings
+import colrev.process.profiler
 import colrev.record.record
 from colrev.constants import Colors
 from colrev.constants import Fields
@@ -95,7 +96,9 @@ class LocalIndexSearchSource(JsonSchemaMixin):
                     comment="",
                 )
 
-            self.local_index_lock = Lock()
+            self.local_index_lock = colrev.process.profiler.ProfiledLock(
+                Lock(), name="local_index_lock"
+            )
 
         self.origin_prefix = self.search_source.get_origin_prefix()
 
@@ -400,7 +403,7 @@ class LocalIndexSearchSource(JsonSchemaMixin):
             # lock: to prevent different records from having the same origin
             self.local_index_lock.acquire(timeout=60)
 
-            # Note : need to reload file because the object is not shared between processes
+            # Note : in prep, the (resident) feed is shared and saved in batches
             local_index_feed = self.search_source.get_api_feed(
                 review_manager=self.review_manager,
                 source_identifier=self.source_identifier,
@@ -187,7 +187,7 @@ class OpenAlexSearchSource(JsonSchemaMixin):
 
             self.open_alex_lock.acquire(timeout=120)
 
-            # Note : need to reload file because the object is not shared between processes
+            # Note : in prep, the (resident) feed is shared and saved in batches
             open_alex_feed = self.search_source.get_api_feed(
                 review_manager=self.review_manager,
                 source_identifier=self.source_identifier,
@@ -29,6 +29,7 @@ class OpenAlexMetadataPrep(JsonSchemaMixin):
 
     source_correction_hint = "TBD"
     always_apply_changes = False
+    requires_network = True
 
     def __init__(
         self,
@@ -16,6 +16,7 @@ from dataclasses_jsonschema import JsonSchemaMixin
 import colrev.exceptions as colrev_exceptions
 import colrev.package_manager.interfaces
 import colrev.package_manager.package_settings
+import colrev.process.profiler
 import colrev.record.record
 import colrev.record.record_prep
 from colrev.constants import Fields
@@ -82,7 +83,9 @@ class OpenLibrarySearchSource(JsonSchemaMixin):
                     comment="",
                 )
 
-            self.open_library_lock = Lock()
+            self.open_library_lock = colrev.process.profiler.ProfiledLock(
+                Lock(), name="open_library_lock"
+            )
 
         self.origin_prefix = self.search_source.get_origin_prefix()
 
@@ -28,6 +28,7 @@ class OpenLibraryMetadataPrep(JsonSchemaMixin):
 
     source_correction_hint = "ask the publisher to correct the metadata"
     always_apply_changes = False
+    requires_network = True
 
     def __init__(
         self,
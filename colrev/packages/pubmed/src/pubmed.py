@@ -5,6 +5,7 @@ from __future__ import annotations
 import typing
 from dataclasses import dataclass
 from multiprocessing import Lock
+from multiprocessing.pool import ThreadPool
 from pathlib import Path
 from sqlite3 import OperationalError
 from urllib.parse import urlparse
@@ -24,6 +25,7 @@ import colrev.exceptions as colrev_exceptions
 import colrev.package_manager.interfaces
 import colrev.package_manager.package_manager
 import colrev.package_manager.package_settings
+import colrev.process.profiler
 import colrev.record.record
 import colrev.record.record_prep
 import colrev.record.record_similarity
@@ -42,6 +44,10 @@ from colrev.constants import SearchType
 class PubMedSearchSource(JsonSchemaMixin):
     """Pubmed"""
 
+    # Note : the records prefetched in batches (and their lock) are kept
+    # per source instance (until they are linked in prep_link_md)
+    # pylint: disable=too-many-instance-attributes
+
     settings_class = colrev.package_manager.package_settings.DefaultSourceSettings
     source_identifier = "pubmedid"
     search_types = [
@@ -56,6 +62,10 @@ class PubMedSearchSource(JsonSchemaMixin):
     short_name = "PubMed"
     db_url = "https://pubmed.ncbi.nlm.nih.gov/"
     _pubmed_md_filename = Path("data/search/md_pubmed.bib")
+    # Maximum number of results per page of the pubmed website
+    _search_page_size = 200
+    # Maximum number of ids per efetch (GET) request recommended by the E-utilities
+    _efetch_batch_size = 200
 
     def __init__(
         self,
@@ -87,12 +97,18 @@ class PubMedSearchSource(JsonSchemaMixin):
                     comment="",
                 )
 
-            self.pubmed_lock = Lock()
+            self.pubmed_lock = colrev.process.profiler.ProfiledLock(
+                Lock(), name="pubmed_lock"
+            )
 
         self.source_operation = source_operation
         self.quality_model = self.review_manager.get_qm()
         _, self.email = self.review_manager.get_committer()
 
+        # Records retrieved in batches (before they are linked in prep)
+        self._prefetched_records: typing.Dict[str, dict] = {}
+        self._prefetch_lock = Lock()
+
     @classmethod
     def heuristic(cls, filename: Path, data: str) -> dict:
         """Source heuristic for Pubmed"""
@@ -239,21 +255,17 @@ class PubMedSearchSource(JsonSchemaMixin):
         return authors_string
 
     @classmethod
-    def _get_author_string(cls, *, root) -> str:  # type: ignore
+    def _get_author_string(cls, *, article) -> str:  # type: ignore
         authors_list = []
-        for author_node in root.xpath(
-            "/PubmedArticleSet/PubmedArticle/MedlineCitation/Article/AuthorList/Author"
-        ):
+        for author_node in article.xpath("MedlineCitation/Article/AuthorList/Author"):
             authors_list.append(
                 cls._get_author_string_from_node(author_node=author_node)
             )
         return " and ".join(authors_list)
 
     @classmethod
-    def _get_title_string(cls, *, root) -> str:  # type: ignore
-        title = root.xpath(
-            "/PubmedArticleSet/PubmedArticle/MedlineCitation/Article/ArticleTitle"
-        )
+    def _get_title_string(cls, *, article) -> str:  # type: ignore
+        title = article.xpath("MedlineCitation/Article/ArticleTitle")
         if title:
             if title[0].text:
                 title = title[0].text.strip().rstrip(".")
@@ -263,51 +275,53 @@ class PubMedSearchSource(JsonSchemaMixin):
         return ""
 
     @classmethod
-    def _get_abstract_string(cls, *, root) -> str:  # type: ignore
-        abstract = root.xpath(
-            "/PubmedArticleSet/PubmedArticle/MedlineCitation/Article/Abstract"
-        )
+    def _get_abstract_string(cls, *, article) -> str:  # type: ignore
+        abstract = article.xpath("MedlineCitation/Article/Abstract")
         if abstract:
             return ElementTree.tostring(abstract[0], encoding="unicode")
         return ""
 
-    # pylint: disable=colrev-missed-constant-usage
     @classmethod
     def _pubmed_xml_to_record(cls, *, root) -> dict:  # type: ignore
-        retrieved_record_dict: dict = {Fields.ENTRYTYPE: "misc"}
-
         pubmed_article = root.find("PubmedArticle")
         if pubmed_article is None:
             return {}
-        if pubmed_article.find("MedlineCitation") is None:
+        return cls._pubmed_article_to_record(article=pubmed_article)
+
+    # pylint: disable=colrev-missed-constant-usage
+    @classmethod
+    def _pubmed_article_to_record(cls, *, article) -> dict:  # type: ignore
+        retrieved_record_dict: dict = {Fields.ENTRYTYPE: "misc"}
+
+        if article.find("MedlineCitation") is None:
             return {}
 
-        retrieved_record_dict[Fields.TITLE] = cls._get_title_string(root=root)
-        retrieved_record_dict[Fields.AUTHOR] = cls._get_author_string(root=root)
+        retrieved_record_dict[Fields.TITLE] = cls._get_title_string(article=article)
+        retrieved_record_dict[Fields.AUTHOR] = cls._get_author_string(article=article)
 
-        journal_path = "/PubmedArticleSet/PubmedArticle/MedlineCitation/Article/Journal"
-        journal_name = root.xpath(journal_path + "/ISOAbbreviation")
+        journal_path = "MedlineCitation/Article/Journal"
+        journal_name = article.xpath(journal_path + "/ISOAbbreviation")
         if journal_name:
             retrieved_record_dict[Fields.ENTRYTYPE] = "article"
             retrieved_record_dict[Fields.JOURNAL] = journal_name[0].text
 
-        volume = root.xpath(journal_path + "/JournalIssue/Volume")
+        volume = article.xpath(journal_path + "/JournalIssue/Volume")
         if volume:
             retrieved_record_dict[Fields.VOLUME] = volume[0].text
 
-        number = root.xpath(journal_path + "/JournalIssue/Issue")
+        number = article.xpath(journal_path + "/JournalIssue/Issue")
         if number:
             retrieved_record_dict[Fields.NUMBER] = number[0].text
 
-        year = root.xpath(journal_path + "/JournalIssue/PubDate/Year")
+        year = article.xpath(journal_path + "/JournalIssue/PubDate/Year")
         if year:
             retrieved_record_dict[Fields.YEAR] = year[0].text
 
-        retrieved_record_dict[Fields.ABSTRACT] = cls._get_abstract_string(root=root)
-
-        article_id_list = root.xpath(
-            "/PubmedArticleSet/PubmedArticle/PubmedData/ArticleIdList"
+        retrieved_record_dict[Fields.ABSTRACT] = cls._get_abstract_string(
+            article=article
         )
+
+        article_id_list = article.xpath("PubmedData/ArticleIdList")
         for article_id in article_id_list[0]:
             id_type = article_id.attrib.get("IdType")
             if article_id.attrib.get("IdType") == "pubmed":
@@ -334,6 +348,8 @@ class PubMedSearchSource(JsonSchemaMixin):
         if not query.startswith("https://pubmed.ncbi.nlm.nih.gov/?term="):
             query = "https://pubmed.ncbi.nlm.nih.gov/?term=" + query
         url = query + f"&retstart={retstart}&page={page}"
+        if "size=" not in query:
+            url += f"&size={self._search_page_size}"
         ret = session.request("GET", url, headers=headers, timeout=30)
         ret.raise_for_status()
         if ret.status_code != 200:
@@ -355,6 +371,10 @@ class PubMedSearchSource(JsonSchemaMixin):
     ) -> dict:
         """Retrieve records from Pubmed based on a query"""
 
+        with self._prefetch_lock:
+            if pubmed_id in self._prefetched_records:
+                return self._prefetched_records.pop(pubmed_id)
+
         try:
             database = "pubmed"
             url = (
@@ -392,6 +412,75 @@ class PubMedSearchSource(JsonSchemaMixin):
             ) from exc
         return retrieved_record
 
+    def _pubmed_query_ids(
+        self,
+        *,
+        pubmed_ids: typing.List[str],
+        timeout: int = 60,
+    ) -> typing.Dict[str, dict]:
+        """Retrieve records from Pubmed in batches (one efetch request per batch)
+
+        Returns the records retrieved (by pubmed-id)"""
+
+        headers = {"user-agent": f"{__name__} (mailto:{self.email})"}
+        session = self.review_manager.get_cached_session()
+        retrieved_records: typing.Dict[str, dict] = {}
+        for i in range(0, len(pubmed_ids), self._efetch_batch_size):
+            batch = pubmed_ids[i : i + self._efetch_batch_size]
+            url = (
+                "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi?"
+                + f"db=pubmed&id={','.join(batch)}&rettype=xml&retmode=text"
+            )
+            try:
+                ret = session.request("GET", url, headers=headers, timeout=timeout)
+                ret.raise_for_status()
+                root = etree.fromstring(str.encode(ret.text))
+            except requests.exceptions.RequestException:
+                continue
+            except XMLSyntaxError as exc:
+                raise colrev_exceptions.RecordNotParsableException(
+                    "Error parsing xml"
+                ) from exc
+            except OperationalError as exc:
+                raise colrev_exceptions.ServiceNotAvailableException(
+                    "sqlite, required for requests CachedSession "
+                    "(possibly caused by concurrent operations)"
+                ) from exc
+
+            for article in root.iterfind("PubmedArticle"):
+                try:
+                    retrieved_record = self._pubmed_article_to_record(article=article)
+                except IndexError:
+                    continue
+                if "pubmedid" in retrieved_record:
+                    retrieved_records[retrieved_record["pubmedid"]] = retrieved_record
+        return retrieved_records
+
+    def prefetch_records(
+        self, *, records: typing.List[colrev.record.record.Record]
+    ) -> None:
+        """Retrieve the records that will be linked in prep_link_md in batches"""
+
+        pubmed_ids = list(
+            dict.fromkeys(
+                record.data["pubmedid"]
+                for record in records
+                if Fields.PUBMED_ID in record.data and "pubmedid" in record.data
+            )
+        )
+        if not pubmed_ids:
+            return
+        try:
+            retrieved_records = self._pubmed_query_ids(pubmed_ids=pubmed_ids)
+        except (
+            colrev_exceptions.RecordNotParsableException,
+            colrev_exceptions.ServiceNotAvailableException,
+        ):
+            # Records that are not prefetched are retrieved individually
+            return
+        with self._prefetch_lock:
+            self._prefetched_records.update(retrieved_records)
+
     def _get_masterdata_record(
         self,
         prep_operation: colrev.ops.prep.Prep,
@@ -430,7 +519,7 @@ class PubMedSearchSource(JsonSchemaMixin):
             try:
                 self.pubmed_lock.acquire(timeout=60)
 
-                # Note : need to reload file because the object is not shared between processes
+                # Note : in prep, the (resident) feed is shared and saved in batches
                 pubmed_feed = self.search_source.get_api_feed(
                     review_manager=self.review_manager,
                     source_identifier=self.source_identifier,
@@ -516,16 +605,23 @@ class PubMedSearchSource(JsonSchemaMixin):
 
         retstart = 10
         page = 1
-        while True:
-            pubmed_ids = self._get_pubmed_ids(
-                query=params["query"], retstart=retstart, page=page
+        # Note: the next page of ids is retrieved
+        # while the records of the current page are fetched
+        with ThreadPool(1) as pool:
+            next_pubmed_ids = pool.apply_async(
+                self._get_pubmed_ids, (params["query"], retstart, page)
             )
-            if not pubmed_ids:
-                break
-            for pubmed_id in pubmed_ids:
-                yield self._pubmed_query_id(pubmed_id=pubmed_id)
-
-            page += 1
+            while True:
+                pubmed_ids = next_pubmed_ids.get()
+                if not pubmed_ids:
+                    break
+                page += 1
+                next_pubmed_ids = pool.apply_async(
+                    self._get_pubmed_ids, (params["query"], retstart, page)
+                )
+                retrieved_records = self._pubmed_query_ids(pubmed_ids=pubmed_ids)
+                for pubmed_id in pubmed_ids:
+                    yield retrieved_records.get(pubmed_id, {"pubmed_id": pubmed_id})
 
     def _run_api_search(
         self,
@@ -584,17 +680,19 @@ class PubMedSearchSource(JsonSchemaMixin):
         pubmed_feed: colrev.ops.search_api_feed.SearchAPIFeed,
     ) -> None:
 
-        for feed_record_dict in pubmed_feed.feed_records.values():
-            feed_record = colrev.record.record.Record(feed_record_dict)
-
+        retrieved_records = self._pubmed_query_ids(
+            pubmed_ids=[
+                feed_record_dict["pubmedid"]
+                for feed_record_dict in pubmed_feed.feed_records.values()
+            ]
+        )
+        for feed_record_dict in list(pubmed_feed.feed_records.values()):
+            if feed_record_dict["pubmedid"] not in retrieved_records:
+                continue
             try:
-                retrieved_record_dict = self._pubmed_query_id(
-                    pubmed_id=feed_record_dict["pubmedid"]
+                retrieved_record = colrev.record.record.Record(
+                    retrieved_records[feed_record_dict["pubmedid"]]
                 )
-
-                if retrieved_record_dict["pubmedid"] != feed_record.data["pubmedid"]:
-                    continue
-                retrieved_record = colrev.record.record.Record(retrieved_record_dict)
                 pubmed_feed.add_update_record(retrieved_record)
             except (
                 colrev_exceptions.RecordNotFoundInPrepSourceException,
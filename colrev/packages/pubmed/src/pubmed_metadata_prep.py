@@ -2,6 +2,7 @@
 """Consolidation of metadata based on the Pubmed API as a prep operation"""
 from __future__ import annotations
 
+import typing
 from dataclasses import dataclass
 
 import zope.interface
@@ -31,6 +32,7 @@ class PubmedMetadataPrep(JsonSchemaMixin):
 
     source_correction_hint = "ask the publisher to correct the metadata"
     always_apply_changes = False
+    requires_network = True
 
     def __init__(
         self,
@@ -57,6 +59,21 @@ class PubmedMetadataPrep(JsonSchemaMixin):
         """Check status (availability) of the Pubmed API"""
         self.pubmed_source.check_availability(source_operation=source_operation)
 
+    def prefetch(self, *, records: typing.List[colrev.record.record.Record]) -> None:
+        """Retrieve the Pubmed records in batches (before the records are prepared)"""
+
+        self.pubmed_source.prefetch_records(
+            records=[
+                record
+                for record in records
+                if not any(
+                    pubmed_prefix in o
+                    for pubmed_prefix in self.pubmed_prefixes
+                    for o in record.data.get(Fields.ORIGIN, [])
+                )
+            ]
+        )
+
     def prepare(
         self, record: colrev.record.record_prep.PrepRecord
     ) -> colrev.record.record.Record:
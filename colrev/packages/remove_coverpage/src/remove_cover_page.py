@@ -7,7 +7,6 @@ import typing
 from dataclasses import dataclass
 from pathlib import Path
 
-import pymupdf
 import zope.interface
 from dataclasses_jsonschema import JsonSchemaMixin
 
@@ -117,9 +116,9 @@ class PDFCoverPage(JsonSchemaMixin):
     ) -> typing.List[int]:
         coverpages: typing.List[int] = []
 
-        doc = pymupdf.Document(str(record.data[Fields.FILE]))
+        pdf_analysis = record.get_pdf_analysis()
 
-        if doc.page_count == 1:
+        if pdf_analysis.get_page_count() == 1:
             return coverpages
 
         first_page_average_hash_16 = record.get_pdf_hash(page_nr=1, hash_size=16)
@@ -142,10 +141,10 @@ class PDFCoverPage(JsonSchemaMixin):
         if str(first_page_average_hash_16) in first_page_hashes:
             coverpages.append(0)
 
-        res = doc.load_page(0).get_text()
+        res = pdf_analysis.get_page_text(0)
         page0 = res.replace(" ", "").replace("\n", "").lower()
 
-        res = doc.load_page(1).get_text()
+        res = pdf_analysis.get_page_text(1)
         page1 = res.replace(" ", "").replace("\n", "").lower()
 
         # input(page0)
@@ -7,7 +7,6 @@ import typing
 from dataclasses import dataclass
 from pathlib import Path
 
-import pymupdf
 import zope.interface
 from dataclasses_jsonschema import JsonSchemaMixin
 
@@ -53,12 +52,12 @@ class PDFLastPage(JsonSchemaMixin):
         lp_path = Filepaths.LOCAL_ENVIRONMENT_DIR / Path(".lastpages")
         lp_path.mkdir(exist_ok=True)
 
-        def _get_last_pages(*, pdf: str) -> typing.List[int]:
+        def _get_last_pages() -> typing.List[int]:
             last_pages: typing.List[int] = []
 
-            doc = pymupdf.Document(pdf)
+            pdf_analysis = record.get_pdf_analysis()
 
-            last_page_nr = doc.page_count - 1
+            last_page_nr = pdf_analysis.get_page_count() - 1
 
             last_page_average_hash_16 = record.get_pdf_hash(
                 page_nr=last_page_nr + 1, hash_size=16
@@ -83,7 +82,7 @@ class PDFLastPage(JsonSchemaMixin):
             if str(last_page_average_hash_16) in last_page_hashes:
                 last_pages.append(last_page_nr)
 
-            res = doc.load_page(last_page_nr).get_text()  # pylint: disable=no-member
+            res = pdf_analysis.get_page_text(last_page_nr)
             last_page_text = res.replace(" ", "").replace("\n", "").lower()
 
             # ME Sharpe last page
@@ -108,7 +107,7 @@ class PDFLastPage(JsonSchemaMixin):
 
             return list(set(last_pages))
 
-        last_pages = _get_last_pages(pdf=record.data[Fields.FILE])
+        last_pages = _get_last_pages()
         if not last_pages:
             return record.data
         if last_pages:
@@ -29,6 +29,7 @@ class RemoveError500URLsPrep(JsonSchemaMixin):
 
     source_correction_hint = "check with the developer"
     always_apply_changes = True
+    requires_network = True
 
     requests_headers = {
         "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_10_1) "
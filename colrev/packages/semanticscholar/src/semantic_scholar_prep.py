@@ -34,6 +34,8 @@ class SemanticScholarPrep(JsonSchemaMixin):
         + "https://www.semanticscholar.org/faq#correct-error"
     )
     always_apply_changes = False
+    requires_network = True
+    cacheable = True
 
     def __init__(
         self,
@@ -26,6 +26,9 @@ class PathManager:
     REPORT_FILE = Path(".report.log")
     GIT_IGNORE_FILE = Path(".gitignore")
     PRE_COMMIT_CONFIG = Path(".pre-commit-config.yaml")
+    RECORDS_CACHE_FILE = Path(".colrev/records_cache.pickle")
+    RECORDS_INDEX_FILE = Path(".colrev/records_index.json")
+    PROFILE_DIR = Path(".colrev/profile")
 
     # Ensure the path uses forward slashes, which is compatible with Git's path handling
     RECORDS_FILE_GIT = str(RECORDS_FILE).replace("\\", "/")
@@ -49,3 +52,6 @@ class PathManager:
         self.report = base_path / self.REPORT_FILE
         self.git_ignore = base_path / self.GIT_IGNORE_FILE
         self.pre_commit_config = base_path / self.PRE_COMMIT_CONFIG
+        self.records_cache = base_path / self.RECORDS_CACHE_FILE
+        self.records_index = base_path / self.RECORDS_INDEX_FILE
+        self.profile = base_path / self.PROFILE_DIR
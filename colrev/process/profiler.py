@@ -0,0 +1,396 @@
+#! /usr/bin/env python
+"""Profiler for operations (per-endpoint latency, errors, cache hits and lock waits)."""
+from __future__ import annotations
+
+import contextlib
+import cProfile
+import csv
+import heapq
+import itertools
+import json
+import marshal
+import threading
+import time
+import typing
+from datetime import datetime
+from pathlib import Path
+
+import colrev.exceptions as colrev_exceptions
+
+# Note : the profiler is used by operations processing records in parallel
+# (prep, pdf-prep, pdf-get). Calls are recorded per endpoint and
+# merged across processes (get_state/merge_state).
+# Capturing profiles (cProfile/pyinstrument) requires the records to be
+# processed sequentially (profilers cannot be active in parallel threads).
+
+CAPTURE_TOOLS = ["cprofile", "pyinstrument"]
+
+ENDPOINT_COLUMNS = [
+    "endpoint",
+    "calls",
+    "errors",
+    "total",
+    "mean",
+    "p50",
+    "p95",
+    "p99",
+    "max",
+    "cache_hits",
+    "cache_misses",
+    "cache_hit_rate",
+]
+
+
+def get_percentile(values: typing.List[float], percentile: float) -> float:
+    """Get the percentile of the values (linear interpolation)"""
+    if not values:
+        return 0.0
+    values = sorted(values)
+    position = (len(values) - 1) * percentile / 100
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+class _LockWaits:
+    """Thread-safe counters for the time blocked on locks (per process)"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._waits: typing.Dict[str, list] = {}
+
+    def add(self, *, name: str, waited: float) -> None:
+        """Add the time waited for a lock"""
+        with self._lock:
+            wait = self._waits.setdefault(name, [0, 0.0, 0.0])
+            wait[0] += 1
+            wait[1] += waited
+            wait[2] = max(wait[2], waited)
+
+    def get_state(self) -> typing.Dict[str, list]:
+        """Get the acquisitions, total and max time waited per lock"""
+        with self._lock:
+            return {name: list(wait) for name, wait in self._waits.items()}
+
+
+LOCK_WAITS = _LockWaits()
+
+
+class ProfiledLock:
+    """Lock recording the time blocked on acquire (in LOCK_WAITS)
+
+    Wraps threading/multiprocessing locks and semaphores."""
+
+    def __init__(self, lock: typing.Any, *, name: str) -> None:
+        self._lock = lock
+        self.name = name
+
+    def acquire(self, *args: typing.Any, **kwargs: typing.Any) -> bool:
+        """Acquire the lock"""
+        start = time.perf_counter()
+        acquired = self._lock.acquire(*args, **kwargs)
+        LOCK_WAITS.add(name=self.name, waited=time.perf_counter() - start)
+        return acquired
+
+    def release(self) -> None:
+        """Release the lock"""
+        self._lock.release()
+
+    def __enter__(self) -> bool:
+        return self.acquire()
+
+    def __exit__(self, *args: typing.Any) -> None:
+        self.release()
+
+
+# pylint: disable=too-many-instance-attributes
+class OperationProfiler:
+    """Profile of an operation
+
+    Records the calls of endpoints (latency, errors, cache hits),
+    the time per record, and the time blocked on locks.
+    For the slowest records, profiles can be captured (cProfile or pyinstrument).
+    """
+
+    # Number of slowest records listed in the report
+    nr_slowest_listed = 10
+
+    def __init__(
+        self, *, operation: str, slowest: int = 0, capture_tool: str = "cprofile"
+    ) -> None:
+        if capture_tool not in CAPTURE_TOOLS:
+            raise colrev_exceptions.ParameterError(
+                parameter="capture_tool", value=capture_tool, options=CAPTURE_TOOLS
+            )
+        if capture_tool == "pyinstrument" and slowest:
+            try:
+                # pylint: disable=import-outside-toplevel,import-error,unused-import
+                import pyinstrument  # noqa: F401
+            except ImportError as exc:
+                raise colrev_exceptions.MissingDependencyError(
+                    "pyinstrument (pip install pyinstrument)"
+                ) from exc
+
+        self.operation = operation
+        self.slowest = slowest
+        self.capture_tool = capture_tool
+        self._lock = threading.Lock()
+        self._start = time.perf_counter()
+        self._counter = itertools.count()
+        self._calls: typing.Dict[str, dict] = {}
+        self._record_durations: typing.List[float] = []
+        self._slowest_records: typing.List[tuple] = []
+        self._lock_waits_offset = LOCK_WAITS.get_state()
+        self._lock_waits: typing.Dict[str, list] = {}
+
+    def add_call(
+        self,
+        *,
+        endpoint: str,
+        duration: float,
+        error: bool = False,
+        cache_hit: typing.Optional[bool] = None,
+    ) -> None:
+        """Add the call of an endpoint (cache_hit: None if the endpoint is not cached)"""
+        with self._lock:
+            calls = self._calls.setdefault(
+                endpoint,
+                {"durations": [], "errors": 0, "cache_hits": 0, "cache_misses": 0},
+            )
+            calls["durations"].append(duration)
+            if error:
+                calls["errors"] += 1
+            if cache_hit is not None:
+                calls["cache_hits" if cache_hit else "cache_misses"] += 1
+
+    @contextlib.contextmanager
+    def time_call(
+        self, endpoint: str, *, cache_hit: typing.Optional[bool] = None
+    ) -> typing.Iterator[None]:
+        """Time the call of an endpoint (exceptions are counted as errors)"""
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.add_call(
+                endpoint=endpoint,
+                duration=time.perf_counter() - start,
+                error=True,
+                cache_hit=cache_hit,
+            )
+            raise
+        self.add_call(
+            endpoint=endpoint, duration=time.perf_counter() - start, cache_hit=cache_hit
+        )
+
+    def _start_capture(self) -> typing.Any:
+        if self.capture_tool == "pyinstrument":
+            # pylint: disable=import-outside-toplevel,import-error
+            import pyinstrument
+
+            profiler = pyinstrument.Profiler()
+            profiler.start()
+            return profiler
+        profiler = cProfile.Profile()
+        profiler.enable()
+        return profiler
+
+    def _stop_capture(self, profiler: typing.Any) -> typing.Union[dict, str]:
+        if self.capture_tool == "pyinstrument":
+            profiler.stop()
+            return profiler.output_html()
+        profiler.disable()
+        profiler.create_stats()
+        return profiler.stats
+
+    @contextlib.contextmanager
+    def profile_record(self, record_id: str) -> typing.Iterator[None]:
+        """Time the processing of a record (and capture a profile if slowest > 0)"""
+        profiler = self._start_capture() if self.slowest else None
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            capture = self._stop_capture(profiler) if profiler else None
+            with self._lock:
+                self._record_durations.append(duration)
+                self._add_slowest_record(
+                    record_id=record_id, duration=duration, capture=capture
+                )
+
+    def _add_slowest_record(
+        self,
+        *,
+        record_id: str,
+        duration: float,
+        capture: typing.Optional[typing.Union[dict, str]],
+    ) -> None:
+        # Keep the slowest records only (min-heap)
+        item = (duration, next(self._counter), record_id, capture)
+        if len(self._slowest_records) < max(self.slowest, self.nr_slowest_listed):
+            heapq.heappush(self._slowest_records, item)
+        else:
+            heapq.heappushpop(self._slowest_records, item)
+
+    def _get_lock_waits(self) -> typing.Dict[str, list]:
+        lock_waits = {name: list(wait) for name, wait in self._lock_waits.items()}
+        for name, wait in LOCK_WAITS.get_state().items():
+            offset = self._lock_waits_offset.get(name, [0, 0.0, 0.0])
+            if wait[0] == offset[0]:
+                continue
+            merged_wait = lock_waits.setdefault(name, [0, 0.0, 0.0])
+            merged_wait[0] += wait[0] - offset[0]
+            merged_wait[1] += wait[1] - offset[1]
+            merged_wait[2] = max(merged_wait[2], wait[2])
+        return lock_waits
+
+    def get_state(self) -> dict:
+        """Get the recorded data (to merge it into the profiler of another process)"""
+        with self._lock:
+            return {
+                "calls": self._calls,
+                "record_durations": self._record_durations,
+                "slowest_records": [
+                    (duration, record_id, capture)
+                    for duration, _, record_id, capture in self._slowest_records
+                ],
+                "lock_waits": self._get_lock_waits(),
+            }
+
+    def pop_state(self) -> dict:
+        """Get the recorded data and reset the profiler"""
+        state = self.get_state()
+        with self._lock:
+            self._calls = {}
+            self._record_durations = []
+            self._slowest_records = []
+            self._lock_waits = {}
+            self._lock_waits_offset = LOCK_WAITS.get_state()
+        return state
+
+    def merge_state(self, state: dict) -> None:
+        """Merge the data recorded by the profiler of another process"""
+        with self._lock:
+            for endpoint, calls in state["calls"].items():
+                merged = self._calls.setdefault(
+                    endpoint,
+                    {"durations": [], "errors": 0, "cache_hits": 0, "cache_misses": 0},
+                )
+                merged["durations"].extend(calls["durations"])
+                for key in ["errors", "cache_hits", "cache_misses"]:
+                    merged[key] += calls[key]
+            self._record_durations.extend(state["record_durations"])
+            for duration, record_id, capture in state["slowest_records"]:
+                self._add_slowest_record(
+                    record_id=record_id, duration=duration, capture=capture
+                )
+            for name, wait in state["lock_waits"].items():
+                merged_wait = self._lock_waits.setdefault(name, [0, 0.0, 0.0])
+                merged_wait[0] += wait[0]
+                merged_wait[1] += wait[1]
+                merged_wait[2] = max(merged_wait[2], wait[2])
+
+    def get_endpoint_stats(self) -> typing.List[dict]:
+        """Get the statistics per endpoint (sorted by total time)"""
+        with self._lock:
+            endpoint_stats = []
+            for endpoint, calls in self._calls.items():
+                durations = calls["durations"]
+                cache_lookups = calls["cache_hits"] + calls["cache_misses"]
+                endpoint_stats.append(
+                    {
+                        "endpoint": endpoint,
+                        "calls": len(durations),
+                        "errors": calls["errors"],
+                        "total": sum(durations),
+                        "mean": sum(durations) / len(durations),
+                        "p50": get_percentile(durations, 50),
+                        "p95": get_percentile(durations, 95),
+                        "p99": get_percentile(durations, 99),
+                        "max": max(durations),
+                        "cache_hits": calls["cache_hits"],
+                        "cache_misses": calls["cache_misses"],
+                        "cache_hit_rate": (
+                            calls["cache_hits"] / cache_lookups
+                            if cache_lookups
+                            else None
+                        ),
+                    }
+                )
+        return sorted(endpoint_stats, key=lambda x: x["total"], reverse=True)
+
+    def get_report(self) -> dict:
+        """Get the report (endpoints, records, lock waits and http cache)"""
+        # pylint: disable=import-outside-toplevel
+        import colrev.env.http_session_manager
+
+        with self._lock:
+            record_durations = list(self._record_durations)
+            slowest_records = sorted(self._slowest_records, reverse=True)
+            lock_waits = self._get_lock_waits()
+        return {
+            "operation": self.operation,
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "wall_time": time.perf_counter() - self._start,
+            "endpoints": self.get_endpoint_stats(),
+            "records": {
+                "count": len(record_durations),
+                "p50": get_percentile(record_durations, 50),
+                "p95": get_percentile(record_durations, 95),
+                "p99": get_percentile(record_durations, 99),
+                "max": max(record_durations, default=0.0),
+                "slowest": [
+                    {"ID": record_id, "duration": duration}
+                    for duration, _, record_id, _ in slowest_records
+                ],
+            },
+            "lock_waits": {
+                name: {"acquisitions": wait[0], "total": wait[1], "max": wait[2]}
+                for name, wait in sorted(
+                    lock_waits.items(), key=lambda x: x[1][1], reverse=True
+                )
+            },
+            # Cache hits and latency of the http requests (of the process)
+            "http": colrev.env.http_session_manager.HTTPSessionManager.get_instance().get_metrics(),
+        }
+
+    def save_report(self, *, path: Path) -> Path:
+        """Save the report (json and csv) and the captured profiles to the path"""
+        path.mkdir(parents=True, exist_ok=True)
+        report = self.get_report()
+
+        with self._lock:
+            slowest_records = sorted(self._slowest_records, reverse=True)
+        captures_path = path / Path(f"{self.operation}_slowest")
+        if self.slowest:
+            if captures_path.is_dir():
+                for capture_file in captures_path.iterdir():
+                    capture_file.unlink()
+            captures_path.mkdir(exist_ok=True)
+        for rank, (_, _, record_id, capture) in enumerate(
+            slowest_records[: self.slowest], start=1
+        ):
+            if capture is None:
+                continue
+            if isinstance(capture, str):
+                capture_file = captures_path / Path(f"{rank:02d}_{record_id}.html")
+                capture_file.write_text(capture, encoding="utf-8")
+            else:
+                # Can be loaded with pstats (or snakeviz)
+                capture_file = captures_path / Path(f"{rank:02d}_{record_id}.prof")
+                with open(capture_file, "wb") as file:
+                    marshal.dump(capture, file)
+            report["records"]["slowest"][rank - 1]["capture"] = str(
+                capture_file.relative_to(path)
+            )
+
+        report_file = path / Path(f"{self.operation}.json")
+        report_file.write_text(json.dumps(report, indent=4), encoding="utf-8")
+        with open(
+            path / Path(f"{self.operation}.csv"), "w", encoding="utf-8", newline=""
+        ) as file:
+            writer = csv.DictWriter(file, fieldnames=ENDPOINT_COLUMNS)
+            writer.writeheader()
+            writer.writerows(report["endpoints"])
+        return report_file
@@ -3,13 +3,16 @@
 from __future__ import annotations
 
 import importlib
+import typing
 from multiprocessing import Lock
 from pathlib import Path
 
 import colrev.record.qm.checkers
-import colrev.record.record
 from colrev.constants import Fields
 
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import colrev.record.record
+
 
 class QualityModel:
     """The quality model for records"""
@@ -72,14 +75,23 @@ class QualityModel:
                 or not Path(record.data[Fields.FILE]).is_file()
             ):
                 return
+            # Note : PDFRecords are reused (analysis of the PDF is cached)
+            # and closed by the caller.
+            if not isinstance(record, colrev.record.record_pdf.PDFRecord):
+                with colrev.record.record_pdf.PDFRecord(record.data) as pdf_record:
+                    self._run_checkers(record=pdf_record)
+                return
+
+        self._run_checkers(record=record)
+
+    def _run_checkers(self, *, record: colrev.record.record.Record) -> None:
+        if self.pdf_mode:
             # text_from_pdf is already set in tests
             if (
                 Fields.TEXT_FROM_PDF not in record.data
                 or Fields.NR_PAGES_IN_FILE not in record.data
             ):
-                # The following should be improved.
-                record = colrev.record.record_pdf.PDFRecord(record.data)
-                record.set_text_from_pdf()
+                record.set_text_from_pdf()  # type: ignore
 
         for checker in self.checkers:
             if checker.msg in self.defects_to_ignore:
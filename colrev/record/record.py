@@ -579,6 +579,17 @@ class Record:
 
         return colrev.record.record_identifier.get_colrev_pdf_id(pdf_path)
 
+    @classmethod
+    def get_colrev_pdf_ids(
+        cls,
+        pdf_paths: typing.List[Path],
+        *,
+        cpu: typing.Optional[int] = None,
+    ) -> typing.Dict[Path, str]:  # pragma: no cover
+        """Generate the colrev_pdf_ids for a batch of PDFs (in parallel)"""
+
+        return colrev.record.record_identifier.get_colrev_pdf_ids(pdf_paths, cpu=cpu)
+
     def get_toc_key(self) -> str:
         """Get the record's toc-key"""
         return colrev.record.record_identifier.get_toc_key(self)
@@ -2,7 +2,7 @@
 """Functionality for record ID setting."""
 from __future__ import annotations
 
-import itertools
+import collections
 import logging
 import re
 import string
@@ -11,7 +11,6 @@ import typing
 from tqdm import tqdm
 
 import colrev.env.utils
-import colrev.exceptions as colrev_exceptions
 import colrev.loader.bib
 import colrev.loader.load_utils
 import colrev.process.operation
@@ -87,97 +86,85 @@ class IDSetter:
             temp_id = temp_id.capitalize()
         return temp_id
 
-    def _make_id_unique(
-        self,
-        temp_id: str,
-        *,
-        existing_ids: list,
-    ) -> str:
-        """Get the next unique ID"""
-
-        order = 0
-        letters = list(string.ascii_lowercase)
-        next_unique_id = temp_id
-        appends: list = []
-        while next_unique_id.lower() in [i.lower() for i in existing_ids]:
-            if len(appends) == 0:
-                order += 1
-                appends = list(itertools.product(letters, repeat=order))
-            next_unique_id = temp_id + "".join(list(appends.pop(0)))
-        temp_id = next_unique_id
-        return temp_id
+    def _retrieve_ids(self, record_dicts: list) -> list:
+        """Retrieve the IDs from the local index (None if not available)"""
+
+        if self.skip_local_index:
+            return [None] * len(record_dicts)
+        return [
+            retrieved_record.data[Fields.ID] if retrieved_record else None
+            for retrieved_record in self.local_index.retrieve_many(record_dicts)
+        ]
 
     def _generate_id(
         self,
         record_dict: dict,
         *,
-        existing_ids: typing.Optional[list] = None,
+        retrieved_id: typing.Optional[str] = None,
     ) -> str:
-        """Generate a blacklist to avoid setting duplicate IDs"""
-
-        if self.skip_local_index:
-            temp_id = self._generate_id_from_pattern(record_dict)
-        else:
-            try:
-                retrieved_record = self.local_index.retrieve(record_dict)
-                temp_id = retrieved_record.data[Fields.ID]  # pragma: no cover
-            except (
-                colrev_exceptions.RecordNotInIndexException,
-                colrev_exceptions.NotEnoughDataToIdentifyException,
-            ):
-                temp_id = self._generate_id_from_pattern(record_dict)
-
-        if existing_ids:
-            temp_id = self._make_id_unique(
-                temp_id,
-                existing_ids=existing_ids,
-            )
+        """Generate an ID (retrieved from the local index or based on the pattern)"""
 
-        return temp_id
-
-    def set_ids(
-        self, records: dict, *, selected_ids: typing.Optional[list] = None
-    ) -> dict:
-        """Set the IDs for the records in the dataset"""
+        if retrieved_id:
+            return retrieved_id  # pragma: no cover
+        return self._generate_id_from_pattern(record_dict)
 
-        id_list = list(records.keys())
+    def _get_ids_to_set(
+        self, records: dict, *, selected_ids: typing.Optional[list]
+    ) -> typing.Tuple[list, dict]:
+        """Get the IDs of records that should be set (and their original status)"""
 
-        for record_id in tqdm(list(records.keys())):
-            record_dict = records[record_id]
-            if selected_ids is not None:
-                if record_id not in selected_ids:  # pragma: no cover
+        selected = set(selected_ids) if selected_ids is not None else None
+        record_ids, temp_stats = [], {}
+        for record_id, record_dict in records.items():
+            if selected is not None:
+                if record_id not in selected:  # pragma: no cover
                     continue
             elif record_dict[Fields.STATUS] not in [
                 RecordState.md_imported,
                 RecordState.md_prepared,
             ]:
                 continue
-            old_id = record_id
 
-            temp_stat = record_dict[Fields.STATUS]
             if selected_ids:
+                temp_stats[record_id] = record_dict[Fields.STATUS]
                 record = colrev.record.record.Record(record_dict)
                 record.set_status(RecordState.md_prepared)
 
-            new_id = old_id
             # Only change IDs that are before md_processed
-            if record_dict[Fields.STATUS] not in RecordState.get_post_x_states(
+            if record_dict[Fields.STATUS] in RecordState.get_post_x_states(
                 state=RecordState.md_processed
-            ):
-                new_id = self._generate_id(
-                    record_dict,
-                    existing_ids=[x for x in id_list if x != record_id],
-                )
+            ):  # pragma: no cover
+                if record_id in temp_stats:
+                    record.set_status(temp_stats.pop(record_id))
+                continue
+            record_ids.append(record_id)
+        return record_ids, temp_stats
 
-            if selected_ids:
+    def set_ids(
+        self, records: dict, *, selected_ids: typing.Optional[list] = None
+    ) -> dict:
+        """Set the IDs for the records in the dataset"""
+
+        id_index = _IDIndex(records.keys())
+        record_ids, temp_stats = self._get_ids_to_set(
+            records, selected_ids=selected_ids
+        )
+        retrieved_ids = self._retrieve_ids([records[x] for x in record_ids])
+
+        for record_id, retrieved_id in zip(tqdm(record_ids), retrieved_ids):
+            record_dict = records[record_id]
+            new_id = self._generate_id(record_dict, retrieved_id=retrieved_id)
+            new_id = id_index.make_unique(new_id, record_id=record_id)
+
+            if record_id in temp_stats:
                 record = colrev.record.record.Record(record_dict)
-                record.set_status(temp_stat)
+                record.set_status(temp_stats[record_id])
 
             self._update_id(
                 records,
-                id_list=id_list,
+                id_index=id_index,
                 record_dict=record_dict,
-                old_id=old_id,
+                old_id=record_id,
                 new_id=new_id,
             )
 
@@ -188,18 +175,88 @@ class IDSetter:
         self,
         records: dict,
         *,
-        id_list: list,
+        id_index: _IDIndex,
         record_dict: dict,
         old_id: str,
         new_id: str,
     ) -> None:
-        id_list.append(new_id)
         if old_id != new_id:
+            id_index.remove(old_id)
+            id_index.add(new_id)
             # We need to insert the a new element into records
             # to make sure that the IDs are actually saved
             record_dict.update(ID=new_id)
             records[new_id] = record_dict
             del records[old_id]
             self.logger.info(f"set_ids({old_id}) to {new_id}")
-            if old_id in id_list:
-                id_list.remove(old_id)
+
+
+def _get_suffix(index: int) -> str:
+    """Get the suffix at the index of the sequence '', a, ..., z, aa, ab, ..."""
+    letters = string.ascii_lowercase
+    suffix = ""
+    order = 0
+    while index >= len(letters) ** order:
+        index -= len(letters) ** order
+        order += 1
+    for _ in range(order):
+        index, remainder = divmod(index, len(letters))
+        suffix = letters[remainder] + suffix
+    return suffix
+
+
+def _get_suffix_index(suffix: str) -> int:
+    """Get the index of the suffix (inverse of _get_suffix)"""
+    letters = string.ascii_lowercase
+    index = sum(len(letters) ** order for order in range(len(suffix)))
+    value = 0
+    for letter in suffix:
+        value = value * len(letters) + letters.index(letter)
+    return index + value
+
+
+class _IDIndex:
+    """Case-insensitive index of the record IDs (to make IDs unique)"""
+
+    def __init__(self, record_ids: typing.Iterable[str]) -> None:
+        self._counts = collections.Counter(x.lower() for x in record_ids)
+        # Index of the first suffix that may be available (per lower-case temp_id)
+        self._next_suffix_index: typing.Dict[str, int] = {}
+
+    def add(self, record_id: str) -> None:
+        """Add an ID"""
+        self._counts[record_id.lower()] += 1
+
+    def remove(self, record_id: str) -> None:
+        """Remove an ID"""
+        lower_id = record_id.lower()
+        self._counts[lower_id] -= 1
+        if self._counts[lower_id] <= 0:
+            del self._counts[lower_id]
+        # The ID may become available for temp_ids that are prefixes of lower_id
+        pos = len(lower_id)
+        self._next_suffix_index.pop(lower_id, None)
+        while pos > 0 and lower_id[pos - 1] in string.ascii_lowercase:
+            pos -= 1
+            self._next_suffix_index.pop(lower_id[:pos], None)
+
+    def make_unique(self, temp_id: str, *, record_id: str) -> str:
+        """Get the next unique ID (the record_id itself is not considered)"""
+
+        lower_temp_id = temp_id.lower()
+        index = self._next_suffix_index.get(lower_temp_id, 0)
+        while lower_temp_id + _get_suffix(index) in self._counts:
+            index += 1
+        self._next_suffix_index[lower_temp_id] = index
+
+        # The record_id is available (unless other IDs differ only in case)
+        lower_record_id = record_id.lower()
+        suffix = lower_record_id[len(lower_temp_id) :]
+        if (
+            lower_record_id.startswith(lower_temp_id)
+            and all(x in string.ascii_lowercase for x in suffix)
+            and self._counts[lower_record_id] == 1
+        ):
+            index = min(index, _get_suffix_index(suffix))
+
+        return temp_id + _get_suffix(index)
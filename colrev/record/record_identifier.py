@@ -3,16 +3,14 @@
 from __future__ import annotations
 
 import logging
+import multiprocessing as mp
 import os
 import re
-import tempfile
 import typing
+from functools import partial
 from pathlib import Path
 
-import imagehash
-import pymupdf
 from nameparser import HumanName
-from PIL import Image
 
 import colrev.env.utils
 import colrev.exceptions as colrev_exceptions
@@ -24,8 +22,13 @@ from colrev.constants import FieldValues
 from colrev.constants import RecordState
 
 if typing.TYPE_CHECKING:  # pragma: no cover
+    import pymupdf
+
     import colrev.record.record
 
+# Note : pymupdf and imagehash are imported when PDFs are hashed (not on import)
+# pylint: disable=import-outside-toplevel
+
 
 def _format_author_field_for_cid(input_string: str) -> str:
     input_string = input_string.replace("\n", " ").replace("'", "")
@@ -192,26 +195,35 @@ def get_colrev_id(record: colrev.record.record.Record, *, assume_complete: bool)
     return srep
 
 
+def get_pdf_page_hash(page: pymupdf.Page, *, hash_size: int) -> str:
+    """Get the average hash of a PDF page (rendered in memory)"""
+    import imagehash
+    from PIL import Image
+
+    # Note : the resolution (200 dpi) is part of the cpid2 definition
+    # and of the stored page hashes (it cannot be adapted to the hash size)
+    pix = page.get_pixmap(dpi=200, alpha=False)
+    img = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+    average_hash = imagehash.average_hash(img, hash_size=hash_size)
+    return str(average_hash).replace("\n", "")
+
+
 def _get_colrev_pdf_id_cpid2(pdf_path: Path) -> str:
-    with tempfile.NamedTemporaryFile(suffix=".png") as temp_file:
-        file_name = temp_file.name
-        try:
-            doc: pymupdf.Document = pymupdf.open(pdf_path)
+    import pymupdf
+
+    try:
+        with pymupdf.open(pdf_path) as doc:
             page = next(iter(doc))  # get the first page
-            pix = page.get_pixmap(dpi=200)
-            pix.save(file_name)  # store image as a PNG
-            with Image.open(file_name) as img:
-                average_hash = imagehash.average_hash(img, hash_size=32)
-                average_hash_str = str(average_hash).replace("\n", "")
-                if len(average_hash_str) * "0" == average_hash_str:
-                    raise colrev_exceptions.PDFHashError(path=pdf_path)
-                return "cpid2:" + average_hash_str
-        except StopIteration as exc:  # pragma: no cover
-            raise colrev_exceptions.PDFHashError(path=pdf_path) from exc
-        except pymupdf.FileDataError as exc:
-            raise colrev_exceptions.InvalidPDFException(path=pdf_path) from exc
-        except RuntimeError as exc:
-            raise colrev_exceptions.PDFHashError(path=pdf_path) from exc
+            average_hash_str = get_pdf_page_hash(page, hash_size=32)
+        if len(average_hash_str) * "0" == average_hash_str:
+            raise colrev_exceptions.PDFHashError(path=pdf_path)
+        return "cpid2:" + average_hash_str
+    except StopIteration as exc:  # pragma: no cover
+        raise colrev_exceptions.PDFHashError(path=pdf_path) from exc
+    except pymupdf.FileDataError as exc:
+        raise colrev_exceptions.InvalidPDFException(path=pdf_path) from exc
+    except RuntimeError as exc:
+        raise colrev_exceptions.PDFHashError(path=pdf_path) from exc
 
 
 def get_colrev_pdf_id(pdf_path: Path, *, cpid_version: str = "cpid2") -> str:
@@ -228,6 +240,49 @@ def get_colrev_pdf_id(pdf_path: Path, *, cpid_version: str = "cpid2") -> str:
     raise NotImplementedError
 
 
+# Note : no named arguments (multiprocessing)
+def _get_colrev_pdf_id_or_none(
+    pdf_path: Path, cpid_version: str
+) -> typing.Tuple[Path, typing.Optional[str]]:
+    try:
+        return pdf_path, get_colrev_pdf_id(pdf_path, cpid_version=cpid_version)
+    except (
+        colrev_exceptions.InvalidPDFException,
+        colrev_exceptions.PDFHashError,
+        FileNotFoundError,
+    ) as exc:
+        logging.error("%sCannot create pdf-hash: %s%s", Colors.RED, exc, Colors.END)
+        return pdf_path, None
+
+
+def get_colrev_pdf_ids(
+    pdf_paths: typing.List[Path],
+    *,
+    cpid_version: str = "cpid2",
+    cpu: typing.Optional[int] = None,
+) -> typing.Dict[Path, str]:
+    """Get the PDF hashes of a batch of PDFs (in parallel processes)
+
+    PDFs that cannot be hashed are logged and omitted from the results."""
+
+    get_pdf_id = partial(_get_colrev_pdf_id_or_none, cpid_version=cpid_version)
+    cpu = max(1, min(cpu or mp.cpu_count(), len(pdf_paths)))
+    if cpu == 1:
+        results = map(get_pdf_id, pdf_paths)
+        return {path: pdf_id for path, pdf_id in results if pdf_id is not None}
+
+    with mp.Pool(cpu) as pool:
+        return {
+            path: pdf_id
+            for path, pdf_id in pool.imap_unordered(
+                get_pdf_id,
+                pdf_paths,
+                chunksize=max(1, min(64, len(pdf_paths) // (cpu * 4))),
+            )
+            if pdf_id is not None
+        }
+
+
 def get_toc_key(record: colrev.record.record.Record) -> str:
     """Get the record's toc-key"""
 
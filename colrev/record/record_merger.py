@@ -190,6 +190,9 @@ def fuse_fields(
     # Note : the assumption is that we need masterdata_provenance notes
     # only for authors
 
+    # pylint: disable=import-outside-toplevel
+    import colrev.record.qm.quality_model
+
     quality_model = colrev.record.qm.quality_model.QualityModel(
         defects_to_ignore=[
             DefectCodes.MISSING,
@@ -4,23 +4,137 @@ from __future__ import annotations
 
 import logging
 import os
-import tempfile
 import typing
 from pathlib import Path
 
-import imagehash
 import pymupdf
-from PIL import Image
 
 import colrev.env.utils
 import colrev.exceptions as colrev_exceptions
 import colrev.record.record
+import colrev.record.record_identifier
 from colrev.constants import Colors
 from colrev.constants import Fields
 
 
+class PDFAnalysis:
+    """Analysis of a PDF document (opened once, pages are extracted lazily)
+
+    Page texts, the page count and page hashes are cached.
+    The cache is invalidated when the file changes (mtime/size)."""
+
+    def __init__(self, pdf_path: Path) -> None:
+        self.pdf_path = pdf_path
+        self._doc: typing.Optional[pymupdf.Document] = None
+        self._signature: typing.Optional[typing.Tuple[int, int]] = None
+        self._page_count: typing.Optional[int] = None
+        self._page_texts: typing.Dict[int, str] = {}
+        self._page_hashes: typing.Dict[typing.Tuple[int, int], str] = {}
+
+    def __getstate__(self) -> dict:
+        # Note : documents cannot be pickled (multiprocessing)
+        state = self.__dict__.copy()
+        state["_doc"] = None
+        return state
+
+    def _validate_cache(self) -> None:
+        stat = self.pdf_path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if signature != self._signature:
+            self.close()
+            self._signature = signature
+            self._page_count = None
+            self._page_texts = {}
+            self._page_hashes = {}
+
+    def _get_doc(self) -> pymupdf.Document:
+        self._validate_cache()
+        if self._doc is None:
+            self._doc = pymupdf.open(self.pdf_path)
+        return self._doc
+
+    def close(self) -> None:
+        """Close the document (cached results are kept)"""
+        if self._doc is not None:
+            self._doc.close()
+            self._doc = None
+
+    def get_page_count(self) -> int:
+        """Get the number of pages"""
+        self._validate_cache()
+        if self._page_count is None:
+            self._page_count = self._get_doc().page_count
+        return self._page_count
+
+    def get_page_text(self, page_index: int) -> str:
+        """Get the text of a page (index starting with 0)"""
+        self._validate_cache()
+        if page_index not in self._page_texts:
+            self._page_texts[page_index] = (
+                self._get_doc().load_page(page_index).get_text()
+            )
+        return self._page_texts[page_index]
+
+    def get_text(self, *, pages: typing.Optional[list] = None) -> str:
+        """Get the text of the selected pages (all pages if pages is None)"""
+        page_indices = range(self.get_page_count())
+        if pages is not None:
+            page_indices = sorted({p for p in pages if p in page_indices})  # type: ignore
+        return "".join(self.get_page_text(i) for i in page_indices)
+
+    def get_page_hash(self, *, page_nr: int, hash_size: int) -> str:
+        """Get the average hash of a page (page_nr starting with 1)"""
+        self._validate_cache()
+        if (page_nr, hash_size) in self._page_hashes:
+            return self._page_hashes[(page_nr, hash_size)]
+
+        try:
+            if page_nr > self.get_page_count():
+                raise colrev_exceptions.PDFHashError(path=self.pdf_path)
+            page = self._get_doc().load_page(page_nr - 1)
+            average_hash_str = colrev.record.record_identifier.get_pdf_page_hash(
+                page, hash_size=hash_size
+            )
+            if len(average_hash_str) * "0" == average_hash_str:
+                raise colrev_exceptions.PDFHashError(path=self.pdf_path)
+        except pymupdf.FileDataError as exc:
+            raise colrev_exceptions.InvalidPDFException(path=self.pdf_path) from exc
+        except RuntimeError as exc:
+            raise colrev_exceptions.PDFHashError(path=self.pdf_path) from exc
+
+        self._page_hashes[(page_nr, hash_size)] = average_hash_str
+        return average_hash_str
+
+
 class PDFRecord(colrev.record.record.Record):
-    """The PDFRecord class provides a range of convenience functions for PDF handling"""
+    """The PDFRecord class provides a range of convenience functions for PDF handling
+
+    Used as a context manager, the document of the PDF analysis is closed on exit::
+
+        with PDFRecord(record_dict) as record:
+            record.set_text_from_pdf()
+    """
+
+    _pdf_analysis: typing.Optional[PDFAnalysis] = None
+
+    def __enter__(self) -> PDFRecord:
+        return self
+
+    def __exit__(self, *args: typing.Any) -> None:
+        self.close_pdf_analysis()
+
+    def get_pdf_analysis(self) -> PDFAnalysis:
+        """Get the (cached) analysis of the PDF linked in the file field"""
+        pdf_path = Path(self.data[Fields.FILE]).absolute()
+        if self._pdf_analysis is None or self._pdf_analysis.pdf_path != pdf_path:
+            self.close_pdf_analysis()
+            self._pdf_analysis = PDFAnalysis(pdf_path)
+        return self._pdf_analysis
+
+    def close_pdf_analysis(self) -> None:
+        """Close the document of the PDF analysis"""
+        if self._pdf_analysis is not None:
+            self._pdf_analysis.close()
 
     def extract_text_by_page(
         self,
@@ -28,16 +142,7 @@ class PDFRecord(colrev.record.record.Record):
         pages: typing.Optional[list] = None,
     ) -> str:
         """Extract the text from the PDF for a given number of pages"""
-        text_list: list = []
-        pdf_path = Path(self.data[Fields.FILE]).absolute()
-
-        with pymupdf.open(pdf_path) as doc:
-            for i, page in enumerate(doc):
-                if pages is None or i in pages:
-                    text = page.get_text()
-                    text_list.append(text)
-
-        text_all = "".join(text_list)
+        text_all = self.get_pdf_analysis().get_text(pages=pages)
         text_all = (
             text_all.replace("´\ne", "é").replace("ˆ\no", "ô").replace("´\na", "á")
         )
@@ -48,10 +153,7 @@ class PDFRecord(colrev.record.record.Record):
 
     def set_nr_pages_in_pdf(self) -> None:
         """Set the pages_in_file field based on the PDF"""
-        pdf_path = Path(self.data[Fields.FILE]).absolute()
-        with pymupdf.open(pdf_path) as doc:
-            pages_in_file = doc.page_count
-        self.data[Fields.NR_PAGES_IN_FILE] = pages_in_file
+        self.data[Fields.NR_PAGES_IN_FILE] = self.get_pdf_analysis().get_page_count()
 
     def set_text_from_pdf(self) -> None:
         """Set the text_from_pdf field based on the PDF"""
@@ -100,6 +202,9 @@ class PDFRecord(colrev.record.record.Record):
     ) -> None:  # pragma: no cover
         """Extract pages from the PDF"""
         pdf_path = project_path / Path(self.data[Fields.FILE])
+        # The file is modified (reset the analysis)
+        self.close_pdf_analysis()
+        self._pdf_analysis = None
         self.extract_pages_from_pdf(
             pages=pages, pdf_path=pdf_path, save_to_path=save_to_path
         )
@@ -117,26 +222,6 @@ class PDFRecord(colrev.record.record.Record):
             logging.error("%sPDF with size 0: %s %s", Colors.RED, pdf_path, Colors.END)
             raise colrev_exceptions.InvalidPDFException(path=pdf_path)
 
-        with tempfile.NamedTemporaryFile(suffix=".png") as temp_file:
-            file_name = temp_file.name
-            try:
-                doc: pymupdf.Document = pymupdf.open(pdf_path)
-                # Starting with page 1
-                for page_no, page in enumerate(doc, 1):
-                    if page_no == page_nr:
-                        pix = page.get_pixmap(dpi=200)
-                        pix.save(file_name)  # store image as a PNG
-                        with Image.open(file_name) as img:
-                            average_hash = imagehash.average_hash(
-                                img, hash_size=hash_size
-                            )
-                            average_hash_str = str(average_hash).replace("\n", "")
-                            if len(average_hash_str) * "0" == average_hash_str:
-                                raise colrev_exceptions.PDFHashError(path=pdf_path)
-                            return average_hash_str
-                # Page not found
-                raise colrev_exceptions.PDFHashError(path=pdf_path)  # pragma: no cover
-            except pymupdf.FileDataError as exc:
-                raise colrev_exceptions.InvalidPDFException(path=pdf_path) from exc
-            except RuntimeError as exc:
-                raise colrev_exceptions.PDFHashError(path=pdf_path) from exc
+        return self.get_pdf_analysis().get_page_hash(
+            page_nr=page_nr, hash_size=hash_size
+        )
@@ -2,16 +2,20 @@
 """Functionality to determine similarity betwen records."""
 from __future__ import annotations
 
+import heapq
+import math
 import re
 import typing
+from functools import lru_cache
 
-import pandas as pd
-from bib_dedupe.bib_dedupe import block
-from bib_dedupe.bib_dedupe import match
-from bib_dedupe.bib_dedupe import prep
+from bib_dedupe.constants.fields import AUTHOR_FIRST
+from bib_dedupe.constants.fields import CONTAINER_TITLE_SHORT
+from bib_dedupe.constants.fields import SEARCH_SET
+from bib_dedupe.constants.fields import TITLE_SHORT
 from rapidfuzz import fuzz
 
 import colrev.env.utils
+from colrev.constants import ENTRYTYPES
 from colrev.constants import Fields
 from colrev.constants import FieldValues
 
@@ -203,66 +207,463 @@ def _get_similarity_detailed(record_a: dict, record_b: dict) -> float:
     return round(weighted_average, 4)
 
 
-def _ensure_mandatory_fields(
+_SIMILARITY_MANDATORY_FIELDS = [
+    Fields.TITLE,
+    Fields.AUTHOR,
+    Fields.YEAR,
+    Fields.JOURNAL,
+    Fields.VOLUME,
+    Fields.NUMBER,
+    Fields.PAGES,
+    Fields.BOOKTITLE,
+]
+
+
+def _prep_record_for_similarity(record: colrev.record.record.Record) -> dict:
+    record = record.copy()
+    for mandatory_field in _SIMILARITY_MANDATORY_FIELDS:
+        if record.data.get(mandatory_field, FieldValues.UNKNOWN) == FieldValues.UNKNOWN:
+            record.data[mandatory_field] = ""
+
+    _abbreviate_container_title(record)
+    _format_authors_string_for_comparison(record)
+    return record.get_data()
+
+
+def get_record_similarity(
     record_a: colrev.record.record.Record, record_b: colrev.record.record.Record
-) -> None:
-    mandatory_fields = [
-        Fields.TITLE,
-        Fields.AUTHOR,
-        Fields.YEAR,
-        Fields.JOURNAL,
-        Fields.VOLUME,
-        Fields.NUMBER,
-        Fields.PAGES,
-        Fields.BOOKTITLE,
+) -> float:
+    """Determine the similarity between two records (their masterdata)"""
+
+    return _get_similarity_detailed(
+        _prep_record_for_similarity(record_a), _prep_record_for_similarity(record_b)
+    )
+
+
+def _has_journal(record_dict: dict) -> bool:
+    return record_dict.get(Fields.JOURNAL, "") not in ["", FieldValues.UNKNOWN]
+
+
+def _block_candidates(
+    prepared_candidates: typing.List[dict],
+) -> typing.Tuple[typing.Dict[tuple, typing.List[int]], typing.List[int]]:
+    # Note : for journal articles, volume and number have weights >= 0.1,
+    # i.e., a volume or number mismatch caps the similarity at 0.9,
+    # which is excluded by the strict comparison (similarity > min_similarity)
+    journal_blocks: typing.Dict[tuple, typing.List[int]] = {}
+    other_candidates: typing.List[int] = []
+    for index, candidate in enumerate(prepared_candidates):
+        if _has_journal(candidate):
+            key = (candidate[Fields.VOLUME], candidate[Fields.NUMBER])
+            journal_blocks.setdefault(key, []).append(index)
+        else:
+            other_candidates.append(index)
+    return journal_blocks, other_candidates
+
+
+def get_most_similar_records(
+    records: typing.List[colrev.record.record.Record],
+    candidates: typing.List[colrev.record.record.Record],
+    *,
+    min_similarity: float,
+) -> typing.List[typing.Optional[colrev.record.record.Record]]:
+    """Get the most similar candidate for each record
+
+    Corresponds to comparing all pairs with get_record_similarity
+    (the first candidate with the highest similarity > min_similarity is selected).
+    Records are prepared once and journal articles are blocked by volume and number.
+    """
+
+    prepared_candidates = [_prep_record_for_similarity(c) for c in candidates]
+    blocking = min_similarity >= 0.9
+    journal_blocks, other_candidates = _block_candidates(prepared_candidates)
+
+    most_similar_records: typing.List[typing.Optional[colrev.record.record.Record]]
+    most_similar_records = []
+    for record in records:
+        record_dict = _prep_record_for_similarity(record)
+        candidate_indices: typing.Iterable[int] = range(len(prepared_candidates))
+        if blocking and _has_journal(record_dict):
+            candidate_indices = heapq.merge(
+                journal_blocks.get(
+                    (record_dict[Fields.VOLUME], record_dict[Fields.NUMBER]), []
+                ),
+                other_candidates,
+            )
+
+        max_similarity = min_similarity
+        most_similar_record = None
+        for index in candidate_indices:
+            similarity = _get_similarity_detailed(
+                record_dict, prepared_candidates[index]
+            )
+            if similarity > max_similarity:
+                max_similarity = similarity
+                most_similar_record = candidates[index]
+        most_similar_records.append(most_similar_record)
+
+    return most_similar_records
+
+
+# Note: the matcher reproduces the decisions of the bib_dedupe pipeline
+# (prep -> block -> match) for individual pairs of records without
+# creating DataFrames (which is expensive for pairs that are matched in prep).
+# It relies on the prep and sim functions of the exact bib-dedupe version
+# (pinned in pyproject.toml). The parity tests (record_similarity_test.py)
+# compare the decisions with bib_dedupe.match when the version is updated.
+# bib_dedupe (and pandas) are imported when records are matched (not on import).
+
+# pylint: disable=import-outside-toplevel
+
+# Values considered missing by bib_dedupe.prep (general prep)
+_MISSING_VALUES = ["#NAME?", "UNKNOWN", ""]
+# Values replaced by bib_dedupe.prep (replacements of complete field values)
+_REPLACED_VALUES = {
+    "UNKNOWN": "",
+    "n/a": "",
+    "N/A": "",
+    "NA": "",
+    "&amp;": "and",
+    " & ": " and ",
+    " + ": " and ",
+}
+_CONTAINER_TITLE_FIELDS = {
+    ENTRYTYPES.ARTICLE: Fields.JOURNAL,
+    ENTRYTYPES.INPROCEEDINGS: Fields.BOOKTITLE,
+    ENTRYTYPES.PROCEEDINGS: Fields.BOOKTITLE,
+    ENTRYTYPES.INBOOK: Fields.BOOKTITLE,
+    ENTRYTYPES.BOOK: Fields.TITLE,
+}
+
+
+def _get_field_value(value: typing.Any) -> str:
+    if isinstance(value, float):
+        value = "" if math.isnan(value) else str(int(value))
+    value = str(value)
+    if value in _MISSING_VALUES:
+        return ""
+    return value
+
+
+@lru_cache(maxsize=10000)
+def _prep_field_value(field: str, value: str) -> str:
+    """Prepare a field value (bib_dedupe.prep.function_mapping).
+    Values are cached because the same records are typically matched
+    against several candidates (and their preparation is expensive)."""
+    import bib_dedupe.prep
+    import numpy as np
+    from bib_dedupe.prep_author import select_authors
+
+    prepared_values = bib_dedupe.prep.function_mapping[field](np.array([value], object))
+    if field == Fields.AUTHOR:
+        prepared_values = select_authors(prepared_values)
+    return str(prepared_values[0])
+
+
+def _prep_record(record: colrev.record.record.Record) -> typing.Optional[dict]:
+    """Prepare the record for matching (like bib_dedupe.prep.prep()).
+    Records without a title cannot be matched (None)."""
+    import bib_dedupe.prep
+    import numpy as np
+    from bib_dedupe.prep_container_title import get_container_title_short
+
+    prepared: typing.Dict[str, typing.Any] = {
+        key: _get_field_value(record.data.get(key, ""))
+        for key in bib_dedupe.prep.REQUIRED_FIELDS + bib_dedupe.prep.OPTIONAL_FIELDS
+    }
+    if prepared[Fields.TITLE] == "":
+        return None
+    prepared = {
+        key: _REPLACED_VALUES.get(value, value) for key, value in prepared.items()
+    }
+    if Fields.ENTRYTYPE not in record.data:
+        prepared[Fields.ENTRYTYPE] = ENTRYTYPES.ARTICLE
+    prepared[Fields.CONTAINER_TITLE] = prepared.get(
+        _CONTAINER_TITLE_FIELDS.get(prepared[Fields.ENTRYTYPE], ""), ""
+    )
+    prepared["author_full"] = prepared[Fields.AUTHOR]
+
+    for key in bib_dedupe.prep.function_mapping:
+        prepared[key] = _prep_field_value(key, prepared[key])
+    # Fix cases where years are erroneously entered into pages field
+    if prepared[Fields.PAGES] == prepared[Fields.YEAR]:
+        prepared[Fields.PAGES] = ""
+    prepared[TITLE_SHORT] = " ".join(prepared[Fields.TITLE].split()[:10])
+    prepared[CONTAINER_TITLE_SHORT] = str(
+        get_container_title_short(np.array([prepared[Fields.CONTAINER_TITLE]]))[0]
+    )
+    for key, value in prepared.items():
+        if value == "nan":
+            prepared[key] = ""
+    # Note: like the pandas NaN in bib_dedupe, records without authors
+    # share the (non-empty) author_first block value
+    prepared[AUTHOR_FIRST] = (
+        prepared[Fields.AUTHOR].split()[0] if prepared[Fields.AUTHOR].split() else None
+    )
+    return prepared
+
+
+def _is_blocked(record_a: dict, record_b: dict) -> bool:
+    """Determine whether the pair would be blocked (bib_dedupe.block.block())"""
+    import bib_dedupe.block
+
+    block_rules = [
+        block_fields
+        for block_fields in bib_dedupe.block.block_fields_list
+        if all(
+            record_a[field] != "" and record_a[field] == record_b[field]
+            for field in block_fields
+        )
     ]
+    if not block_rules:
+        return False
+
+    if record_a[SEARCH_SET] != "" and record_a[SEARCH_SET] == record_b[SEARCH_SET]:
+        return False
+
+    title_a, title_b = record_a[Fields.TITLE], record_b[Fields.TITLE]
+    # Title overlap is only required when no blocking rule covers the title
+    if (
+        all(
+            not block_fields.intersection({TITLE_SHORT, Fields.DOI, Fields.PAGES})
+            for block_fields in block_rules
+        )
+        and title_a != title_b
+        and " " in title_a
+        and " " in title_b
+    ):
+        words_a, words_b = title_a.split(), title_b.split()
+        overlap = len(set(words_a) & set(words_b)) / min(
+            len(words_a) + 1, len(words_b) + 1
+        )
+        if overlap < 0.5:
+            return False
+    return True
+
+
+class _Pair:
+    """A pair of prepared records and their similarities (bib_dedupe.sim)"""
+
+    def __init__(self, record_a: dict, record_b: dict) -> None:
+        import bib_dedupe.sim
+
+        self.record_a = {key: str(value) for key, value in record_a.items()}
+        self.record_b = {key: str(value) for key, value in record_b.items()}
+        self.sim = {
+            Fields.AUTHOR: bib_dedupe.sim.sim_author(
+                self.record_a[Fields.AUTHOR],
+                self.record_a["author_full"],
+                self.record_b[Fields.AUTHOR],
+                self.record_b["author_full"],
+            )
+        }
+        for field, similarity_function in bib_dedupe.sim.similarity_functions.items():
+            self.sim[field] = float(
+                similarity_function(self.record_a[field], self.record_b[field])
+            )
+        self.page_ranges_adjacent = bib_dedupe.sim.page_ranges_adjacent(
+            {
+                "pages_1": self.record_a[Fields.PAGES],
+                "pages_2": self.record_b[Fields.PAGES],
+            }
+        )
+
+    def match(self, *fields: str) -> bool:
+        """The similarities of the fields are 1.0"""
+        return all(self.sim[field] == 1.0 for field in fields)
+
+    def non_contradicting(self, *fields: str) -> bool:
+        """The fields are identical or missing in one of the records"""
+        return all(
+            self.record_a[field] == self.record_b[field]
+            or self.record_a[field] == ""
+            or self.record_b[field] == ""
+            for field in fields
+        )
+
+    def mismatch(self, *fields: str) -> bool:
+        """The fields differ and are not missing"""
+        return all(
+            self.record_a[field] != self.record_b[field]
+            and self.record_a[field] != ""
+            and self.record_b[field] != ""
+            for field in fields
+        )
 
-    for mandatory_field in mandatory_fields:
+
+def _is_duplicate(pair: _Pair) -> bool:
+    """The duplicate conditions (bib_dedupe.match_conditions)"""
+    # pylint: disable=too-many-return-statements
+    # pylint: disable=too-many-branches
+    author = pair.sim[Fields.AUTHOR]
+    title = pair.sim[Fields.TITLE]
+    container_title = pair.sim[Fields.CONTAINER_TITLE]
+    volume, number, pages = Fields.VOLUME, Fields.NUMBER, Fields.PAGES
+    year, doi, abstract = Fields.YEAR, Fields.DOI, Fields.ABSTRACT
+
+    # Substantial differences in one of AUTHOR/TITLE/CONTAINER_TITLE
+    if pair.match(Fields.TITLE, Fields.CONTAINER_TITLE) and author > 0.7:
+        if pair.match(volume, pages) or pair.sim[doi] > 0.9:
+            return True
+        if pair.non_contradicting(volume, number, pages, year, doi):
+            return True
+    if pair.match(Fields.AUTHOR, Fields.CONTAINER_TITLE) and title > 0.7:
+        if pair.non_contradicting(number, pages, year, doi):
+            return True
+    if pair.match(Fields.TITLE, Fields.AUTHOR) and container_title > 0.7:
+        if pair.non_contradicting(volume, number, pages, year, doi):
+            return True
+
+    # Differences across AUTHOR/TITLE/CONTAINER_TITLE
+    if author > 0.8 and title > 0.9 and container_title > 0.9:
+        if pair.non_contradicting(volume, number, year, doi) and pair.sim[pages] > 0.75:
+            return True
+        if pair.non_contradicting(volume, number, pages, doi):
+            return True
+    if author > 0.95 and title > 0.9 and container_title > 0.75:
+        if pair.non_contradicting(volume, number, pages, year, doi):
+            return True
         if (
-            record_a.data.get(mandatory_field, FieldValues.UNKNOWN)
-            == FieldValues.UNKNOWN
+            pair.match(number, pages)
+            or pair.match(volume, number)
+            or pair.match(volume, pages)
         ):
-            record_a.data[mandatory_field] = ""
+            return True
+        if (pair.match(volume) and pair.sim[abstract] > 0.9) or pair.match(
+            year, abstract
+        ):
+            return True
+        # Inproceedings
         if (
-            record_b.data.get(mandatory_field, FieldValues.UNKNOWN)
-            == FieldValues.UNKNOWN
+            pair.record_a[Fields.ENTRYTYPE] == ENTRYTYPES.INPROCEEDINGS
+            and pair.record_b[Fields.ENTRYTYPE] == ENTRYTYPES.INPROCEEDINGS
+            and pair.match(year)
         ):
-            record_b.data[mandatory_field] = ""
+            return True
 
+    # no AUTHOR
+    if title > 0.95 and container_title > 0.95:
+        if pair.non_contradicting(volume, number, pages, year, doi):
+            return True
+        if pair.match(volume, number, pages, year) and pair.non_contradicting(
+            doi, abstract
+        ):
+            return True
 
-def get_record_similarity(
-    record_a: colrev.record.record.Record, record_b: colrev.record.record.Record
-) -> float:
-    """Determine the similarity between two records (their masterdata)"""
+    # no CONTAINER_TITLE
+    if (
+        pair.match(Fields.AUTHOR, Fields.TITLE)
+        and pair.non_contradicting(Fields.CONTAINER_TITLE)
+        and pair.match(volume, year)
+        and pair.non_contradicting(number, pages, doi, abstract)
+    ):
+        return True
+    if author > 0.9 and title > 0.9:
+        if (
+            pair.match(pages, doi)
+            and pair.non_contradicting(volume, number, abstract)
+            and pair.sim[year] > 0.9
+        ):
+            return True
+        if (
+            (pair.match(number) and pair.non_contradicting(pages))
+            or (pair.non_contradicting(number) and pair.match(pages))
+        ) and pair.non_contradicting(volume, year, doi, abstract):
+            return True
+        if pair.match(volume, pages):
+            return True
+        if pair.match(pages, year) and pair.non_contradicting(volume, number, doi):
+            return True
 
-    record_a = record_a.copy()
-    record_b = record_b.copy()
+    # no TITLE (typically for number-mismatches in title)
+    return (
+        pair.match(Fields.AUTHOR)
+        and pair.match(Fields.CONTAINER_TITLE)
+        and pair.match(volume, number, pages, year)
+        and pair.non_contradicting(doi)
+        and (pair.sim[abstract] > 0.95 or pair.non_contradicting(abstract))
+    )
+
+
+def _is_non_duplicate(pair: _Pair) -> bool:
+    """The non-duplicate conditions (bib_dedupe.match_conditions)"""
+    volume, number, pages = Fields.VOLUME, Fields.NUMBER, Fields.PAGES
 
-    _ensure_mandatory_fields(record_a, record_b)
+    if pair.mismatch(Fields.YEAR) and not (
+        pair.match(volume)
+        or pair.match(number)
+        or pair.match(pages)
+        or pair.match(Fields.DOI)
+        or pair.match(Fields.CONTAINER_TITLE)
+    ):
+        return True
+    if pair.mismatch(Fields.TITLE) and pair.page_ranges_adjacent in [
+        "adjacent",
+        "non_overlapping",
+    ]:
+        return True
+    if (
+        pair.record_a[Fields.DOI] != ""
+        and pair.record_b[Fields.DOI] != ""
+        and pair.sim[Fields.DOI] < 0.8
+        and not pair.non_contradicting(
+            Fields.AUTHOR,
+            Fields.TITLE,
+            Fields.YEAR,
+            Fields.CONTAINER_TITLE,
+            volume,
+            number,
+            pages,
+        )
+    ):
+        return True
+    if pair.mismatch(volume, number, pages):
+        return True
+    # Editorials: minor differences in volume/number/pages can be meaningful
+    return (
+        "editor" in pair.record_a[Fields.TITLE]
+        and len(pair.record_a[Fields.TITLE]) < 60
+        and (pair.mismatch(volume) or pair.mismatch(number) or pair.mismatch(pages))
+    )
 
-    _abbreviate_container_title(record_a)
-    _abbreviate_container_title(record_b)
-    _format_authors_string_for_comparison(record_a)
-    _format_authors_string_for_comparison(record_b)
 
-    return _get_similarity_detailed(record_a.get_data(), record_b.get_data())
+def _is_match(record_a: dict, record_b: dict) -> bool:
+    """Determine whether the pair is a duplicate (bib_dedupe.match.match())"""
+    pair = _Pair(record_a, record_b)
+    return _is_duplicate(pair) and not _is_non_duplicate(pair)
+
+
+def match_pairs(
+    pairs: typing.List[
+        typing.Tuple[colrev.record.record.Record, colrev.record.record.Record]
+    ],
+) -> typing.List[bool]:
+    """Determine whether the pairs of records match (correspond to the same entity).
+    Records that are part of several pairs are prepared once."""
+
+    records: typing.Dict[int, colrev.record.record.Record] = {}
+    for record_a, record_b in pairs:
+        records.setdefault(id(record_a), record_a)
+        records.setdefault(id(record_b), record_b)
+    prepared_records = {
+        record_id: _prep_record(record) for record_id, record in records.items()
+    }
+
+    results = []
+    for record_a, record_b in pairs:
+        prepared_a = prepared_records[id(record_a)]
+        prepared_b = prepared_records[id(record_b)]
+        results.append(
+            prepared_a is not None
+            and prepared_b is not None
+            and _is_blocked(prepared_a, prepared_b)
+            and _is_match(prepared_a, prepared_b)
+        )
+    return results
 
 
 def matches(
     record_a: colrev.record.record.Record, record_b: colrev.record.record.Record
 ) -> bool:
     """Determine whether two records match (correspond to the same entity)."""
-    record_a_dict = record_a.copy().get_data()
-    record_b_dict = record_b.copy().get_data()
-    record_a_dict[Fields.ID] = "a"
-    record_b_dict[Fields.ID] = "b"
-
-    records_df = pd.DataFrame([record_a_dict, record_b_dict])
-    records_df = prep(records_df, verbosity_level=0, cpu=1)
-    blocked_df = block(records_df, verbosity_level=0, cpu=1)
-    matched_df = match(blocked_df, verbosity_level=0, cpu=1)
-    duplicate_label = matched_df["duplicate_label"]
-    if len(duplicate_label) == 0:  # pragma: no cover
-        return False
-
-    return duplicate_label.iloc[0] == "duplicate"
+    return match_pairs([(record_a, record_b)])[0]
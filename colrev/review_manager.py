@@ -7,11 +7,9 @@ import os
 import pprint
 import typing
 from dataclasses import asdict
-from datetime import timedelta
 from pathlib import Path
 
 import git
-import requests_cache
 import yaml
 
 import colrev.dataset
@@ -20,13 +18,17 @@ import colrev.logger
 import colrev.ops.check
 import colrev.ops.checker
 import colrev.process.operation
-import colrev.record.qm.quality_model
 import colrev.settings
 from colrev.constants import Colors
-from colrev.constants import Filepaths
 from colrev.constants import OperationsType
 from colrev.paths import PathManager
 
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import requests_cache
+
+    import colrev.process.profiler
+    import colrev.record.qm.quality_model
+
 
 class ReviewManager:
     """Class for managing individual CoLRev review project (repositories)"""
@@ -300,6 +302,7 @@ class ReviewManager:
 
     def get_qm(self) -> colrev.record.qm.quality_model.QualityModel:  # pragma: no cover
         """Get the quality model"""
+        import colrev.record.qm.quality_model
 
         return colrev.record.qm.quality_model.QualityModel(
             defects_to_ignore=self.settings.prep.defects_to_ignore
@@ -309,6 +312,7 @@ class ReviewManager:
         self,
     ) -> colrev.record.qm.quality_model.QualityModel:  # pragma: no cover
         """Get the PDF quality model"""
+        import colrev.record.qm.quality_model
 
         return colrev.record.qm.quality_model.QualityModel(
             defects_to_ignore=self.settings.pdf_get.defects_to_ignore, pdf_mode=True
@@ -381,12 +385,11 @@ class ReviewManager:
 
     @classmethod
     def get_cached_session(cls) -> requests_cache.CachedSession:  # pragma: no cover
-        """Get a cached session"""
+        """Get the cached session (shared by all threads of the process)"""
+        import colrev.env.http_session_manager
 
-        return requests_cache.CachedSession(
-            str(Filepaths.PREP_REQUESTS_CACHE_FILE),
-            backend="sqlite",
-            expire_after=timedelta(days=30),
+        return (
+            colrev.env.http_session_manager.HTTPSessionManager.get_instance().get_session()
         )
 
     @classmethod
@@ -428,6 +431,8 @@ class ReviewManager:
         polish: bool = False,
         cpu: int = 4,
         debug: bool = False,
+        prep_cache: bool = False,
+        profiler: typing.Optional[colrev.process.profiler.OperationProfiler] = None,
     ) -> colrev.ops.prep.Prep:  # pragma: no cover
         """Get a prep operation object"""
         if debug:
@@ -446,6 +451,8 @@ class ReviewManager:
             notify_state_transition_operation=notify_state_transition_operation,
             polish=polish,
             cpu=cpu,
+            prep_cache=prep_cache,
+            profiler=profiler,
         )
 
     def get_prep_man_operation(
@@ -483,7 +490,10 @@ class ReviewManager:
         )
 
     def get_pdf_get_operation(
-        self, *, notify_state_transition_operation: bool = True
+        self,
+        *,
+        notify_state_transition_operation: bool = True,
+        profiler: typing.Optional[colrev.process.profiler.OperationProfiler] = None,
     ) -> colrev.ops.pdf_get.PDFGet:  # pragma: no cover
         """Get a pdf-get operation object"""
         import colrev.ops.pdf_get
@@ -491,6 +501,7 @@ class ReviewManager:
         return colrev.ops.pdf_get.PDFGet(
             review_manager=self,
             notify_state_transition_operation=notify_state_transition_operation,
+            profiler=profiler,
         )
 
     def get_pdf_get_man_operation(
@@ -505,7 +516,12 @@ class ReviewManager:
         )
 
     def get_pdf_prep_operation(
-        self, *, reprocess: bool = False, notify_state_transition_operation: bool = True
+        self,
+        *,
+        reprocess: bool = False,
+        notify_state_transition_operation: bool = True,
+        cpu: typing.Optional[int] = None,
+        profiler: typing.Optional[colrev.process.profiler.OperationProfiler] = None,
     ) -> colrev.ops.pdf_prep.PDFPrep:  # pragma: no cover
         """Get a pdfprep operation object"""
         import colrev.ops.pdf_prep
@@ -514,6 +530,8 @@ class ReviewManager:
             review_manager=self,
             reprocess=reprocess,
             notify_state_transition_operation=notify_state_transition_operation,
+            cpu=cpu,
+            profiler=profiler,
         )
 
     def get_pdf_prep_man_operation(
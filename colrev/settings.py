@@ -179,6 +179,15 @@ class SearchSource(JsonSchemaMixin):
     ) -> colrev.ops.search_api_feed.SearchAPIFeed:
         """Get a feed to add and update records"""
 
+        if prep_mode:
+            resident_feed = colrev.ops.search_api_feed.SearchAPIFeed.get_resident_feed(
+                review_manager=review_manager,
+                source_identifier=source_identifier,
+                search_source=self,
+            )
+            if resident_feed is not None:
+                return resident_feed
+
         return colrev.ops.search_api_feed.SearchAPIFeed(
             review_manager=review_manager,
             source_identifier=source_identifier,
@@ -15,27 +15,19 @@ from pathlib import Path
 
 import click
 import click_completion.core
-import click_repl
-import pandas as pd
-from git.exc import GitCommandError
 
-import colrev.env.local_index
-import colrev.env.local_index_builder
 import colrev.exceptions as colrev_exceptions
-import colrev.ops.check
 import colrev.package_manager.package_manager
-import colrev.record.record
-import colrev.review_manager
-import colrev.ui_cli.add_package_to_settings
-import colrev.ui_cli.cli_status_printer
-import colrev.ui_cli.cli_validation
-import colrev.ui_cli.dedupe_errors
 from colrev.constants import Colors
 from colrev.constants import EndpointType
 from colrev.constants import Fields
 from colrev.constants import RecordState
 from colrev.constants import ScreenCriterionType
 
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import colrev.process.profiler
+    import colrev.review_manager
+
 # pylint: disable=too-many-lines
 # pylint: disable=redefined-builtin
 # pylint: disable=redefined-outer-name
@@ -48,6 +40,10 @@ from colrev.constants import ScreenCriterionType
 # pylint: disable=import-outside-toplevel
 # pylint: disable=too-many-return-statements
 
+# Note: to keep the startup fast (e.g., for colrev --help), heavy modules
+# (review_manager, pandas, local_index, ...) are imported in the commands that use them.
+# The import time is tested in tests/0_core/cli_import_time_test.py.
+
 # Note: autocompletion needs bash/... activation:
 # https://click.palletsprojects.com/en/7.x/bashcomplete/
 
@@ -76,12 +72,37 @@ def get_search_files() -> list:
     # Take the filenames from sources because there may be API searches
     # without files (yet)
     try:
+        import colrev.review_manager
+
         review_manager = colrev.review_manager.ReviewManager()
         return [str(x.filename) for x in review_manager.settings.sources]
     except Exception:  # pylint: disable=broad-exception-caught
         return []
 
 
+class _LazyChoice(click.Choice):  # pylint: disable=duplicate-bases
+    """Choice with options that are only retrieved when they are needed
+    (loading the search files requires the ReviewManager)"""
+
+    def __init__(self, get_choices: typing.Callable[[], list]) -> None:
+        self._get_choices = get_choices
+        self._choices: typing.Optional[tuple] = None
+        super().__init__([])
+
+    @property  # type: ignore[override]
+    def choices(self) -> tuple:  # type: ignore[override]
+        """Retrieve the choices on first access"""
+        if self._choices is None:
+            self._choices = tuple(self._get_choices())
+        return self._choices
+
+    @choices.setter
+    def choices(self, value: typing.Sequence) -> None:
+        # click.Choice.__init__ sets the (empty) choices
+        if value:
+            self._choices = tuple(value)
+
+
 class SpecialHelpOrder(click.Group):
     """Order for cli commands in help page overview"""
 
@@ -163,7 +184,9 @@ def main(ctx: click.core.Context) -> None:
 
     try:
         if ctx.invoked_subcommand == "shell":
-            ctx.obj = {"review_manager": colrev.review_manager.ReviewManager()}
+            from colrev.review_manager import ReviewManager
+
+            ctx.obj = {"review_manager": ReviewManager()}
     except colrev.exceptions.RepoSetupError:
         pass
 
@@ -176,6 +199,7 @@ def get_review_manager(
     the given parameters. If params requires review_manager to be reloaded, will
     reload it
     """
+    import colrev.review_manager
 
     review_manager_params["exact_call"] = ctx.command_path
     try:
@@ -203,6 +227,19 @@ def get_review_manager(
         return review_manager
 
 
+def get_profiler(
+    operation: str, *, profile: bool, profile_slowest: int, profiler: str
+) -> typing.Optional[colrev.process.profiler.OperationProfiler]:
+    """Get the profiler for the operation (None if profiling is not requested)"""
+    import colrev.process.profiler
+
+    if not profile and not profile_slowest:
+        return None
+    return colrev.process.profiler.OperationProfiler(
+        operation=operation, slowest=profile_slowest, capture_tool=profiler
+    )
+
+
 @main.command(help_priority=100)
 @click.pass_context
 @catch_exception(handle=(colrev_exceptions.CoLRevException))
@@ -210,6 +247,7 @@ def shell(
     ctx: click.core.Context,
 ) -> None:
     """Starts a interactive terminal"""
+    import click_repl
     from prompt_toolkit.history import FileHistory
 
     print(f"CoLRev version {colrev.__version__}")
@@ -233,6 +271,8 @@ def exit(
     """Starts a interactive terminal"""
     import inspect
 
+    import click_repl
+
     curframe = inspect.currentframe()
     calframe = inspect.getouterframes(curframe, 2)
     if calframe[7].function == "shell":
@@ -305,6 +345,8 @@ def status(
     verbose: bool,
 ) -> None:
     """Show status"""
+    import colrev.ui_cli.cli_status_printer
+
     try:
         review_manager = get_review_manager(
             ctx,
@@ -445,7 +487,7 @@ def retrieve(
 @click.option(
     "-s",
     "--selected",
-    type=click.Choice(get_search_files()),
+    type=_LazyChoice(get_search_files),
     help="Only retrieve search results for selected sources",
 )
 @click.option(
@@ -506,6 +548,10 @@ def search(
 
     Docs: https://colrev.readthedocs.io/en/latest/manual/metadata_retrieval/search.html
     """
+    import colrev.ui_cli.add_package_to_settings
+    import colrev.ui_cli.cli_add_source
+    import colrev.ui_cli.search_backward_selective
+    import colrev.ui_cli.setup_custom_scripts
 
     review_manager = get_review_manager(
         ctx, {"verbose_mode": verbose, "force_mode": force, "exact_call": EXACT_CALL}
@@ -519,10 +565,6 @@ def search(
         return
 
     if add:
-        # pylint: disable=import-outside-toplevel
-        # pylint: disable=reimported
-        import colrev.ui_cli.add_package_to_settings
-
         colrev.ui_cli.add_package_to_settings.add_package_to_settings(
             PACKAGE_MANAGER,
             operation=search_operation,
@@ -542,8 +584,6 @@ def search(
         return
 
     if setup_custom_script:
-        import colrev.ui_cli.setup_custom_scripts
-
         colrev.ui_cli.setup_custom_scripts.setup_custom_search_script(
             review_manager=review_manager
         )
@@ -552,15 +592,11 @@ def search(
             f"Please update the source in {review_manager.paths.SETTINGS_FILE} and commit."
         )
     elif bws:
-        import colrev.ui_cli.search_backward_selective
-
         colrev.ui_cli.search_backward_selective.main(
             search_operation=search_operation, bws=bws
         )
         return
 
-    import colrev.ui_cli.cli_add_source
-
     cli_source_adder = colrev.ui_cli.cli_add_source.CLISourceAdder(
         search_operation=search_operation
     )
@@ -671,6 +707,30 @@ def load(
     type=int,
     help="Number of cpus (parallel processes)",
 )
+@click.option(
+    "--prep-cache",
+    is_flag=True,
+    default=False,
+    help="Use cached results of prep packages (cacheable packages only).",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    default=False,
+    help="Save a profile of the packages (.colrev/profile/prep.json/csv).",
+)
+@click.option(
+    "--profile-slowest",
+    type=int,
+    default=0,
+    help="Capture profiles of the n slowest records (processed sequentially).",
+)
+@click.option(
+    "--profiler",
+    type=click.Choice(["cprofile", "pyinstrument"]),
+    default="cprofile",
+    help="Profiler for --profile-slowest.",
+)
 @click.option(
     "-scs",
     "--setup_custom_script",
@@ -702,6 +762,10 @@ def prep(
     polish: bool,
     debug: str,
     cpu: int,
+    prep_cache: bool,
+    profile: bool,
+    profile_slowest: int,
+    profiler: str,
     setup_custom_script: bool,
     verbose: bool,
     force: bool,
@@ -710,6 +774,7 @@ def prep(
 
     Docs: https://colrev.readthedocs.io/en/latest/manual/metadata_retrieval/prep.html
     """
+    import colrev.ui_cli.add_package_to_settings
 
     try:
         review_manager = get_review_manager(
@@ -727,7 +792,17 @@ def prep(
             debug_prep_operation.run_debug(debug_ids=debug)  # type: ignore
             return
 
-        prep_operation = review_manager.get_prep_operation(polish=polish, cpu=cpu)
+        prep_operation = review_manager.get_prep_operation(
+            polish=polish,
+            cpu=cpu,
+            prep_cache=prep_cache,
+            profiler=get_profiler(
+                "prep",
+                profile=profile,
+                profile_slowest=profile_slowest,
+                profiler=profiler,
+            ),
+        )
         if setup_custom_script:
             prep_operation.setup_custom_script()
             print("Activated custom_prep_script.py.")
@@ -810,6 +885,7 @@ def prep_man(
 
     Docs: https://colrev.readthedocs.io/en/latest/manual/metadata_retrieval/prep.html
     """
+    import colrev.ui_cli.add_package_to_settings
 
     review_manager = get_review_manager(
         ctx, {"verbose_mode": verbose, "force_mode": force, "exact_call": EXACT_CALL}
@@ -927,6 +1003,8 @@ def dedupe(
 
     Docs: https://colrev.readthedocs.io/en/latest/manual/metadata_retrieval/dedupe.html
     """
+    import colrev.ui_cli.add_package_to_settings
+    import colrev.ui_cli.dedupe_errors
 
     review_manager = get_review_manager(
         ctx, {"verbose_mode": verbose, "force_mode": force, "exact_call": EXACT_CALL}
@@ -1096,8 +1174,8 @@ def prescreen(
 
     Docs: https://colrev.readthedocs.io/en/latest/manual/metadata_prescreen/prescreen.html
     """
-
     # pylint: disable=too-many-locals
+    import colrev.ui_cli.add_package_to_settings
 
     review_manager = get_review_manager(
         ctx, {"verbose_mode": verbose, "force_mode": force, "exact_call": EXACT_CALL}
@@ -1251,6 +1329,8 @@ def screen(
 
     Docs: https://colrev.readthedocs.io/en/latest/manual/pdf_screen/screen.html
     """
+    import colrev.settings
+    import colrev.ui_cli.add_package_to_settings
 
     review_manager = get_review_manager(
         ctx, {"verbose_mode": verbose, "force_mode": force, "exact_call": EXACT_CALL}
@@ -1467,6 +1547,24 @@ def pdfs(
     default=False,
     help="Setup template for custom pdf-get script.",
 )
+@click.option(
+    "--profile",
+    is_flag=True,
+    default=False,
+    help="Save a profile of the packages (.colrev/profile/pdf_get.json/csv).",
+)
+@click.option(
+    "--profile-slowest",
+    type=int,
+    default=0,
+    help="Capture profiles of the n slowest records (processed sequentially).",
+)
+@click.option(
+    "--profiler",
+    type=click.Choice(["cprofile", "pyinstrument"]),
+    default="cprofile",
+    help="Profiler for --profile-slowest.",
+)
 @click.option(
     "-v",
     "--verbose",
@@ -1491,6 +1589,9 @@ def pdf_get(
     rename: bool,
     relink_pdfs: bool,
     setup_custom_script: bool,
+    profile: bool,
+    profile_slowest: int,
+    profiler: str,
     verbose: bool,
     force: bool,
 ) -> None:
@@ -1498,6 +1599,7 @@ def pdf_get(
 
     Docs: https://colrev.readthedocs.io/en/latest/manual/pdf_retrieval/pdf_get.html
     """
+    import colrev.ui_cli.add_package_to_settings
 
     review_manager = get_review_manager(
         ctx,
@@ -1510,7 +1612,13 @@ def pdf_get(
 
     state_transition_operation = not relink_pdfs and not setup_custom_script
     pdf_get_operation = review_manager.get_pdf_get_operation(
-        notify_state_transition_operation=state_transition_operation
+        notify_state_transition_operation=state_transition_operation,
+        profiler=get_profiler(
+            "pdf_get",
+            profile=profile,
+            profile_slowest=profile_slowest,
+            profiler=profiler,
+        ),
     )
 
     if add:
@@ -1594,6 +1702,7 @@ def pdf_get_man(
 
     Docs: https://colrev.readthedocs.io/en/latest/manual/pdf_retrieval/pdf_get.html
     """
+    import colrev.ui_cli.add_package_to_settings
 
     review_manager = get_review_manager(
         ctx,
@@ -1626,6 +1735,8 @@ def pdf_get_man(
                 RecordState.rev_prescreen_included,
             ]
         ]
+        import pandas as pd
+
         pdf_get_man_records_df = pd.DataFrame.from_records(pdf_get_man_records)
         pdf_get_man_records_df = pdf_get_man_records_df[
             pdf_get_man_records_df.columns.intersection(
@@ -1658,22 +1769,23 @@ def pdf_get_man(
 def _print_pdf_hashes(*, pdf_path: Path) -> None:
 
     import colrev.record.record_pdf
-    import pymupdf
-
-    doc = pymupdf.Document(pdf_path)
-    last_page_nr = doc.page_count
 
     assert Path(pdf_path).suffix == ".pdf"
-    record = colrev.record.record_pdf.PDFRecord({"file": pdf_path})
-    first_page_average_hash_16 = record.get_pdf_hash(page_nr=1, hash_size=16)
-    print(f"first page: {first_page_average_hash_16}")
-    first_page_average_hash_32 = record.get_pdf_hash(page_nr=1, hash_size=32)
-    print(f"first page: {first_page_average_hash_32}")
-
-    last_page_average_hash_16 = record.get_pdf_hash(page_nr=last_page_nr, hash_size=16)
-    print(f"last page: {last_page_average_hash_16}")
-    last_page_average_hash_32 = record.get_pdf_hash(page_nr=last_page_nr, hash_size=32)
-    print(f"last page: {last_page_average_hash_32}")
+    with colrev.record.record_pdf.PDFRecord({"file": pdf_path}) as record:
+        last_page_nr = record.get_pdf_analysis().get_page_count()
+        first_page_average_hash_16 = record.get_pdf_hash(page_nr=1, hash_size=16)
+        print(f"first page: {first_page_average_hash_16}")
+        first_page_average_hash_32 = record.get_pdf_hash(page_nr=1, hash_size=32)
+        print(f"first page: {first_page_average_hash_32}")
+
+        last_page_average_hash_16 = record.get_pdf_hash(
+            page_nr=last_page_nr, hash_size=16
+        )
+        print(f"last page: {last_page_average_hash_16}")
+        last_page_average_hash_32 = record.get_pdf_hash(
+            page_nr=last_page_nr, hash_size=32
+        )
+        print(f"last page: {last_page_average_hash_32}")
 
 
 @main.command(help_priority=14)
@@ -1706,6 +1818,29 @@ def _print_pdf_hashes(*, pdf_path: Path) -> None:
     default=False,
     help="Prepare all PDFs again (pdf_needs_manual_preparation).",
 )
+@click.option(
+    "--cpu",
+    type=int,
+    help="Number of cpus (parallel processes, default: all cores)",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    default=False,
+    help="Save a profile of the packages (.colrev/profile/pdf_prep.json/csv).",
+)
+@click.option(
+    "--profile-slowest",
+    type=int,
+    default=0,
+    help="Capture profiles of the n slowest records (processed sequentially).",
+)
+@click.option(
+    "--profiler",
+    type=click.Choice(["cprofile", "pyinstrument"]),
+    default="cprofile",
+    help="Profiler for --profile-slowest.",
+)
 @click.option(
     "--tei",
     is_flag=True,
@@ -1742,6 +1877,10 @@ def pdf_prep(
     batch_size: int,
     update_colrev_pdf_ids: bool,
     reprocess: bool,
+    cpu: int,
+    profile: bool,
+    profile_slowest: int,
+    profiler: str,
     setup_custom_script: bool,
     tei: bool,
     verbose: bool,
@@ -1751,6 +1890,7 @@ def pdf_prep(
 
     Docs: https://colrev.readthedocs.io/en/latest/manual/pdf_retrieval/pdf_prep.html
     """
+    import colrev.ui_cli.add_package_to_settings
 
     # pylint: disable=import-outside-toplevel
 
@@ -1762,7 +1902,16 @@ def pdf_prep(
             "exact_call": EXACT_CALL,
         },
     )
-    pdf_prep_operation = review_manager.get_pdf_prep_operation(reprocess=reprocess)
+    pdf_prep_operation = review_manager.get_pdf_prep_operation(
+        reprocess=reprocess,
+        cpu=cpu,
+        profiler=get_profiler(
+            "pdf_prep",
+            profile=profile,
+            profile_slowest=profile_slowest,
+            profiler=profiler,
+        ),
+    )
 
     if add:
 
@@ -1793,10 +1942,15 @@ def pdf_prep(
 def _delete_first_pages_cli(
     pdf_prep_man_operation: colrev.ops.pdf_prep_man.PDFPrepMan, record_id: str
 ) -> None:
-    records = pdf_prep_man_operation.review_manager.dataset.load_records_dict()
+    import colrev.record.record
+
+    dataset = pdf_prep_man_operation.review_manager.dataset
     while True:
-        if record_id in records:
-            record_dict = records[record_id]
+        try:
+            record_dict = dataset.read_record(record_id=record_id)
+        except colrev_exceptions.RecordNotInRepoException:
+            print(f"record not found: {record_id}")
+        else:
             if Fields.FILE in record_dict:
                 print(record_dict[Fields.FILE])
                 pdf_path = pdf_prep_man_operation.review_manager.path / Path(
@@ -1888,6 +2042,7 @@ def pdf_prep_man(
 
     Docs: https://colrev.readthedocs.io/en/latest/manual/pdf_retrieval/pdf_prep.html
     """
+    import colrev.ui_cli.add_package_to_settings
 
     review_manager = get_review_manager(
         ctx,
@@ -1981,6 +2136,7 @@ def data(
 
     Docs: https://colrev.readthedocs.io/en/latest/manual/data/data.html
     """
+    import colrev.ui_cli.add_package_to_settings
 
     review_manager = get_review_manager(
         ctx,
@@ -2095,6 +2251,7 @@ def validate(
     - HEAD~4 for commit 4 before HEAD
     - A contributor name
     """
+    import colrev.ui_cli.cli_validation
 
     review_manager = get_review_manager(
         ctx,
@@ -2317,8 +2474,8 @@ def env(
     verbose: bool,
 ) -> None:
     """Manage the environment"""
-
     # pylint: disable=too-many-branches
+    import colrev.env.local_index_builder
 
     if update_package_list:
         if "y" != input(
@@ -2360,6 +2517,8 @@ def env(
         return
 
     if pull:
+        from git.exc import GitCommandError
+
         environment_manager = review_manager.get_environment_manager()
         for curated_resource in environment_manager.local_repos():
             try:
@@ -2673,6 +2832,7 @@ def show(  # type: ignore
 ) -> None:
     """Show aspects (sample, ...)"""
 
+    import colrev.ops.check
     import colrev.process.operation
     import colrev.ui_cli.show_printer
 
@@ -2801,6 +2961,7 @@ def upgrade(
     force: bool,
 ) -> None:
     """Upgrade to the latest CoLRev project version."""
+    import colrev.review_manager
 
     if disable_auto:
         review_manager = colrev.review_manager.ReviewManager(
@@ -2943,6 +3104,7 @@ def merge(
     force: bool,
 ) -> None:
     """Merge git branches."""
+    import colrev.ops.check
 
     review_manager = get_review_manager(
         ctx,
@@ -2983,6 +3145,7 @@ def undo(
     force: bool,
 ) -> None:
     """Undo operations."""
+    import colrev.ops.check
 
     review_manager = get_review_manager(
         ctx,
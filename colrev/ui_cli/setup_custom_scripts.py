@@ -1,5 +1,7 @@
 #! /usr/bin/env python
 """Custom script setup."""
+from __future__ import annotations
+
 import typing
 from pathlib import Path
 
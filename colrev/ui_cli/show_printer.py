@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 """Scripts printing information for the colrev show command"""
+from __future__ import annotations
+
 import platform
+import typing
 from pathlib import Path
 
 import colrev.ops.check
@@ -10,6 +13,9 @@ from colrev.constants import Colors
 from colrev.constants import Fields
 from colrev.constants import RecordState
 
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import colrev.review_manager
+
 
 def print_sample(review_manager: colrev.review_manager.ReviewManager) -> None:
     """Print the sample on cli"""
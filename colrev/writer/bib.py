@@ -2,7 +2,9 @@
 """Convenience functions to write bib files"""
 from __future__ import annotations
 
-from copy import deepcopy
+import io
+import typing
+from functools import lru_cache
 from pathlib import Path
 
 from colrev.constants import Fields
@@ -56,73 +58,81 @@ def _save_field_dict(*, input_dict: dict, input_key: str) -> list:
     return list_to_return
 
 
-def _get_stringified_record(*, record_dict: dict) -> dict:
-    data_copy = deepcopy(record_dict)
+_ORDERED_FIELDS = set(RECORDS_FIELD_ORDER)
+_NON_DATA_FIELDS = _ORDERED_FIELDS | {Fields.ID, Fields.ENTRYTYPE}
+_LIST_SEPARATOR = "\n" + " " * 36
 
-    def list_to_str(*, val: list) -> str:
-        return ("\n" + " " * 36).join([f.rstrip() for f in val])
-
-    for key in [Fields.ORIGIN]:
-        if key in data_copy:
-            if key in [Fields.ORIGIN]:
-                data_copy[key] = sorted(list(set(data_copy[key])))
-            for ind, val in enumerate(data_copy[key]):
-                if len(val) > 0:
-                    if val[-1] != ";":
-                        data_copy[key][ind] = val + ";"
-            data_copy[key] = list_to_str(val=data_copy[key])
-
-    for key in [Fields.MD_PROV, Fields.D_PROV]:
-        if key in data_copy:
-            if isinstance(data_copy[key], dict):
-                data_copy[key] = _save_field_dict(
-                    input_dict=data_copy[key], input_key=key
-                )
-            if isinstance(data_copy[key], list):
-                data_copy[key] = list_to_str(val=data_copy[key])
 
-    return data_copy
+@lru_cache(maxsize=None)
+def _get_field_prefix(field: str) -> str:
+    padd = " " * max(0, 28 - len(field))
+    return f",\n   {field} {padd} = {{"
 
 
-def to_string(*, records_dict: dict) -> str:
-    """Convert a records dict to a bibtex string"""
-    # Note: we need a deepcopy because the parsing modifies dicts
-    recs_dict = deepcopy(records_dict)
-
-    def format_field(field: str, value: str) -> str:
-        padd = " " * max(0, 28 - len(field))
-        return f",\n   {field} {padd} = {{{value}}}"
+def _get_stringified_value(*, key: str, value: typing.Any) -> typing.Any:
+    """Get the value as it is written to the bib file (the value is not modified)"""
 
-    bibtex_str = ""
-    first = True
-    for record_id, record_dict in sorted(recs_dict.items()):
-        if not first:
-            bibtex_str += "\n"
-        first = False
+    def list_to_str(*, val: list) -> str:
+        return _LIST_SEPARATOR.join([f.rstrip() for f in val])
+
+    if key == Fields.ORIGIN:
+        return list_to_str(
+            val=[
+                val + ";" if len(val) > 0 and val[-1] != ";" else val
+                for val in sorted(list(set(value)))
+            ]
+        )
+
+    if key in [Fields.MD_PROV, Fields.D_PROV]:
+        if isinstance(value, dict):
+            value = _save_field_dict(input_dict=value, input_key=key)
+        if isinstance(value, list):
+            value = list_to_str(val=value)
+
+    return value
+
+
+def _write_record(*, record_id: str, record_dict: dict, file: typing.TextIO) -> None:
+    file.write(f"@{record_dict[Fields.ENTRYTYPE]}{{{record_id}")
+
+    for ordered_field in RECORDS_FIELD_ORDER:
+        if ordered_field in record_dict:
+            value = _get_stringified_value(
+                key=ordered_field, value=record_dict[ordered_field]
+            )
+            if value == "":
+                continue
+            file.write(f"{_get_field_prefix(ordered_field)}{value}}}")
 
-        bibtex_str += f"@{record_dict[Fields.ENTRYTYPE]}{{{record_id}"
+    for key in sorted(record_dict.keys()):
+        if key in _NON_DATA_FIELDS:
+            continue
+        file.write(f"{_get_field_prefix(key)}{record_dict[key]}}}")
 
-        record_dict = _get_stringified_record(record_dict=record_dict)
+    file.write(",\n}\n")
 
-        for ordered_field in RECORDS_FIELD_ORDER:
-            if ordered_field in record_dict:
-                if record_dict[ordered_field] == "":
-                    continue
-                bibtex_str += format_field(ordered_field, record_dict[ordered_field])
 
-        for key in sorted(record_dict.keys()):
-            if key in RECORDS_FIELD_ORDER + [Fields.ID, Fields.ENTRYTYPE]:
-                continue
+def write_records(*, records_dict: dict, file: typing.TextIO) -> None:
+    """Write a records dict to a file object (without modifying the records)"""
 
-            bibtex_str += format_field(key, record_dict[key])
+    first = True
+    for record_id in sorted(records_dict):
+        if not first:
+            file.write("\n")
+        first = False
+        _write_record(
+            record_id=record_id, record_dict=records_dict[record_id], file=file
+        )
 
-        bibtex_str += ",\n}\n"
 
-    return bibtex_str
+def to_string(*, records_dict: dict) -> str:
+    """Convert a records dict to a bibtex string"""
+    output = io.StringIO()
+    write_records(records_dict=records_dict, file=output)
+    return output.getvalue()
 
 
 def write_file(*, records_dict: dict, filename: Path) -> None:
     """Write a bib file from a records dict"""
-    bibtexstr = to_string(records_dict=records_dict)
     with open(filename, "w", encoding="utf-8") as file:
-        file.write(bibtexstr)
+        write_records(records_dict=records_dict, file=file)
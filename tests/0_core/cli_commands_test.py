@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+"""Smoke tests of the colrev CLI commands (modules imported in the commands)"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import colrev.ui_cli.cli
+
+# Commands that are interactive, start services, or change the environment
+SKIPPED_COMMANDS = [
+    "clone",
+    "dashboard",
+    "docs",
+    "exit",
+    "init",
+    "install-click",
+    "shell",
+]
+
+COMMAND_ARGUMENTS = {
+    "pdf": ["test.pdf"],
+    "show": ["sample"],
+    "trace": ["--id", "NotInRepo2024"],
+    "undo": ["commit"],
+    "validate": ["."],
+}
+
+# Note : each command runs in a new process because modules imported
+# by other commands (e.g., colrev.review_manager) would hide missing imports.
+INVOKE_COMMAND = """
+import sys
+from click.testing import CliRunner
+import colrev.exceptions as colrev_exceptions
+import colrev.ui_cli.cli
+
+result = CliRunner().invoke(colrev.ui_cli.cli.main, sys.argv[1:], input="q\\n")
+print(result.output)
+if isinstance(result.exception, SystemExit):
+    # Usage errors (exit code 2) mean that the arguments of the test are invalid
+    assert result.exception.code != 2, result.output
+elif not isinstance(result.exception, (type(None), colrev_exceptions.CoLRevException)):
+    raise result.exception.with_traceback(result.exc_info[2])
+"""
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize(
+    "command",
+    sorted(set(colrev.ui_cli.cli.main.commands) - set(SKIPPED_COMMANDS)),
+)
+def test_cli_command(command: str, tmp_path: Path) -> None:
+    """The commands run (outside a CoLRev project) without import errors"""
+
+    (tmp_path / Path("test.pdf")).touch()
+    ret = subprocess.run(
+        [sys.executable, "-c", INVOKE_COMMAND, command]
+        + COMMAND_ARGUMENTS.get(command, []),
+        cwd=tmp_path,
+        env={**os.environ, "HOME": str(tmp_path)},
+        capture_output=True,
+        text=True,
+        check=False,
+        timeout=300,
+    )
+    assert ret.returncode == 0, ret.stderr
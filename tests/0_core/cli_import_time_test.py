@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+"""Test the import time of the colrev CLI"""
+import subprocess
+import sys
+
+# Modules that should only be imported by the commands that need them
+HEAVY_MODULES = [
+    "pandas",
+    "bib_dedupe.block",
+    "pymupdf",
+    "requests_cache",
+    "click_repl",
+    "colrev.review_manager",
+    "colrev.record.record",
+]
+
+
+def _get_import_times() -> dict:
+    ret = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import colrev.ui_cli.cli"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_times = {}
+    for line in ret.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, module = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        import_times[module.strip()] = int(cumulative)
+    return import_times
+
+
+def test_cli_import_time() -> None:
+    """Heavy dependencies are not imported at CLI startup"""
+
+    import_times = _get_import_times()
+
+    assert "colrev.ui_cli.cli" in import_times
+    for module in HEAVY_MODULES:
+        assert module not in import_times, module
+
+    # Generous budget (microseconds) to avoid flaky tests on slow CI machines
+    assert import_times["colrev.ui_cli.cli"] < 1_000_000
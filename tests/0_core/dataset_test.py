@@ -1,7 +1,6 @@
 #!/usr/bin/env python
 """Tests for the dataset"""
 from pathlib import Path
-from unittest.mock import MagicMock
 
 import pytest
 
@@ -66,6 +65,20 @@ def test_load_records_from_history(  # type: ignore
         == RecordState.md_processed
     ), "The record status does not match the expected status."
 
+    # Header-only parsing yields the same IDs, origins and status
+    headers_from_history = list(
+        base_repo_review_manager.dataset.load_records_from_history(
+            commit_sha=last_commit_sha, header_only=True
+        )
+    )
+    assert len(headers_from_history) == 3
+    for records, headers in zip(records_from_history, headers_from_history):
+        assert {
+            r[Fields.ID]: (r[Fields.ORIGIN], r[Fields.STATUS]) for r in records.values()
+        } == {
+            r[Fields.ID]: (r[Fields.ORIGIN], r[Fields.STATUS]) for r in headers.values()
+        }
+
 
 def test_get_origin_state_dict(
     base_repo_review_manager: colrev.review_manager.ReviewManager,
@@ -115,30 +128,168 @@ def test_propagated_id(
     expected_result: bool,
 ) -> None:
     """Test the propagated_id method."""
-    original_load_records_dict = base_repo_review_manager.dataset.load_records_dict
-
-    # Mocking the load_records_dict method to return a dictionary with specific IDs and statuses
-    base_repo_review_manager.dataset.load_records_dict = MagicMock(  # type: ignore
-        return_value={
-            "Doe2021": {
-                "ID": "Doe2021",
-                "colrev_status": RecordState.pdf_prepared,
-            },
-            "Smith2022": {
-                "ID": "Smith2022",
-                "colrev_status": RecordState.md_imported,
-            },
-            "Johnson2023": {
-                "ID": "Johnson2023",
-                "colrev_status": RecordState.rev_excluded,
-            },
+
+    base_repo_review_manager.notified_next_operation = OperationsType.check
+    dataset = base_repo_review_manager.dataset
+    records = dataset.load_records_dict()
+    record_dict = records["SrivastavaShainesh2015"]
+    for other_id, status in [
+        ("Doe2021", RecordState.pdf_prepared),
+        ("Smith2022", RecordState.md_imported),
+        ("Johnson2023", RecordState.rev_excluded),
+    ]:
+        records[other_id] = {
+            **record_dict,
+            Fields.ID: other_id,
+            Fields.STATUS: status,
         }
-    )
+    dataset.save_records_dict(records)
 
-    result = base_repo_review_manager.dataset.propagated_id(record_id=record_id)
+    result = dataset.propagated_id(record_id=record_id)
     assert result == expected_result, f"Propagated ID check failed for {record_id}"
+    assert not dataset.propagated_id(record_id="NotInRepo2024")
+
+
+def test_records_cache(
+    base_repo_review_manager: colrev.review_manager.ReviewManager,
+) -> None:
+    """Test the cache of parsed records (keyed by the blob sha of the records file)"""
+
+    base_repo_review_manager.notified_next_operation = OperationsType.check
+    dataset = base_repo_review_manager.dataset
+    records_cache = base_repo_review_manager.paths.records_cache
+    records_cache.unlink(missing_ok=True)
+    dataset._records_cache = ("", b"")
+
+    records = dataset.load_records_dict()
+    assert records_cache.is_file()
+
+    # Cached records are independent copies
+    records["SrivastavaShainesh2015"][Fields.TITLE] = "Changed in memory"
+    assert dataset.load_records_dict()["SrivastavaShainesh2015"][Fields.TITLE] != (
+        "Changed in memory"
+    )
+
+    # Loaded from the cache file (across processes)
+    dataset._records_cache = ("", b"")
+    records = dataset.load_records_dict()
+    assert dataset._records_cache[0] != ""
+
+    # The cache is invalidated when the records file changes
+    records["SrivastavaShainesh2015"][Fields.TITLE] = "Changed title"
+    dataset.save_records_dict(records)
+    assert (
+        dataset.load_records_dict()["SrivastavaShainesh2015"][Fields.TITLE]
+        == "Changed title"
+    )
+
 
-    base_repo_review_manager.dataset.load_records_dict = original_load_records_dict  # type: ignore
+def test_save_records_dict_incremental(
+    base_repo_review_manager: colrev.review_manager.ReviewManager,
+) -> None:
+    """Test saving only the records that changed since the last load"""
+
+    base_repo_review_manager.notified_next_operation = OperationsType.check
+    dataset = base_repo_review_manager.dataset
+    records_file = base_repo_review_manager.paths.records
+
+    records = dataset.load_records_dict()
+    records["SrivastavaShainesh2015"][Fields.TITLE] = "Changed title"
+    records["AddedRecord2024"] = {
+        Fields.ID: "AddedRecord2024",
+        Fields.ENTRYTYPE: "article",
+        Fields.STATUS: RecordState.md_imported,
+        Fields.ORIGIN: ["test_records.bib/AddedRecord2024"],
+        Fields.TITLE: "An added record",
+    }
+    assert dataset._save_changed_records(records)
+    incremental_content = records_file.read_text(encoding="utf-8")
+    assert "Changed title" in incremental_content
+
+    # Byte-identical to a complete rewrite
+    dataset.save_records_dict_to_file(records)
+    assert records_file.read_text(encoding="utf-8") == incremental_content
+
+    # The records file changed since the last load: requires a complete rewrite
+    assert not dataset._save_changed_records(records)
+
+    # Partial saves replace records and append new records
+    records = dataset.load_records_dict()
+    records["SrivastavaShainesh2015"][Fields.TITLE] = "Changed title (partial)"
+    dataset.save_records_dict(
+        {
+            "SrivastavaShainesh2015": records["SrivastavaShainesh2015"],
+            "ZAddedRecord2024": {
+                **records["AddedRecord2024"],
+                Fields.ID: "ZAddedRecord2024",
+            },
+        },
+        partial=True,
+    )
+    records = dataset.load_records_dict()
+    assert records["SrivastavaShainesh2015"][Fields.TITLE] == "Changed title (partial)"
+    assert list(records) == [
+        "AddedRecord2024",
+        "SrivastavaShainesh2015",
+        "ZAddedRecord2024",
+    ]
+
+
+def test_records_index(
+    base_repo_review_manager: colrev.review_manager.ReviewManager,
+) -> None:
+    """Test the index of the records file (random-access reads)"""
+
+    base_repo_review_manager.notified_next_operation = OperationsType.check
+    dataset = base_repo_review_manager.dataset
+    records = dataset.load_records_dict()
+    dataset.save_records_dict_to_file(records)
+    base_repo_review_manager.paths.records_index.unlink(missing_ok=True)
+    assert dataset.propagated_id(record_id="SrivastavaShainesh2015")
+    assert base_repo_review_manager.paths.records_index.is_file()
+
+    # Saves update the index of the changed records (written when it is read)
+    records["SrivastavaShainesh2015"][Fields.STATUS] = RecordState.md_imported
+    dataset.save_records_dict(records)
+    assert not dataset.propagated_id(record_id="SrivastavaShainesh2015")
+    content = base_repo_review_manager.paths.records.read_bytes()
+    assert dataset._records_index[1] == dataset._build_records_index(content)
+    records["SrivastavaShainesh2015"][Fields.STATUS] = RecordState.rev_included
+    dataset.save_records_dict(
+        {"SrivastavaShainesh2015": records["SrivastavaShainesh2015"]}, partial=True
+    )
+    assert dataset.propagated_id(record_id="SrivastavaShainesh2015")
+    content = base_repo_review_manager.paths.records.read_bytes()
+    assert dataset._records_index[1] == dataset._build_records_index(content)
+
+    # Read without the records cache
+    base_repo_review_manager.paths.records_cache.unlink()
+    dataset._records_cache = ("", b"")
+    dataset._records_index = ("", {})
+
+    assert (
+        dataset.read_record(record_id="SrivastavaShainesh2015")
+        == records["SrivastavaShainesh2015"]
+    )
+    with pytest.raises(colrev_exceptions.RecordNotInRepoException):
+        dataset.read_record(record_id="NotInRepo2024")
+
+    status = records["SrivastavaShainesh2015"][Fields.STATUS]
+    assert list(dataset.read_next_record(conditions=[{Fields.STATUS: status}])) == [
+        records["SrivastavaShainesh2015"]
+    ]
+    assert (
+        list(
+            dataset.read_next_record(
+                conditions=[{Fields.STATUS: RecordState.md_imported}]
+            )
+        )
+        == []
+    )
+    assert list(
+        dataset.read_next_record(conditions=[{Fields.ID: "SrivastavaShainesh2015"}])
+    ) == [records["SrivastavaShainesh2015"]]
+    assert not base_repo_review_manager.paths.records_cache.is_file()
 
 
 def test_get_format_report(
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+"""Tests for the operation profiler"""
+import csv
+import json
+import pickle
+import pstats
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+import colrev.exceptions as colrev_exceptions
+import colrev.process.profiler
+
+
+def test_get_percentile() -> None:
+    """Test the percentiles"""
+
+    values = [float(i) for i in range(1, 101)]
+    assert colrev.process.profiler.get_percentile(values, 50) == pytest.approx(50.5)
+    assert colrev.process.profiler.get_percentile(values, 99) == pytest.approx(99.01)
+    assert colrev.process.profiler.get_percentile([2.0], 95) == 2.0
+    assert colrev.process.profiler.get_percentile([], 95) == 0.0
+
+
+def test_endpoint_stats() -> None:
+    """Calls, errors and cache hits are recorded per endpoint"""
+
+    profiler = colrev.process.profiler.OperationProfiler(operation="prep")
+    with profiler.time_call("colrev.crossref", cache_hit=True):
+        pass
+    with profiler.time_call("colrev.crossref", cache_hit=False):
+        time.sleep(0.01)
+    with pytest.raises(ValueError):
+        with profiler.time_call("colrev.crossref", cache_hit=False):
+            raise ValueError
+    with profiler.time_call("colrev.source_specific_prep"):
+        pass
+
+    stats = {s["endpoint"]: s for s in profiler.get_endpoint_stats()}
+    assert stats["colrev.crossref"]["calls"] == 3
+    assert stats["colrev.crossref"]["errors"] == 1
+    assert stats["colrev.crossref"]["cache_hit_rate"] == pytest.approx(1 / 3)
+    assert stats["colrev.crossref"]["max"] >= 0.01
+    assert stats["colrev.source_specific_prep"]["cache_hit_rate"] is None
+
+    with pytest.raises(colrev_exceptions.ParameterError):
+        colrev.process.profiler.OperationProfiler(operation="prep", capture_tool="x")
+
+
+def test_lock_waits() -> None:
+    """The time blocked on profiled locks is recorded"""
+
+    profiler = colrev.process.profiler.OperationProfiler(operation="prep")
+    lock = colrev.process.profiler.ProfiledLock(threading.Lock(), name="test_lock")
+
+    def hold_lock() -> None:
+        with lock:
+            time.sleep(0.05)
+
+    thread = threading.Thread(target=hold_lock)
+    thread.start()
+    time.sleep(0.01)
+    assert lock.acquire(timeout=10)
+    lock.release()
+    thread.join()
+
+    lock_waits = profiler.get_report()["lock_waits"]
+    assert lock_waits["test_lock"]["acquisitions"] == 2
+    assert lock_waits["test_lock"]["total"] >= 0.02
+
+
+def test_merge_state() -> None:
+    """Profiles recorded in worker processes are merged"""
+
+    profiler = colrev.process.profiler.OperationProfiler(operation="pdf_prep")
+    worker_profiler = colrev.process.profiler.OperationProfiler(operation="pdf_prep")
+    for record_id in ["r1", "r2"]:
+        with worker_profiler.profile_record(record_id):
+            with worker_profiler.time_call("colrev.pdf_check_ocr"):
+                pass
+    state = pickle.loads(pickle.dumps(worker_profiler.pop_state()))
+    assert not worker_profiler.get_endpoint_stats()
+
+    profiler.merge_state(state)
+    profiler.merge_state(state)
+    report = profiler.get_report()
+    assert report["endpoints"][0]["calls"] == 4
+    assert report["records"]["count"] == 4
+
+
+def test_save_report(tmp_path: Path) -> None:
+    """The report and the profiles of the slowest records are saved"""
+
+    profiler = colrev.process.profiler.OperationProfiler(operation="prep", slowest=1)
+    for record_id, duration in [("fast", 0.0), ("slow", 0.02)]:
+        with profiler.profile_record(record_id):
+            with profiler.time_call("colrev.crossref"):
+                time.sleep(duration)
+
+    report_file = profiler.save_report(path=tmp_path)
+    assert report_file == tmp_path / Path("prep.json")
+    report = json.loads(report_file.read_text(encoding="utf-8"))
+    assert report["records"]["count"] == 2
+    assert report["records"]["slowest"][0]["ID"] == "slow"
+    assert "capture" not in report["records"]["slowest"][1]
+    assert "cache_hits" in report["http"]
+
+    capture_file = tmp_path / Path(report["records"]["slowest"][0]["capture"])
+    assert capture_file == tmp_path / Path("prep_slowest/01_slow.prof")
+    assert pstats.Stats(str(capture_file)).total_calls > 0
+
+    with open(tmp_path / Path("prep.csv"), encoding="utf-8") as file:
+        rows = list(csv.DictReader(file))
+    assert rows[0]["endpoint"] == "colrev.crossref"
+    assert rows[0]["calls"] == "2"
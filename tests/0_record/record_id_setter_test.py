@@ -109,3 +109,39 @@ def test_id_generation_selected(  # type: ignore
 
     actual = id_setter.set_ids(record_dict, selected_ids=["0001"])
     assert "WagnerLukyanenkoPare2022" in actual
+
+
+def test_id_generation_unique(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager,
+) -> None:
+    """Test the suffixes of (case-insensitively) unique IDs."""
+
+    records = {
+        "doe2021b": {
+            "ID": "doe2021b",
+            "author": "Doe, John",
+            "year": "2021",
+            Fields.STATUS: RecordState.rev_synthesized,
+        }
+    }
+    for i in range(30):
+        records[f"{i:04d}"] = {
+            "ID": f"{i:04d}",
+            "author": "Doe, John",
+            "year": "2021",
+            Fields.STATUS: RecordState.md_imported,
+        }
+
+    id_setter = colrev.record.record_id_setter.IDSetter(
+        id_pattern=IDPattern.first_author_year,
+        skip_local_index=True,
+        logger=base_repo_review_manager.report_logger,
+    )
+    actual = id_setter.set_ids(records)
+    assert list(actual.keys())[:4] == ["doe2021b", "Doe2021", "Doe2021a", "Doe2021c"]
+    assert list(actual.keys())[-3:] == ["Doe2021ab", "Doe2021ac", "Doe2021ad"]
+
+    # IDs that are already unique do not change
+    actual = id_setter.set_ids(actual)
+    assert list(actual.keys())[-1] == "Doe2021ad"
+    assert len(actual) == 31
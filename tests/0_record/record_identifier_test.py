@@ -168,17 +168,17 @@ def test_open_pdf_invalid_path(helpers, tmp_path):  # type: ignore
 
     pymupdf.open = original_fitz_open
 
-    def image_open_runtime_error(pdf_path):  # type: ignore
+    def image_frombytes_runtime_error(mode, size, data):  # type: ignore
         """Raise a runtime error"""
         raise RuntimeError
 
-    original_image_open = Image.open
-    Image.open = image_open_runtime_error
+    original_image_frombytes = Image.frombytes
+    Image.frombytes = image_frombytes_runtime_error
 
     with pytest.raises(colrev_exceptions.PDFHashError):
         colrev.record.record.Record.get_colrev_pdf_id(pdf_path=pdf_path)
 
-    Image.open = original_image_open
+    Image.frombytes = original_image_frombytes
 
     original_imagehash_averagehash = imagehash.average_hash
 
@@ -213,3 +213,25 @@ def test_cpid(helpers) -> None:  # type: ignore
         colrev.record.record_identifier.get_colrev_pdf_id(
             pdf_path=pdf_path, cpid_version="unknown"
         )
+
+
+def test_get_colrev_pdf_ids(helpers, tmp_path) -> None:  # type: ignore
+    """Test the batch generation of colrev_pdf_ids"""
+
+    pdf_paths = []
+    for pdf_path in [
+        Path("data/WagnerLukyanenkoParEtAl2022.pdf"),
+        Path("data/SrivastavaShainesh2015.pdf"),
+        Path("data/zero-size-pdf.pdf"),
+    ]:
+        helpers.retrieve_test_file(source=pdf_path, target=tmp_path / pdf_path.name)
+        pdf_paths.append(tmp_path / pdf_path.name)
+
+    expected = {
+        pdf_path: colrev.record.record_identifier.get_colrev_pdf_id(pdf_path)
+        for pdf_path in pdf_paths[:2]
+    }
+    assert colrev.record.record_identifier.get_colrev_pdf_ids(pdf_paths) == expected
+    assert (
+        colrev.record.record_identifier.get_colrev_pdf_ids(pdf_paths, cpu=1) == expected
+    )
@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 """Tests of the Record class"""
+import pickle
 from pathlib import Path
 
 import imagehash
@@ -115,19 +116,19 @@ def test_get_pdf_hash(helpers) -> None:  # type: ignore
 
     pymupdf.open = original_pymupdf_open
 
-    def image_open_runtime_error(pdf_path):  # type: ignore
+    def image_frombytes_runtime_error(mode, size, data):  # type: ignore
         """Raise a runtime error"""
         raise RuntimeError
 
-    original_image_open = Image.open
-    Image.open = image_open_runtime_error
+    original_image_frombytes = Image.frombytes
+    Image.frombytes = image_frombytes_runtime_error
 
     with pytest.raises(colrev_exceptions.PDFHashError):
         colrev.record.record_pdf.PDFRecord(
             {"file": Path("WagnerLukyanenkoParEtAl2022.pdf")}
         ).get_pdf_hash(page_nr=1)
 
-    Image.open = original_image_open
+    Image.frombytes = original_image_frombytes
 
     original_imagehash_averagehash = imagehash.average_hash
 
@@ -143,3 +144,42 @@ def test_get_pdf_hash(helpers) -> None:  # type: ignore
         ).get_pdf_hash(page_nr=1)
 
     imagehash.average_hash = original_imagehash_averagehash
+
+
+def test_pdf_analysis(helpers) -> None:  # type: ignore
+    """Test the (cached) PDFAnalysis"""
+    pdf_path = Path("WagnerLukyanenkoParEtAl2022_analysis.pdf")
+    helpers.retrieve_test_file(
+        source=Path("data/WagnerLukyanenkoParEtAl2022.pdf"),
+        target=pdf_path,
+    )
+    record = colrev.record.record_pdf.PDFRecord({"ID": "x", "file": str(pdf_path)})
+    pdf_analysis = record.get_pdf_analysis()
+    assert pdf_analysis is record.get_pdf_analysis()
+    assert pdf_analysis.get_page_count() == 18
+    page_text = pdf_analysis.get_page_text(1)
+    assert pdf_analysis.get_text(pages=[1, 100]) == page_text
+    pdf_hash = record.get_pdf_hash(page_nr=2, hash_size=16)
+
+    # The cache is kept when the document is closed
+    record.close_pdf_analysis()
+    assert record.get_pdf_hash(page_nr=2, hash_size=16) == pdf_hash
+    pickle.loads(pickle.dumps(record))
+
+    # and invalidated when the file changes
+    colrev.record.record_pdf.PDFRecord.extract_pages_from_pdf(
+        pages=[0], pdf_path=pdf_path.absolute()
+    )
+    assert pdf_analysis.get_page_count() == 17
+    assert pdf_analysis.get_page_text(0) == page_text
+    assert record.get_pdf_hash(page_nr=1, hash_size=16) == pdf_hash
+    pdf_analysis.close()
+
+    # The document is closed when the record is used as a context manager
+    with colrev.record.record_pdf.PDFRecord(
+        {"ID": "x", "file": str(pdf_path)}
+    ) as record:
+        pdf_analysis = record.get_pdf_analysis()
+        assert pdf_analysis.get_page_count() == 17
+        assert pdf_analysis._doc is not None  # pylint: disable=protected-access
+    assert pdf_analysis._doc is None  # pylint: disable=protected-access
@@ -1,7 +1,14 @@
 #!/usr/bin/env python
 """Tests of the record similarity functionality"""
+from pathlib import Path
+
+import pandas as pd
 import pytest
+from bib_dedupe.bib_dedupe import block
+from bib_dedupe.bib_dedupe import match
+from bib_dedupe.bib_dedupe import prep
 
+import colrev.loader.load_utils
 import colrev.record.record
 import colrev.record.record_prep
 import colrev.record.record_similarity
@@ -81,3 +88,126 @@ def test_matches(input_dict_1: dict, input_dict_2: dict, matches: bool) -> None:
     record1 = colrev.record.record_prep.PrepRecord(input_dict_1)
     record2 = colrev.record.record_prep.PrepRecord(input_dict_2)
     assert colrev.record.record_similarity.matches(record1, record2) == matches
+
+
+def _bib_dedupe_matches(
+    record_a: colrev.record.record.Record, record_b: colrev.record.record.Record
+) -> bool:
+    """The bib_dedupe (DataFrame) pipeline for a pair of records"""
+    record_a_dict = record_a.copy().get_data()
+    record_b_dict = record_b.copy().get_data()
+    record_a_dict[Fields.ID] = "a"
+    record_b_dict[Fields.ID] = "b"
+
+    records_df = prep(
+        pd.DataFrame([record_a_dict, record_b_dict]), verbosity_level=0, cpu=1
+    )
+    matched_df = match(
+        block(records_df, verbosity_level=0, cpu=1), verbosity_level=0, cpu=1
+    )
+    duplicate_label = matched_df["duplicate_label"]
+    return len(duplicate_label) > 0 and duplicate_label.iloc[0] == "duplicate"
+
+
+def _get_variants(record_dict: dict) -> list:
+    variants = [
+        {Fields.TITLE: record_dict[Fields.TITLE].replace("a", "e", 1)},
+        {Fields.TITLE: record_dict[Fields.TITLE] + ": A comment"},
+        {Fields.TITLE: "n/a"},
+        {Fields.AUTHOR: "UNKNOWN"},
+        {Fields.AUTHOR: record_dict[Fields.AUTHOR].split(" and ")[0]},
+        {Fields.YEAR: str(int(record_dict[Fields.YEAR]) + 1)},
+        {Fields.VOLUME: "", Fields.NUMBER: ""},
+        {Fields.NUMBER: "99"},
+        {Fields.PAGES: "1--10"},
+        {Fields.DOI: "10.1111/ISJ.12345"},
+        {Fields.JOURNAL: "MIS Quarterly"},
+        {Fields.ENTRYTYPE: ENTRYTYPES.INPROCEEDINGS},
+    ]
+    return [{**record_dict, **variant} for variant in variants]
+
+
+def _get_parity_pairs(helpers, nr_records: int) -> list:  # type: ignore
+    records = list(
+        colrev.loader.load_utils.load(
+            filename=helpers.test_data_path / Path("data/dedupe/records.bib"),
+            unique_id_field="ID",
+        ).values()
+    )[:nr_records]
+    pairs = []
+    for record_dict, other_record_dict in zip(records, records[1:] + records[:1]):
+        pairs.append((record_dict, record_dict))
+        pairs.append((record_dict, other_record_dict))
+        pairs.extend((record_dict, variant) for variant in _get_variants(record_dict))
+    return [
+        (colrev.record.record.Record(a), colrev.record.record.Record(b))
+        for a, b in pairs
+    ]
+
+
+def _test_parity(pairs: list) -> None:
+    expected = [_bib_dedupe_matches(a, b) for a, b in pairs]
+    assert any(expected) and not all(expected)
+    actual = [colrev.record.record_similarity.matches(a, b) for a, b in pairs]
+    assert expected == actual
+    assert expected == colrev.record.record_similarity.match_pairs(pairs)
+
+
+def test_matches_parity(helpers) -> None:  # type: ignore
+    """Test that matches() corresponds to the bib_dedupe pipeline"""
+    _test_parity(_get_parity_pairs(helpers, 3))
+
+
+@pytest.mark.slow
+def test_matches_parity_all(helpers) -> None:  # type: ignore
+    """Test that matches() corresponds to the bib_dedupe pipeline (all records)"""
+    _test_parity(_get_parity_pairs(helpers, 21))
+
+
+def test_get_most_similar_records(helpers) -> None:  # type: ignore
+    """Test that get_most_similar_records() corresponds to pairwise comparisons"""
+    pairs = _get_parity_pairs(helpers, 5)
+    candidates = list({a.data[Fields.ID]: a for a, _ in pairs}.values())
+    records = [b for _, b in pairs]
+
+    def get_most_similar_record(record):  # type: ignore
+        max_similarity, most_similar_record = 0.9, None
+        for candidate in candidates:
+            similarity = colrev.record.record.Record.get_record_similarity(
+                record, candidate
+            )
+            if similarity > max_similarity:
+                max_similarity, most_similar_record = similarity, candidate
+        return most_similar_record
+
+    expected = [get_most_similar_record(record) for record in records]
+    assert any(x is not None for x in expected)
+    assert any(x is None for x in expected)
+    actual = colrev.record.record_similarity.get_most_similar_records(
+        records, candidates, min_similarity=0.9
+    )
+    assert expected == actual
+
+
+def test_get_most_similar_records_number_mismatch() -> None:
+    """Test that blocking corresponds to pairwise comparisons
+    when only the number differs (similarity of 0.9 with the current weights)"""
+    record_dict = {
+        Fields.ID: "001",
+        Fields.ENTRYTYPE: ENTRYTYPES.ARTICLE,
+        Fields.AUTHOR: "Rai, Arun",
+        Fields.YEAR: "2020",
+        Fields.TITLE: "Digital transformation",
+        Fields.JOURNAL: "MIS Quarterly",
+        Fields.VOLUME: "45",
+        Fields.NUMBER: "1",
+    }
+    record = colrev.record.record.Record(record_dict)
+    candidate = colrev.record.record.Record({**record_dict, Fields.NUMBER: "2"})
+
+    similarity = colrev.record.record.Record.get_record_similarity(record, candidate)
+    expected = candidate if similarity > 0.9 else None
+    actual = colrev.record.record_similarity.get_most_similar_records(
+        [record], [candidate], min_similarity=0.9
+    )
+    assert [expected] == actual
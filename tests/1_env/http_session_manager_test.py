@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+"""Tests for the shared HTTP session"""
+import http.server
+import socketserver
+import threading
+import time
+import typing
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+import colrev.env.http_session_manager
+import colrev.review_manager
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        """Return the path"""
+        body = self.path.encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: typing.Any) -> None:
+        """Do not log requests"""
+
+
+@pytest.fixture(name="server_url")
+def fixture_server_url() -> typing.Generator:
+    """A local http server"""
+    socketserver.ThreadingTCPServer.daemon_threads = True
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_shared_session(server_url: str, tmp_path: Path) -> None:
+    """Test the shared session (cache hits, rate limits and concurrent requests)"""
+
+    session_manager = colrev.env.http_session_manager.HTTPSessionManager(
+        cache_path=tmp_path / "cache", rate_limits={"127.0.0.1": 20.0}
+    )
+    session = session_manager.get_session()
+    assert session_manager.get_session() is session
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        responses = list(
+            executor.map(
+                lambda i: session.get(f"{server_url}/{i}", timeout=10).text,
+                range(10),
+            )
+        )
+    assert responses == [f"/{i}" for i in range(10)]
+    # Burst of 1, 20 requests per second
+    assert time.perf_counter() - start >= 0.4
+
+    assert session.get(f"{server_url}/1", timeout=10).from_cache
+
+    metrics = session_manager.get_metrics()
+    assert metrics["cache_hits"] == 1
+    assert metrics["cache_misses"] == 10
+    assert metrics["hit_rate"] == pytest.approx(1 / 11)
+    assert metrics["hosts"]["127.0.0.1"]["requests"] == 10
+    assert metrics["hosts"]["127.0.0.1"]["rate_limit_wait"] > 0
+
+    session_manager.close()
+
+
+def test_get_cached_session() -> None:
+    """The review manager returns the session shared by the process"""
+
+    assert (
+        colrev.review_manager.ReviewManager.get_cached_session()
+        is colrev.review_manager.ReviewManager.get_cached_session()
+    )
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+"""Test the local_index_builder"""
+import multiprocessing as mp
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+import colrev.env.local_index_builder
+import colrev.loader.load_utils
+from colrev.constants import Fields
+from colrev.constants import Filepaths
+
+
+def _load_projects(helpers) -> dict:  # type: ignore
+    projects = {}
+    for file_path in sorted(
+        (helpers.test_data_path / Path("data/local_index")).glob("*.bib"),
+        # Note : curation layers are indexed after the curated projects
+        key=lambda x: "cura" in x.name,
+    ):
+        records = colrev.loader.load_utils.load(
+            filename=file_path, unique_id_field="ID"
+        )
+        for record_dict in records.values():
+            record_dict.pop(Fields.FILE, None)
+        curated = "cura" in file_path.name
+        projects[Path(file_path.name)] = {
+            "records": records,
+            "repo_source_path": Path(file_path.name),
+            "curated_fields": ["literature_review"] if curated else [],
+            "curation_url": "gh...",
+            "curated_masterdata": not curated,
+        }
+    return projects
+
+
+def _get_rows(sqlite_file: Path) -> dict:
+    connection = sqlite3.connect(sqlite_file)
+    rows = {
+        table: connection.execute(f"SELECT * FROM {table} ORDER BY 1").fetchall()
+        for table in ["record_index", "toc_index"]
+    }
+    connection.close()
+    return rows
+
+
+@pytest.mark.skipif(
+    mp.get_start_method() != "fork",
+    reason="the patched project loader is only inherited by forked processes",
+)
+def test_bulk_index(tmp_path, helpers, monkeypatch) -> None:  # type: ignore
+    """Test the (parallel) bulk build against indexing projects one-by-one"""
+
+    monkeypatch.setattr(
+        Filepaths, "LOCAL_INDEX_SQLITE_FILE", tmp_path / Path("expected.db")
+    )
+    local_index_builder = colrev.env.local_index_builder.LocalIndexBuilder()
+    local_index_builder.reinitialize_sqlite_db()
+    for project in _load_projects(helpers).values():
+        local_index_builder.index_records(**project)
+
+    sqlite_file = tmp_path / Path("sqlite_index.db")
+    monkeypatch.setattr(Filepaths, "LOCAL_INDEX_SQLITE_FILE", sqlite_file)
+    prior_connection = sqlite3.connect(sqlite_file)
+    prior_connection.execute("PRAGMA journal_mode=WAL")
+    prior_connection.execute("CREATE TABLE record_index (id TEXT PRIMARY KEY)")
+    prior_connection.close()
+    projects = _load_projects(helpers)
+    monkeypatch.setattr(
+        colrev.env.local_index_builder.LocalIndexBuilder,
+        "_load_colrev_project",
+        lambda self, repo_source_path: projects[repo_source_path],
+    )
+    local_index_builder._bulk_index(list(projects.keys()))
+
+    assert not sqlite_file.with_suffix(".build.db").is_file()
+    expected = _get_rows(tmp_path / Path("expected.db"))
+    actual = _get_rows(sqlite_file)
+    assert expected["record_index"]
+    assert expected == actual
+
+    connection = sqlite3.connect(sqlite_file)
+    assert ("wal",) == connection.execute("PRAGMA journal_mode").fetchone()
+    indices = connection.execute(
+        "SELECT name FROM sqlite_master WHERE type='index' AND name LIKE 'record_index_%'"
+    ).fetchall()
+    assert len(indices) == len(
+        colrev.env.local_index_sqlite.SQLiteIndexRecord.INDEXED_KEYS
+    )
+    connection.close()
@@ -1,5 +1,177 @@
 #!/usr/bin/env python
 """Test the local_index"""
+import sqlite3
+import time
+import typing
+from pathlib import Path
+
+import pytest
+
+import colrev.env.local_index
+import colrev.env.local_index_sqlite
+from colrev.constants import ENTRYTYPES
+from colrev.constants import Fields
+from colrev.constants import Filepaths
+from colrev.constants import LocalIndexFields
+from colrev.constants import RecordState
+from colrev.writer.write_utils import to_string
+
 # pylint: disable=line-too-long
 # flake8: noqa: E501
-# TODO
+
+RECORD_DICT = {
+    Fields.ID: "SmithJones2020",
+    Fields.ENTRYTYPE: ENTRYTYPES.ARTICLE,
+    Fields.STATUS: RecordState.md_processed,
+    Fields.MD_PROV: {
+        Fields.AUTHOR: {"source": "crossref.bib/001", "note": ""},
+    },
+    Fields.DOI: "10.1111/ISJ.12345",
+    Fields.AUTHOR: "Smith, Tom and Jones, Anna",
+    Fields.TITLE: "A title",
+    Fields.JOURNAL: "Information Systems Journal",
+    Fields.YEAR: "2020",
+}
+
+
+def test_record_json() -> None:
+    """Test record_to_json() and record_from_json()"""
+
+    record_json = colrev.env.local_index_sqlite.record_to_json(RECORD_DICT)
+    assert '"colrev_status": "md_processed"' in record_json
+    actual = colrev.env.local_index_sqlite.record_from_json(record_json)
+    assert RECORD_DICT == actual
+
+
+def test_migrate_bibtex_index(tmp_path, monkeypatch) -> None:  # type: ignore
+    """Test the migration of an index with bibtex strings (schema version 0)"""
+
+    sqlite_file = tmp_path / Path("sqlite_index.db")
+    monkeypatch.setattr(Filepaths, "LOCAL_INDEX_SQLITE_FILE", sqlite_file)
+    keys = [
+        LocalIndexFields.BIBTEX if k == LocalIndexFields.RECORD_JSON else k
+        for k in colrev.env.local_index_sqlite.SQLiteIndexRecord.KEYS
+    ]
+    connection = sqlite3.connect(sqlite_file)
+    connection.execute(
+        "CREATE TABLE record_index (id TEXT PRIMARY KEY," + ",".join(keys[1:]) + ")"
+    )
+    row = {key: "" for key in keys}
+    row[LocalIndexFields.ID] = "e44d8844c3d8"
+    row[Fields.DOI] = RECORD_DICT[Fields.DOI]
+    row[LocalIndexFields.BIBTEX] = to_string(
+        records_dict={RECORD_DICT[Fields.ID]: RECORD_DICT}, implementation="bib"
+    )
+    connection.execute(
+        f"INSERT INTO record_index VALUES(:{', :'.join(keys)})",
+        row,
+    )
+    connection.commit()
+    connection.close()
+
+    sqlite_index_record = colrev.env.local_index_sqlite.SQLiteIndexRecord()
+    cur = sqlite_index_record.connection.execute("PRAGMA user_version")
+    assert {
+        "user_version": colrev.env.local_index_sqlite.SQLiteIndexRecord.SCHEMA_VERSION
+    } == cur.fetchone()
+    actual = sqlite_index_record.get(key=Fields.DOI, value=RECORD_DICT[Fields.DOI])
+    assert RECORD_DICT == actual
+    sqlite_index_record.connection.close()
+
+    # Migrated indices are not migrated again
+    sqlite_index_record = colrev.env.local_index_sqlite.SQLiteIndexRecord()
+    actual = sqlite_index_record.get(key=Fields.DOI, value=RECORD_DICT[Fields.DOI])
+    assert RECORD_DICT == actual
+    sqlite_index_record.connection.close()
+
+
+def _get_index_rows(nr_records: int) -> typing.Iterator[dict]:
+    for i in range(nr_records):
+        row = {key: "" for key in colrev.env.local_index_sqlite.SQLiteIndexRecord.KEYS}
+        row[LocalIndexFields.ID] = f"{i:064x}"
+        row[Fields.COLREV_ID] = f"colrev_id1:|a|journal-{i}|1|1|2020|smith|title-{i}"
+        row[Fields.DOI] = f"10.1111/ISJ.{i}"
+        row[Fields.URL] = f"https://www.journal.com/{i}"
+        row[LocalIndexFields.RECORD_JSON] = (
+            colrev.env.local_index_sqlite.record_to_json(
+                {**RECORD_DICT, Fields.DOI: row[Fields.DOI]}
+            )
+        )
+        yield row
+
+
+def test_query_plans(tmp_path, monkeypatch) -> None:  # type: ignore
+    """Test that lookups use indices (instead of full table scans)"""
+
+    monkeypatch.setattr(
+        Filepaths, "LOCAL_INDEX_SQLITE_FILE", tmp_path / Path("sqlite_index.db")
+    )
+    sqlite_index_record = colrev.env.local_index_sqlite.SQLiteIndexRecord(
+        reinitialize=True
+    )
+    sqlite_index_toc = colrev.env.local_index_sqlite.SQLiteIndexTOC(reinitialize=True)
+    cur = sqlite_index_record.connection.execute("PRAGMA journal_mode")
+    assert {"journal_mode": "wal"} == cur.fetchone()
+
+    for query in sqlite_index_record.SELECT_KEY_QUERIES.values():
+        cur.execute(f"EXPLAIN QUERY PLAN {query}", ("value",))
+        assert "USING INDEX" in cur.fetchone()["detail"]
+
+    toc_queries = [
+        sqlite_index_toc.SELECT_PARTIAL_KEY_QUERY,
+        sqlite_index_toc.SELECT_KEY_QUERY[LocalIndexFields.TOC_KEY],
+    ]
+    for query in toc_queries:
+        cur.execute(f"EXPLAIN QUERY PLAN {query}", ("value",) * query.count("?"))
+        assert "USING INDEX" in cur.fetchone()["detail"]
+
+    sqlite_index_toc.add(
+        {"journal|1|1": "a;b", "Journal|1|2": "c", "other|1": "d", "journal|10": "e"}
+    )
+    # Partial keys are case-insensitive (like the LIKE query)
+    assert ["a", "b", "c"] == sorted(
+        sqlite_index_toc.get_toc_items(partial_toc_key="journal|1|")
+    )
+    sqlite_index_record.connection.close()
+    sqlite_index_toc.connection.close()
+
+
+@pytest.mark.slow
+def test_lookup_benchmark(tmp_path, monkeypatch) -> None:  # type: ignore
+    """Benchmark lookups in an index with 1M records (with and without indices)"""
+
+    nr_records = 1000000
+    monkeypatch.setattr(
+        Filepaths, "LOCAL_INDEX_SQLITE_FILE", tmp_path / Path("sqlite_index.db")
+    )
+    sqlite_index_record = colrev.env.local_index_sqlite.SQLiteIndexRecord(
+        reinitialize=True
+    )
+    sqlite_index_record.connection.executemany(
+        sqlite_index_record.INSERT_QUERY, _get_index_rows(nr_records)
+    )
+    sqlite_index_record.commit()
+
+    local_index = colrev.env.local_index.LocalIndex()
+
+    def lookup(nr_lookups: int) -> float:
+        start = time.time()
+        for i in range(0, nr_records, nr_records // nr_lookups):
+            retrieved = local_index.retrieve(
+                {Fields.ID: "x", Fields.DOI: f"10.1111/ISJ.{i}"}
+            )
+            assert retrieved.data[Fields.DOI] == f"10.1111/ISJ.{i}"
+        return (time.time() - start) / nr_lookups
+
+    indexed_duration = lookup(1000)
+
+    for key in sqlite_index_record.INDEXED_KEYS:
+        sqlite_index_record.connection.execute(f"DROP INDEX record_index_{key}")
+    sqlite_index_record.connection.close()
+    full_scan_duration = lookup(20)
+
+    print(
+        f"lookup latency (1M records): {indexed_duration * 1000:.3f}ms (indexed) "
+        f"vs. {full_scan_duration * 1000:.3f}ms (full table scans)"
+    )
+    assert indexed_duration * 10 < full_scan_duration
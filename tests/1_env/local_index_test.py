@@ -66,6 +66,28 @@ def test_get_year_from_toc(local_index) -> None:  # type: ignore
     assert expected == actual
 
 
+def test_retrieve_many(local_index) -> None:  # type: ignore
+    """Test retrieve_many()"""
+
+    record_dicts = [
+        {
+            Fields.ID: "AbbasZhouDengEtAl2018",
+            Fields.ENTRYTYPE: ENTRYTYPES.ARTICLE,
+            Fields.DOI: "10.25300/MISQ/2018/13239",
+            Fields.TITLE: "Text Analytics",
+        },
+        {
+            Fields.ID: "NotIndexed2024",
+            Fields.ENTRYTYPE: ENTRYTYPES.ARTICLE,
+            Fields.DOI: "10.1111/not-indexed",
+            Fields.TITLE: "Not indexed",
+        },
+    ]
+    actual = local_index.retrieve_many(record_dicts)
+    assert actual == [local_index.retrieve(record_dicts[0]), None]
+    assert actual[0].data[Fields.ID] == "AbbasZhouDengEtAl2018"
+
+
 # TODO retrieve
 
 
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+"""Tests for the package manifest of the package manager"""
+import json
+
+import pytest
+
+import colrev.exceptions as colrev_exceptions
+import colrev.package_manager.package_manager
+from colrev.constants import EndpointType
+
+
+def test_package_manifest() -> None:
+    """Test that the package_manifest.json corresponds to the pyproject.toml files"""
+
+    package_manager = colrev.package_manager.package_manager.PackageManager()
+    with open(package_manager._get_manifest_path(), encoding="utf-8") as file:
+        manifest = json.load(file)
+
+    # If this fails, run colrev env --update_package_list
+    assert manifest == package_manager.build_manifest()
+
+    type_identifier_endpoint_dict = package_manager.load_type_identifier_endpoint_dict()
+    assert (
+        type_identifier_endpoint_dict[EndpointType.prep]["colrev.crossref"]
+        == "colrev.packages.crossref.src.crossref_prep:CrossrefMetadataPrep"
+    )
+
+
+def test_get_package_endpoint_class() -> None:
+    """Test get_package_endpoint_class()"""
+
+    package_manager = colrev.package_manager.package_manager.PackageManager()
+    endpoint_class = package_manager.get_package_endpoint_class(
+        package_type=EndpointType.prep, package_identifier="colrev.crossref"
+    )
+    assert endpoint_class.__name__ == "CrossrefMetadataPrep"
+    # Memoized (per process)
+    other_package_manager = colrev.package_manager.package_manager.PackageManager()
+    assert endpoint_class is other_package_manager.get_package_endpoint_class(
+        package_type=EndpointType.prep, package_identifier="colrev.crossref"
+    )
+
+    with pytest.raises(colrev_exceptions.MissingDependencyError):
+        package_manager.get_package_endpoint_class(
+            package_type=EndpointType.screen, package_identifier="colrev.crossref"
+        )
+    with pytest.raises(colrev_exceptions.MissingDependencyError):
+        package_manager.get_package_endpoint_class(
+            package_type=EndpointType.prep, package_identifier="colrev.not_a_package"
+        )
+    with pytest.raises(colrev_exceptions.MissingDependencyError):
+        package_manager.get_package_endpoint_class(
+            package_type=EndpointType.prep, package_identifier="not_colrev.package"
+        )
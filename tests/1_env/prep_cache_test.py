@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+"""Tests for the prep cache"""
+import time
+from pathlib import Path
+
+import colrev.env.prep_cache
+import colrev.record.record_prep
+from colrev.constants import Fields
+from colrev.constants import RecordState
+
+# pylint: disable=too-few-public-methods
+
+
+class _Endpoint:
+    cacheable = True
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def prepare(
+        self, record: colrev.record.record_prep.PrepRecord
+    ) -> colrev.record.record_prep.PrepRecord:
+        """Change the record"""
+        self.calls += 1
+        record.data[Fields.TITLE] = record.data[Fields.TITLE].upper()
+        record.data[Fields.STATUS] = RecordState.md_prepared
+        del record.data[Fields.URL]
+        return record
+
+
+def _prepare(
+    prep_cache: colrev.env.prep_cache.PrepCache,
+    endpoint: _Endpoint,
+    record: colrev.record.record_prep.PrepRecord,
+) -> colrev.record.record_prep.PrepRecord:
+    settings = {"endpoint": "test.endpoint"}
+    key = prep_cache.get_key(
+        endpoint=endpoint, endpoint_settings=settings, record=record
+    )
+    delta = prep_cache.get_delta(key)
+    if delta is not None:
+        prep_cache.apply_delta(record=record, delta=delta)
+        return record
+    prior = record.copy_prep_rec()
+    record = endpoint.prepare(record)
+    prep_cache.add_delta(key, prior=prior, record=record)
+    return record
+
+
+def _get_record() -> colrev.record.record_prep.PrepRecord:
+    return colrev.record.record_prep.PrepRecord(
+        {
+            Fields.ID: "r1",
+            Fields.ENTRYTYPE: "article",
+            Fields.TITLE: "A title",
+            Fields.URL: "https://www.example.org",
+            Fields.STATUS: RecordState.md_imported,
+        }
+    )
+
+
+def test_prep_cache(tmp_path: Path) -> None:
+    """Cached changes are applied without running the endpoint"""
+
+    endpoint = _Endpoint()
+    prep_cache = colrev.env.prep_cache.PrepCache(cache_file=tmp_path / "cache.db")
+    assert prep_cache.is_cacheable(endpoint)
+
+    expected = _prepare(prep_cache, endpoint, _get_record()).data
+    assert endpoint.calls == 1
+    prep_cache.close()
+
+    prep_cache = colrev.env.prep_cache.PrepCache(cache_file=tmp_path / "cache.db")
+    actual = _prepare(prep_cache, endpoint, _get_record()).data
+    assert endpoint.calls == 1
+    assert actual == expected
+    assert actual[Fields.STATUS] == RecordState.md_prepared
+    assert Fields.URL not in actual
+    assert (prep_cache.hits, prep_cache.misses) == (1, 0)
+
+    # Other input records (or settings) are not served from the cache
+    record = _get_record()
+    record.data[Fields.TITLE] = "Another title"
+    _prepare(prep_cache, endpoint, record)
+    assert endpoint.calls == 2
+    prep_cache.close()
+
+
+def test_prep_cache_eviction(tmp_path: Path) -> None:
+    """Entries are evicted by age and size"""
+
+    endpoint = _Endpoint()
+    prep_cache = colrev.env.prep_cache.PrepCache(cache_file=tmp_path / "cache.db")
+    for i in range(3):
+        record = _get_record()
+        record.data[Fields.TITLE] = f"Title {i}"
+        _prepare(prep_cache, endpoint, record)
+    prep_cache.evict()
+
+    def nr_entries() -> int:
+        return prep_cache._connection.execute(  # pylint: disable=protected-access
+            "SELECT COUNT(*) FROM prep_cache"
+        ).fetchone()[0]
+
+    assert nr_entries() == 3
+
+    prep_cache.max_size = 1
+    prep_cache.evict()
+    assert nr_entries() == 0
+
+    prep_cache.max_size = 200 * 1024 * 1024
+    _prepare(prep_cache, endpoint, _get_record())
+    prep_cache.max_age = colrev.env.prep_cache.timedelta(seconds=0)
+    time.sleep(0.01)
+    assert prep_cache.get_delta("unknown") is None
+    prep_cache.evict()
+    assert nr_entries() == 0
+    prep_cache.close()
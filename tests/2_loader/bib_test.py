@@ -2,6 +2,7 @@
 """Tests of the load utils for bib files"""
 import logging
 import os
+import time
 from pathlib import Path
 
 import pytest
@@ -11,6 +12,8 @@ import colrev.loader.bib
 import colrev.loader.load_utils
 import colrev.review_manager
 import colrev.settings
+import colrev.writer.bib
+from colrev.constants import RecordState
 
 
 def test_load(tmp_path, helpers) -> None:  # type: ignore
@@ -119,3 +122,140 @@ def test_load(tmp_path, helpers) -> None:  # type: ignore
     Path("data/search/bib_data2.unkonwn").write_text("This is not a bib file.")
     with pytest.raises(NotImplementedError):
         colrev.loader.load_utils.get_nr_records(Path("data/search/bib_data2.unkonwn"))
+
+
+def _get_records_bib_records(nr_records: int) -> dict:
+    records = {}
+    for i in range(nr_records):
+        record_id = f"Staehr{i:06d}"
+        records[record_id] = {
+            "ID": record_id,
+            "ENTRYTYPE": "article",
+            "colrev_origin": [f"crossref.bib/{i}", f"dblp.bib/{i}"],
+            "colrev_status": RecordState.md_processed,
+            "colrev_masterdata_provenance": {
+                "volume": {"source": "crossref.bib/0001", "note": "missing"},
+            },
+            "colrev_data_provenance": {
+                "language": {"source": "LanguageDetector", "note": ""},
+            },
+            "doi": f"10.1111/J.1365-2575.{i}.X",
+            "author": "Staehr, Lorraine and van der Berg, Jan Peter",
+            "journal": "Information Systems Journal",
+            "title": "Understanding the role of {ERP} systems\n   in manufacturing",
+            "year": "2010",
+            "volume": "20",
+            "number": "2",
+            "pages": "143--167",
+            "abstract": "This is an abstract\n\nwith multiple lines.",
+            "language": "eng",
+        }
+    return records
+
+
+def test_load_records_bib_native(tmp_path) -> None:  # type: ignore
+    """Test the single-pass parser for files in the records.bib format"""
+
+    records = _get_records_bib_records(3)
+    records["Staehr000001"]["editor"] = "Smith, J.-P. AND M. Doe"
+    records["Staehr000002"]["title"] = "Nested {{IT}} braces {here}"
+    colrev.writer.bib.write_file(
+        records_dict=records, filename=tmp_path / "records.bib"
+    )
+    bib_loader = colrev.loader.bib.BIBLoader(filename=tmp_path / "records.bib")
+    native_records = bib_loader._load_records_dict_native()
+    assert native_records == bib_loader._load_records_dict_pybtex()
+    assert native_records["Staehr000000"]["colrev_origin"] == [
+        "crossref.bib/0",
+        "dblp.bib/0",
+    ]
+    assert native_records["Staehr000000"]["colrev_status"] == RecordState.md_processed
+    assert native_records["Staehr000000"]["colrev_masterdata_provenance"] == {
+        "volume": {"source": "crossref.bib/0001", "note": "missing"},
+    }
+    assert (
+        native_records["Staehr000000"]["abstract"]
+        == "This is an abstract with multiple lines."
+    )
+    assert native_records["Staehr000001"]["editor"] == "Smith, J.-P. and Doe, M."
+    assert native_records["Staehr000002"]["title"] == "Nested {{IT}} braces {here}"
+
+    # Non-standard files (e.g., quoted values) are loaded with pybtex
+    (tmp_path / "quoted.bib").write_text(
+        '@article{Staehr2010,\n  title = "Quoted title",\n  year = 2010,\n}\n'
+    )
+    bib_loader = colrev.loader.bib.BIBLoader(filename=tmp_path / "quoted.bib")
+    with pytest.raises(colrev.loader.bib._NonStandardBibFormat):
+        bib_loader._load_records_dict_native()
+    assert colrev.loader.load_utils.load(filename=tmp_path / "quoted.bib") == {
+        "Staehr2010": {
+            "ID": "Staehr2010",
+            "ENTRYTYPE": "article",
+            "title": "Quoted title",
+            "year": "2010",
+        }
+    }
+
+
+@pytest.mark.slow
+def test_load_records_bib_benchmark(tmp_path) -> None:  # type: ignore
+    """Benchmark the single-pass parser against pybtex (100k records)"""
+
+    colrev.writer.bib.write_file(
+        records_dict=_get_records_bib_records(100000),
+        filename=tmp_path / "records.bib",
+    )
+    bib_loader = colrev.loader.bib.BIBLoader(filename=tmp_path / "records.bib")
+
+    start = time.time()
+    native_records = bib_loader._load_records_dict_native()
+    native_duration = time.time() - start
+
+    start = time.time()
+    pybtex_records = bib_loader._load_records_dict_pybtex()
+    pybtex_duration = time.time() - start
+
+    print(f"native: {native_duration:.2f}s, pybtex: {pybtex_duration:.2f}s")
+    assert native_records == pybtex_records
+    assert native_duration < pybtex_duration
+
+
+def test_apply_file_fixes(tmp_path, caplog) -> None:  # type: ignore
+    """Test the fixes of duplicate IDs and invalid keys"""
+
+    (tmp_path / "duplicates.bib").write_text(
+        "@article{Smith2020,\n  title = {First},\n}\n\n"
+        "@article{smith2020a,\n  title = {Second},\n}\n\n"
+        "@article{Smith2020,\n  title = {Third},\n  key words = {x},\n}\n\n"
+        "@article{Smith2020,\n  title = {Fourth},\n}\n\n"
+        "@article{Smith 2020,\n  title = {Fifth},\n}\n"
+    )
+    with caplog.at_level(logging.INFO):
+        records = colrev.loader.load_utils.load(
+            filename=tmp_path / "duplicates.bib",
+            logger=logging.getLogger(__name__),
+        )
+    assert {record_id: record["title"] for record_id, record in records.items()} == {
+        "Smith2020": "First",
+        "smith2020a": "Second",
+        "Smith2020b": "Third",
+        "Smith2020c": "Fourth",
+        "Smith_2020": "Fifth",
+    }
+    assert records["Smith2020b"]["key_words"] == "x"
+    assert "Fix duplicate ID: Smith2020 >> Smith2020b" in caplog.text
+    assert "Fix invalid key:" in caplog.text
+    # The temporary (fixed) file is removed
+    assert [f.name for f in tmp_path.iterdir()] == ["duplicates.bib"]
+
+
+def test_apply_file_fixes_error(tmp_path) -> None:  # type: ignore
+    """The temporary file is removed if the file cannot be fixed"""
+
+    (tmp_path / "invalid.bib").write_text("no records in this file\n" * 5)
+    with pytest.raises(colrev_exceptions.UnsupportedImportFormatError):
+        colrev.loader.load_utils.load(
+            filename=tmp_path / "invalid.bib",
+            logger=logging.getLogger(__name__),
+        )
+    assert [f.name for f in tmp_path.iterdir()] == ["invalid.bib"]
@@ -1,7 +1,9 @@
 #!/usr/bin/env python
 """Tests of the load utils for bib files"""
+import io
 import logging
 import os
+import tempfile
 from pathlib import Path
 
 import pytest
@@ -47,3 +49,54 @@ def test_load(tmp_path, helpers) -> None:  # type: ignore
 
     with pytest.raises(NotImplementedError):
         colrev.loader.load_utils.loads(load_string="content...", implementation="xy")
+
+
+@pytest.mark.parametrize(
+    "filename",
+    [
+        "bib_data.bib",
+        "ris_data.ris",
+        "nbib_data.nbib",
+        "enl_data.enl",
+        "csv_data.csv",
+    ],
+)
+def test_loads(tmp_path, helpers, monkeypatch, filename: str) -> None:  # type: ignore
+    """Test that loads() parses strings in memory (like load() for files)"""
+    os.chdir(tmp_path)
+
+    def entrytype_setter(record_dict: dict) -> None:
+        record_dict["ENTRYTYPE"] = "misc"
+
+    def field_mapper(record_dict: dict) -> None:
+        # str(): nan values (csv) are not equal to themselves
+        for key, value in record_dict.items():
+            record_dict[key] = str(value)
+
+    helpers.retrieve_test_file(
+        source=Path("2_loader/data") / filename,
+        target=Path(filename),
+    )
+    load_kwargs = {
+        "entrytype_setter": entrytype_setter,
+        "field_mapper": field_mapper,
+        "unique_id_field": "" if filename.endswith(".bib") else "INCREMENTAL",
+        "logger": logging.getLogger(__name__),
+    }
+    expected = colrev.loader.load_utils.load(filename=Path(filename), **load_kwargs)
+    content = Path(filename).read_text(encoding="utf-8")
+
+    def no_temp_file(*args, **kwargs) -> None:  # type: ignore
+        raise AssertionError("loads() should not create temporary files")
+
+    monkeypatch.setattr(tempfile, "NamedTemporaryFile", no_temp_file)
+    implementation = Path(filename).suffix[1:]
+    actual = colrev.loader.load_utils.loads(
+        load_string=content, implementation=implementation, **load_kwargs
+    )
+    assert actual == expected
+    actual = colrev.loader.load_utils.loads(
+        load_string=io.StringIO(content), implementation=implementation, **load_kwargs
+    )
+    assert actual == expected
+    assert sorted(os.listdir(tmp_path)) == [filename]
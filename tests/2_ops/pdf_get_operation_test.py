@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 """Tests of the CoLRev pdf-get operation"""
+import shutil
 from pathlib import Path
 
 import colrev.review_manager
@@ -143,6 +144,34 @@ def test_pdf_get_get_target_filepath(  # type: ignore
     assert actual == expected
 
 
+def test_pdf_get_pdf_candidates(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager, helpers, caplog
+) -> None:
+    """Test the pdf-get _get_pdf_candidates() (PDFs that cannot be hashed)"""
+
+    helpers.reset_commit(base_repo_review_manager, commit="pdf_get_commit")
+
+    pdf_get_operation = base_repo_review_manager.get_pdf_get_operation(
+        notify_state_transition_operation=True
+    )
+    # Note : other tests add PDFs to data/pdfs
+    pdf_dir = base_repo_review_manager.paths.pdf / Path("candidates")
+    helpers.retrieve_test_file(
+        source=Path("data/SrivastavaShainesh2015.pdf"),
+        target=Path("data/pdfs/candidates/SrivastavaShainesh2015.pdf"),
+    )
+    (pdf_dir / Path("broken.pdf")).write_text("not a pdf", encoding="utf-8")
+
+    with caplog.at_level("WARNING"):
+        pdf_candidates = pdf_get_operation._get_pdf_candidates(pdf_dir)
+    assert list(pdf_candidates) == [
+        Path("data/pdfs/candidates/SrivastavaShainesh2015.pdf")
+    ]
+    assert "Skipped 1 PDFs" in caplog.text
+    assert "data/pdfs/candidates/broken.pdf" in caplog.text
+    shutil.rmtree(pdf_dir)
+
+
 # def test_pdf_get_get_relink_pdfs(  # type: ignore
 #     base_repo_review_manager: colrev.review_manager.ReviewManager, helpers
 # ) -> None:
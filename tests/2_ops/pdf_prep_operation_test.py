@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 """Tests of the CoLRev pdf-prep operations"""
+import colrev.ops.pdf_prep
 import colrev.review_manager
 
 
@@ -23,3 +24,24 @@ def test_pdf_discard(  # type: ignore
     helpers.reset_commit(base_repo_review_manager, commit="pdf_prep_commit")
     pdf_get_man_operation = base_repo_review_manager.get_pdf_get_man_operation()
     pdf_get_man_operation.discard()
+
+
+def test_pdf_prep_chunks(tmp_path) -> None:  # type: ignore
+    """Test the size-based chunking of pdf-prep tasks"""
+
+    sizes = {"a": 50, "b": 10, "c": 40, "d": 30, "e": 0}
+    for name, size in sizes.items():
+        (tmp_path / f"{name}.pdf").write_bytes(b"0" * size)
+    items = [{"record": {"ID": name, "file": f"{name}.pdf"}} for name in sizes]
+    items.append({"record": {"ID": "missing", "file": "missing.pdf"}})
+
+    chunks = colrev.ops.pdf_prep.get_pdf_prep_chunks(items, nr_chunks=2, path=tmp_path)
+    assert [[i["record"]["ID"] for i in chunk] for chunk in chunks] == [
+        ["c", "d"],
+        ["a", "b", "e", "missing"],
+    ]
+
+    chunks = colrev.ops.pdf_prep.get_pdf_prep_chunks(
+        items[:2], nr_chunks=8, path=tmp_path
+    )
+    assert len(chunks) == 2
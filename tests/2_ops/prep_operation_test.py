@@ -1,6 +1,18 @@
 #!/usr/bin/env python
 """Tests of the CoLRev prep operation"""
+import threading
+import time
+
+from requests.exceptions import ReadTimeout
+
+import colrev.process.profiler
+import colrev.record.record_prep
 import colrev.review_manager
+import colrev.settings
+from colrev.constants import Fields
+
+# pylint: disable=protected-access
+# pylint: disable=too-few-public-methods
 
 
 def test_prep(  # type: ignore
@@ -46,3 +58,104 @@ def test_prep_with_polish_flag(  # type: ignore
     prep_operation.main()
 
     # Assertions can be added here based on expected outcomes
+
+
+def test_prep_endpoint_budgets(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager,
+) -> None:
+    """Test the concurrency budgets for network and cpu endpoints"""
+
+    class Endpoint:
+        """Endpoint tracking the number of concurrent calls"""
+
+        def __init__(self, requires_network: bool) -> None:
+            self.requires_network = requires_network
+            self.lock = threading.Lock()
+            self.running = 0
+            self.max_running = 0
+
+        def prepare(self) -> None:
+            """Simulate a request"""
+            with self.lock:
+                self.running += 1
+                self.max_running = max(self.max_running, self.running)
+            time.sleep(0.01)
+            with self.lock:
+                self.running -= 1
+
+    prep_operation = base_repo_review_manager.get_prep_operation(cpu=2)
+    pool = prep_operation._get_prep_pool(
+        colrev.settings.PrepRound(name="test", prep_package_endpoints=[])
+    )
+    network_endpoint = Endpoint(requires_network=True)
+    cpu_endpoint = Endpoint(requires_network=False)
+
+    def run(endpoint: Endpoint) -> None:
+        with prep_operation._get_endpoint_budget(endpoint):
+            endpoint.prepare()
+
+    pool.map(run, [network_endpoint, cpu_endpoint] * 50)
+    pool.close()
+    pool.join()
+
+    assert network_endpoint.max_running <= min(
+        prep_operation.max_network_concurrency,
+        prep_operation.network_concurrency_per_cpu * 2,
+    )
+    assert network_endpoint.max_running > 2
+    assert cpu_endpoint.max_running <= 2
+
+
+def test_prep_pool_default_cpu(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager,
+) -> None:
+    """Test the prep pool when the number of cpus is not set (colrev prep)"""
+
+    prep_operation = base_repo_review_manager.get_prep_operation(cpu=None)  # type: ignore
+    pool = prep_operation._get_prep_pool(
+        colrev.settings.PrepRound(name="test", prep_package_endpoints=[])
+    )
+    pool.close()
+    pool.join()
+    assert set(prep_operation._endpoint_budgets) == {"cpu", "network"}
+
+
+def test_prep_profiler(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager,
+) -> None:
+    """Test the profile of the prep endpoints"""
+
+    class Endpoint:
+        """Endpoint failing for records without title"""
+
+        requires_network = True
+
+        def prepare(
+            self, record: colrev.record.record_prep.PrepRecord
+        ) -> colrev.record.record_prep.PrepRecord:
+            """Prepare the record"""
+            if Fields.TITLE not in record.data:
+                raise ReadTimeout
+            return record
+
+    profiler = colrev.process.profiler.OperationProfiler(operation="prep")
+    prep_operation = base_repo_review_manager.get_prep_operation(profiler=profiler)
+    assert prep_operation.profiler is profiler
+
+    for record_dict in [{Fields.ID: "r1", Fields.TITLE: "A title"}, {Fields.ID: "r2"}]:
+        record = colrev.record.record_prep.PrepRecord(record_dict)
+        try:
+            prep_operation._run_endpoint(
+                Endpoint(),
+                prep_round_package_endpoint={"endpoint": "colrev.test"},
+                preparation_record=record,
+                prior=record.copy_prep_rec(),
+            )
+        except ReadTimeout:
+            pass
+
+    endpoint_stats = profiler.get_endpoint_stats()[0]
+    assert endpoint_stats["endpoint"] == "colrev.test"
+    assert endpoint_stats["calls"] == 2
+    assert endpoint_stats["errors"] == 1
+    assert endpoint_stats["cache_hit_rate"] is None
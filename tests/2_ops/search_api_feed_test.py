@@ -5,10 +5,12 @@ from __future__ import annotations
 import logging
 import typing
 from copy import deepcopy
+from multiprocessing.pool import ThreadPool
 from pathlib import Path
 
 import pytest
 
+import colrev.ops.search_api_feed
 import colrev.record.record
 import colrev.review_manager
 import colrev.settings
@@ -493,3 +495,58 @@ def test_search_feed_prep_mode(search_feed, caplog) -> None:  # type: ignore
     )
     assert record_dict[Fields.ORIGIN] == ["test.bib/000001"]
     search_feed.prep_mode = False
+
+
+def test_search_feed_resident(  # type: ignore
+    base_repo_review_manager,
+) -> None:
+    """Test the (shared) resident search feeds in prep mode"""
+
+    source = colrev.settings.SearchSource(
+        endpoint="colrev.crossref",
+        filename=Path("data/search/resident_test.bib"),
+        search_type=SearchType.DB,
+        search_parameters={"query": "query"},
+        comment="",
+    )
+    prev_sources = deepcopy(base_repo_review_manager.settings.sources)
+
+    def get_feed():  # type: ignore
+        return source.get_api_feed(
+            review_manager=base_repo_review_manager,
+            source_identifier="doi",
+            update_only=False,
+            prep_mode=True,
+        )
+
+    def link(i: int) -> str:
+        retrieved_record = colrev.record.record.Record(
+            {
+                Fields.ID: str(i),
+                Fields.ENTRYTYPE: "article",
+                Fields.TITLE: f"Title {i}",
+                Fields.DOI: f"10.111/{i}",
+            }
+        )
+        feed = get_feed()
+        feed.add_update_record(retrieved_record)
+        feed.save()
+        return retrieved_record.data[Fields.ORIGIN][0]
+
+    with colrev.ops.search_api_feed.SearchAPIFeed.keep_resident():
+        assert get_feed() is get_feed()
+        with ThreadPool(8) as pool:
+            origins = pool.map(link, range(50))
+        # Saved when flushed (not for every record)
+        assert not source.filename.is_file()
+        colrev.ops.search_api_feed.SearchAPIFeed.flush_resident_feeds()
+        assert source.filename.is_file()
+        link(50)
+
+    assert len(set(origins)) == 50
+    feed = get_feed()
+    assert get_feed() is not feed
+    assert 51 == len(feed.feed_records)
+
+    source.filename.unlink()
+    base_repo_review_manager.settings.sources = prev_sources
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+"""Tests of the bib writer"""
+import io
+import time
+from copy import deepcopy
+from pathlib import Path
+
+import pytest
+
+import colrev.writer.bib
+from colrev.constants import Fields
+from colrev.constants import RecordState
+
+# flake8: noqa: E501
+
+
+def _get_records(nr_records: int) -> dict:
+    records = {}
+    for i in range(nr_records):
+        record_id = f"Staehr{i:06d}"
+        records[record_id] = {
+            Fields.ID: record_id,
+            Fields.ENTRYTYPE: "article",
+            Fields.ORIGIN: [f"dblp.bib/{i}", f"crossref.bib/{i}", f"dblp.bib/{i}"],
+            Fields.STATUS: RecordState.md_processed,
+            Fields.MD_PROV: {
+                Fields.VOLUME: {"source": "crossref.bib/0001", "note": "missing,a"},
+            },
+            Fields.D_PROV: {
+                Fields.LANGUAGE: {"source": "LanguageDetector", "note": ""},
+            },
+            Fields.DOI: f"10.1111/J.1365-2575.{i}.X",
+            Fields.AUTHOR: "Staehr, Lorraine",
+            Fields.JOURNAL: "Information Systems Journal",
+            Fields.TITLE: "Understanding the role of managerial agency",
+            Fields.YEAR: "2010",
+            Fields.PAGES: "",
+            Fields.LANGUAGE: "eng",
+            "note": "",
+        }
+    return records
+
+
+def test_to_string() -> None:
+    """Test the bib writer"""
+
+    records = _get_records(1)
+    records_copy = deepcopy(records)
+
+    expected = """@article{Staehr000000,
+   colrev_origin                 = {crossref.bib/0;
+                                    dblp.bib/0;},
+   colrev_status                 = {md_processed},
+   colrev_masterdata_provenance  = {volume:crossref.bib/0001;a,missing;},
+   colrev_data_provenance        = {language:LanguageDetector;;},
+   doi                           = {10.1111/J.1365-2575.0.X},
+   author                        = {Staehr, Lorraine},
+   journal                       = {Information Systems Journal},
+   title                         = {Understanding the role of managerial agency},
+   year                          = {2010},
+   language                      = {eng},
+   note                          = {},
+}
+"""
+    assert colrev.writer.bib.to_string(records_dict=records) == expected
+    # The records are not modified
+    assert records == records_copy
+
+    output = io.StringIO()
+    colrev.writer.bib.write_records(records_dict=records, file=output)
+    assert output.getvalue() == expected
+
+
+@pytest.mark.slow
+def test_to_string_benchmark(tmp_path: Path) -> None:
+    """Benchmark the bib writer (100k records)"""
+
+    records = _get_records(100000)
+
+    start = time.time()
+    bibtex_str = colrev.writer.bib.to_string(records_dict=records)
+    to_string_duration = time.time() - start
+
+    start = time.time()
+    colrev.writer.bib.write_file(records_dict=records, filename=tmp_path / "test.bib")
+    write_file_duration = time.time() - start
+
+    print(
+        f"to_string: {to_string_duration:.2f}s, write_file: {write_file_duration:.2f}s"
+    )
+    assert (tmp_path / "test.bib").read_text(encoding="utf-8") == bibtex_str
+    assert to_string_duration < 10
@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+"""Test the pubmed SearchSource"""
+import itertools
+from pathlib import Path
+
+import pytest
+import requests_mock
+
+import colrev.ops.prep
+import colrev.packages.pubmed.src.pubmed
+import colrev.record.record
+from colrev.constants import Fields
+from colrev.constants import SearchType
+
+# pylint: disable=line-too-long
+# pylint: disable=protected-access
+# flake8: noqa: E501
+
+EFETCH_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
+
+
+def _article(pubmed_id: str, title: str, doi: str) -> str:
+    return f"""<PubmedArticle><MedlineCitation><PMID>{pubmed_id}</PMID><Article>
+<Journal><JournalIssue><Volume>12</Volume><Issue>3</Issue><PubDate><Year>2020</Year></PubDate></JournalIssue><ISOAbbreviation>J Test</ISOAbbreviation></Journal>
+<ArticleTitle>{title}</ArticleTitle>
+<AuthorList><Author><LastName>Doe</LastName><ForeName>John</ForeName></Author><Author><LastName>Roe</LastName><ForeName>Jane</ForeName></Author></AuthorList>
+</Article></MedlineCitation>
+<PubmedData><ArticleIdList><ArticleId IdType="pubmed">{pubmed_id}</ArticleId><ArticleId IdType="doi">{doi}</ArticleId></ArticleIdList></PubmedData></PubmedArticle>"""
+
+
+EFETCH_XML = (
+    '<?xml version="1.0" ?><PubmedArticleSet>'
+    + _article("90000001", "A first test title.", "10.1/abc")
+    + _article("90000002", "[A second test title]", "10.2/xyz")
+    + "</PubmedArticleSet>"
+)
+
+
+@pytest.fixture(scope="package", name="pubmed_search_source")
+def fixture_pubmed_search_source(
+    prep_operation: colrev.ops.prep.Prep,
+) -> colrev.packages.pubmed.src.pubmed.PubMedSearchSource:
+    """Fixture for pubmed SearchSource"""
+    settings = {
+        "endpoint": "colrev.pubmed",
+        "filename": Path("data/search/pubmed.bib"),
+        "search_type": SearchType.API,
+        "search_parameters": {"query": "test"},
+        "comment": "",
+    }
+    return colrev.packages.pubmed.src.pubmed.PubMedSearchSource(
+        source_operation=prep_operation, settings=settings
+    )
+
+
+def test_pubmed_query_ids(
+    pubmed_search_source: colrev.packages.pubmed.src.pubmed.PubMedSearchSource,
+) -> None:
+    """Test the batched efetch retrieval"""
+
+    session = pubmed_search_source.review_manager.get_cached_session()
+    with session.cache_disabled(), requests_mock.Mocker() as req_mock:
+        req_mock.get(EFETCH_URL, text=EFETCH_XML)
+        retrieved_records = pubmed_search_source._pubmed_query_ids(
+            pubmed_ids=["90000001", "90000002", "90000003"]
+        )
+
+        # One request for all ids
+        assert req_mock.call_count == 1
+        assert req_mock.last_request.qs["id"] == ["90000001,90000002,90000003"]
+
+    assert list(retrieved_records) == ["90000001", "90000002"]
+    assert retrieved_records["90000001"] == {
+        Fields.ENTRYTYPE: "article",
+        Fields.TITLE: "A first test title",
+        Fields.AUTHOR: "Doe, John and Roe, Jane",
+        Fields.JOURNAL: "J Test",
+        Fields.VOLUME: "12",
+        Fields.NUMBER: "3",
+        Fields.YEAR: "2020",
+        "pubmedid": "90000001",
+        Fields.DOI: "10.1/ABC",
+    }
+    assert retrieved_records["90000002"][Fields.TITLE] == "A second test title"
+
+
+def test_pubmed_prefetch_records(
+    pubmed_search_source: colrev.packages.pubmed.src.pubmed.PubMedSearchSource,
+) -> None:
+    """Prefetched records are linked without additional requests"""
+
+    records = [
+        colrev.record.record.Record(
+            {
+                Fields.ID: f"r{pubmed_id}",
+                Fields.PUBMED_ID: pubmed_id,
+                "pubmedid": pubmed_id,
+            }
+        )
+        for pubmed_id in ["90000001", "90000002"]
+    ]
+
+    session = pubmed_search_source.review_manager.get_cached_session()
+    with session.cache_disabled(), requests_mock.Mocker() as req_mock:
+        req_mock.get(EFETCH_URL, text=EFETCH_XML)
+        pubmed_search_source.prefetch_records(records=records)
+        assert req_mock.call_count == 1
+
+        retrieved_record = pubmed_search_source._pubmed_query_id(pubmed_id="90000002")
+        assert retrieved_record[Fields.TITLE] == "A second test title"
+        assert req_mock.call_count == 1
+
+
+def test_pubmed_query_return(
+    pubmed_search_source: colrev.packages.pubmed.src.pubmed.PubMedSearchSource,
+) -> None:
+    """The ids of a search page are retrieved with one efetch request"""
+
+    search_page = (
+        "<html><head>"
+        '<meta name="log_displayeduids" content="90000001,90000002">'
+        "</head><body></body></html>"
+    )
+    session = pubmed_search_source.review_manager.get_cached_session()
+    with session.cache_disabled(), requests_mock.Mocker() as req_mock:
+        req_mock.get("https://pubmed.ncbi.nlm.nih.gov/?term=test", text=search_page)
+        req_mock.get(EFETCH_URL, text=EFETCH_XML)
+
+        query_return = pubmed_search_source._get_pubmed_query_return()
+        record_dicts = list(itertools.islice(query_return, 2))
+        query_return.close()
+
+        efetch_requests = [
+            r for r in req_mock.request_history if r.url.startswith(EFETCH_URL)
+        ]
+        assert len(efetch_requests) == 1
+
+    assert [r["pubmedid"] for r in record_dicts] == ["90000001", "90000002"]